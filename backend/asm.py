@@ -1,8 +1,15 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Iterable, Optional, Union
+
 from backend.dataflow.cfg import CFG
 from backend.dataflow.cfgbuilder import CFGBuilder
 from backend.dataflow.livenessanalyzer import LivenessAnalyzer
 from backend.reg.bruteregalloc import BruteRegAlloc
 from backend.riscv.riscvasmemitter import RiscvAsmEmitter
+from utils.riscv import Riscv
+from utils.tac.tacfunc import TACFunc
 from utils.tac.tacprog import TACProg
 
 """
@@ -16,13 +23,61 @@ class Asm:
         self.regAlloc = regAlloc
 
     def transform(self, prog: TACProg):
-        analyzer = LivenessAnalyzer()
-
         for func in prog.funcs:
-            pair = self.emitter.selectInstr(func)
-            builder = CFGBuilder()
-            cfg: CFG = builder.buildFrom(pair[0])
-            analyzer.accept(cfg)
-            self.regAlloc.accept(cfg, pair[1])
+            self.transformFunc(func)
 
         return self.emitter.emitEnd()
+
+    # generate the asm code for the functions and print it in the order of `funcs`
+    # an item of `funcs` may also be a string, i.e. the code of a function which is already known (e.g. cached)
+    # with `jobs` > 1, the functions are generated by a pool of worker processes
+    # `onGenerated` is called with every function generated along with its code
+    def transformFuncs(
+        self,
+        funcs: Iterable[Union[TACFunc, str]],
+        jobs: int = 1,
+        onGenerated: Optional[Callable[[TACFunc, str], None]] = None,
+    ) -> None:
+        pending: deque[tuple[Optional[TACFunc], Union[Future, str]]] = deque()
+
+        def printNext() -> None:
+            func, result = pending.popleft()
+            code = result if isinstance(result, str) else result.result()
+            if func is not None and onGenerated is not None:
+                onGenerated(func, code)
+            self.printFunc(code)
+
+        with ProcessPoolExecutor(jobs) if jobs > 1 else nullcontext() as pool:
+            for func in funcs:
+                if isinstance(func, str):
+                    pending.append((None, func))
+                elif pool is None:
+                    pending.append((func, _transformFunc(func)))
+                else:
+                    pending.append((func, pool.submit(_transformFunc, func)))
+                # bound the number of functions in flight, so that memory does not grow with the program
+                if len(pending) >= 2 * jobs:
+                    printNext()
+            while pending:
+                printNext()
+
+    def printFunc(self, code: str) -> None:
+        self.emitter.printer.printCode(code)
+        self.emitter.printer.flush()
+
+    # generate the asm code for a single function
+    # nothing of the function is kept afterwards except the code in the printer
+    def transformFunc(self, func: TACFunc) -> None:
+        pair = self.emitter.selectInstr(func)
+        builder = CFGBuilder()
+        cfg: CFG = builder.buildFrom(pair[0])
+        LivenessAnalyzer().accept(cfg)
+        self.regAlloc.accept(cfg, pair[1])
+
+
+# entry of a backend worker process: generate the asm code for a single function
+# every register allocation state is reset per function, so that the result does not depend on the worker
+def _transformFunc(func: TACFunc) -> str:
+    emitter = RiscvAsmEmitter(Riscv.AllocatableRegs, Riscv.CallerSaved)
+    Asm(emitter, BruteRegAlloc(emitter)).transformFunc(func)
+    return emitter.emitEnd()
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Optional, TextIO, Union
 
 from utils.asmcodeprinter import AsmCodePrinter
+from utils.objcodeprinter import ObjCodePrinter
 from utils.tac.reg import Reg
 from utils.tac.tacfunc import TACFunc
 
@@ -9,7 +11,8 @@ from .subroutineinfo import SubroutineInfo
 """
 AsmEmitter: emit asm code
 
-        printer: use it to output the asm code
+        printer: use it to output the asm code, which writes to `output` (if given) after each function,
+                 or an ObjCodePrinter (if given) which encodes the code into an object file
 allocatableRegs: all the regs that can used in reg alloc
  callerSaveRegs: all the caller save regs that used in reg alloc
 
@@ -18,12 +21,21 @@ allocatableRegs: all the regs that can used in reg alloc
 """
 
 
+CodePrinter = Union[AsmCodePrinter, ObjCodePrinter]
+
+
 #! RISC-V 汇编代码生成器
 class AsmEmitter(ABC):
-    def __init__(self, allocatableRegs: list[Reg], callerSaveRegs: list[Reg]) -> None:
+    def __init__(
+        self,
+        allocatableRegs: list[Reg],
+        callerSaveRegs: list[Reg],
+        output: Optional[TextIO] = None,
+        printer: Optional[CodePrinter] = None,
+    ) -> None:
         self.allocatableRegs = allocatableRegs
         self.callerSaveRegs = callerSaveRegs
-        self.printer = AsmCodePrinter()
+        self.printer = printer if printer is not None else AsmCodePrinter(output)
 
     @abstractmethod
     def selectInstr(self, func: TACFunc) -> tuple[list[str], SubroutineInfo]:
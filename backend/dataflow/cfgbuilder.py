@@ -11,6 +11,13 @@ CFGBuilder: from the sequence of instrs to build a control flow graph
 
 
 class CFGBuilder:
+    # the kinds of instrs which end a basic block, and the kinds of the blocks they end
+    END_KINDS = {
+        InstrKind.JMP: BlockKind.END_BY_JUMP,
+        InstrKind.COND_JMP: BlockKind.END_BY_COND_JUMP,
+        InstrKind.RET: BlockKind.END_BY_RETURN,
+    }
+
     def __init__(self) -> None:
         self.bbs: list[BasicBlock] = []
         self.buf: list[Loc] = []
@@ -28,15 +35,9 @@ class CFGBuilder:
                     self.currentBBLabel = item.label
             else:
                 self.buf.append(Loc(item))
-                if not item.isSequential():
-                    if item.kind is InstrKind.JMP:
-                        kind = BlockKind.END_BY_JUMP
-                    elif item.kind is InstrKind.COND_JMP:
-                        kind = BlockKind.END_BY_COND_JUMP
-                    elif item.kind is InstrKind.RET:
-                        kind = BlockKind.END_BY_RETURN
-                    else:
-                        kind = None
+                #! PARAM 与 CALL 不结束基本块, 调用所破坏的 caller-saved 寄存器由寄存器分配处理
+                kind = self.END_KINDS.get(item.kind)
+                if kind is not None:
                     bb = BasicBlock(kind, len(self.bbs), self.currentBBLabel, self.buf)
                     self.save(bb)
 
@@ -57,11 +58,11 @@ class CFGBuilder:
                 if self.labelsToBBs.get(bb.getLastInstr().label) is None:
                     raise NullPointerException
                 edges.append((bb.id, self.labelsToBBs.get(bb.getLastInstr().label)))
-                if now < len(self.bbs) - 1:
+                if now < len(self.bbs):
                     edges.append((bb.id, bb.id + 1))
             elif bb.kind is BlockKind.END_BY_RETURN:
                 pass
-            #! 对于 SEQ, PARAM 和 CALL, 会自动跳转到下一个 BB
+            #! 对于 CONTINUOUS, 会自动跳转到下一个 BB
             else:
                 if now < len(self.bbs):
                     edges.append((bb.id, bb.id + 1))
@@ -21,16 +21,13 @@ class LivenessAnalyzer:
         changed = True
         while changed:
             changed = False
-            for bb in graph.nodes:
+            # liveness flows backward, so visiting the blocks in reverse order converges in fewer rounds
+            for bb in reversed(graph.nodes):
                 for next in graph.getSucc(bb.id):
                     bb.liveOut.update(graph.getBlock(next).liveIn)
 
-                liveOut = bb.liveOut.copy()
-                for v in bb.define:
-                    liveOut.discard(v)
-
                 before = len(bb.liveIn)
-                bb.liveIn.update(liveOut)
+                bb.liveIn.update(bb.liveOut - bb.define)
                 after = len(bb.liveIn)
 
                 if before != after:
@@ -1,4 +1,7 @@
 import random
+from collections import Counter
+from functools import reduce
+from typing import Optional, Sequence
 
 from backend.dataflow.basicblock import BasicBlock, BlockKind
 from backend.dataflow.cfg import CFG
@@ -17,6 +20,46 @@ from utils.tac.tacinstr import TACInstr
 BruteRegAlloc: one kind of RegAlloc
 
 bindings: map from temp.index to Reg
+regTemps: map from reg.id to the Temp it holds (None if the register is free)
+usedRegs: the registers which have been allocated in the current function
+functionParams: the arguments (of the PARAMs) of the pending call
+    dirty: the temps (bound to registers) whose values differ from the ones in their stack slots,
+           only they are written back at the end of a basic block, at a spill or at a call
+exitBindings: map from the id of an allocated basic block to the bindings (of the temps live out of it) at its end,
+              with whether each one is dirty
+    crossing: map from the temps whose current values will be live across later calls in the current basic block
+              to the number of those calls, such temps are preferably allocated to callee-saved registers
+    stats: counters of the code generated (e.g. the stores written and avoided), summed over functions,
+           and the frame size and the number of stack slots of each function
+
+PARAM and CALL don't end a basic block, so values stay in registers across the argument setup;
+at a call, the values live after it are written back from the registers it clobbers (the caller-saved ones),
+and are loaded again only when they are used next
+
+the PARAMs of a call come right before it, and are only recorded; at the call the arguments are put into
+the argument registers at once, as a parallel move (see moveParams), so that an argument register holding
+another argument (e.g. when the arguments are permuted) is read before it is overwritten, without a spill
+
+a block starts with the bindings all its predecessors agree on at their ends (e.g. the branches of an if
+start with the registers of the condition block), and a block with a predecessor not yet allocated
+(e.g. a loop header) starts with no bindings; so the live values are written back at the end of a block
+only if they are live into a successor with other predecessors (or allocated before it), see homedLiveOut,
+and a dirty value is carried into a successor which has the block as its only predecessor
+
+the arguments passed by registers start in them as dirty values, so they are stored only when needed,
+and a leaf function without loops and merge points doesn't store them at all;
+the arguments passed by stack have the slots they are passed in as their stack slots
+
+the CalleeSaved regs (and RA) are saved and restored only on the paths using them (shrink-wrapping):
+they are saved at the start of the nearest block dominating all the blocks using them, and restored at the
+returns after it, provided that the block is not in a loop and dominates those returns (see shrinkWrap);
+e.g. the base case of a recursive function returns without saving anything
+
+a temp is written to and read from its stack slot only where it is live, so temps whose live ranges
+(see liveRanges) are disjoint can share a stack slot, which is up to the SubroutineEmitter
+
+the allocation state is kept here rather than on the (global) Riscv.* Reg objects,
+so that several allocators can work at the same time
 
 we don't need to take care of GlobalTemp here
 because we can remove all the GlobalTemp in selectInstr process
@@ -30,75 +73,297 @@ because we can remove all the GlobalTemp in selectInstr process
 """
 
 class BruteRegAlloc(RegAlloc):
-    def __init__(self, emitter: RiscvAsmEmitter) -> None:
+    def __init__(self, emitter: RiscvAsmEmitter, stats: Optional[Counter] = None) -> None:
         super().__init__(emitter)
         self.bindings = {}
+        self.regTemps: list[Optional[Temp]] = [None] * Riscv.NUM_REGS
+        self.usedRegs: set[Reg] = set()
+        self.dirty: set[int] = set()
+        self.exitBindings: dict[int, dict[int, tuple[Temp, Reg]]] = {}
+        self.crossing: dict[int, int] = {}
+        # the registers used in each basic block, and the positions of its start and of its return (if any),
+        # for shrink-wrapping
+        self.blockRegs: dict[int, set[Reg]] = {}
+        self.blockStarts: dict[int, int] = {}
+        self.returnPoints: dict[int, int] = {}
+        self.calleeSavedRegs = [reg for reg in emitter.allocatableRegs if reg not in emitter.callerSaveRegs]
+        self.callerSavedRegs = [reg for reg in emitter.allocatableRegs if reg in emitter.callerSaveRegs]
+        self.stats = stats if stats is not None else Counter()
         self.maxNumParams = 8
-        for reg in emitter.allocatableRegs:
-            # reg.used == True 表示寄存器曾被分配, 包含一个数值
-            reg.used = False
 
     def accept(self, graph: CFG, info: SubroutineInfo) -> None:
-        self.numArgs = info.numArgs
         self.functionParams = []
-        self.callerSavedRegs = {}
+        #! 寄存器状态与溢出时的随机选择只取决于当前函数, 保证各函数可以独立 (并行) 分配
+        self.random = random.Random(info.funcLabel.name)
+        self.bindings.clear()
+        self.dirty.clear()
+        self.exitBindings = {}
+        self.regTemps = [None] * Riscv.NUM_REGS
+        # usedRegs 包含曾被分配 (包含一个数值) 的寄存器
+        self.usedRegs = set()
+        self.blockRegs = {}
+        self.blockStarts = {}
+        self.returnPoints = {}
+        info.liveRanges = self.liveRanges(graph)
         subEmitter = self.emitter.emitSubroutine(info)
 
-        # 为寄存器参数分配寄存器
-        for index in range(min(self.numArgs, self.maxNumParams)):
-            self.bind(Temp(index), Riscv.ArgRegs[index])
-            subEmitter.emitStoreToStack(Riscv.ArgRegs[index])
+        # 寄存器参数留在寄存器中, 尚未保存到栈上
+        argBindings = {
+            temp.index: (temp, Riscv.ArgRegs[index], True)
+            for (index, temp) in enumerate(info.argTemps[: self.maxNumParams])
+        }
+        #! 入口基本块有前驱时, 它不继承参数所在的寄存器, 参数只能在入口处保存
+        if graph.getInDegree(0) > 0:
+            for temp, reg, _ in argBindings.values():
+                if temp.index in graph.getBlock(0).liveIn:
+                    subEmitter.emitStoreToStack(reg, temp)
+            argBindings = {}
 
         for (index, bb) in enumerate(graph.iterator()):
             if bb.label is not None:
                 subEmitter.emitLabel(bb.label)
             if graph.reachable(index):
-                self.localAlloc(bb, subEmitter)
-        subEmitter.emitEnd()
+                self.localAlloc(
+                    bb, subEmitter, self.entryBindings(graph, bb, argBindings), self.homedLiveOut(graph, bb)
+                )
+        subEmitter.emitEnd(self.usedRegs, *self.shrinkWrap(graph))
+
+        name = info.funcLabel.name
+        self.stats["frame size of " + name] = subEmitter.frameSize
+        self.stats["stack slots of " + name] = subEmitter.numSlots
+        self.stats["stack slots"] += subEmitter.numSlots
+        self.stats["spilled temps"] += subEmitter.numSpilled
+
+    # the live range of each temp: the positions (of the locs, in the order of the code) from the first one
+    # to the last one where it may be live, i.e. the whole basic blocks it is live into or out of,
+    # and from the first to the last loc using or defining it in the other basic blocks
+    def liveRanges(self, graph: CFG) -> dict[int, tuple[int, int]]:
+        first = {}
+        last = {}
+        position = 0
+        for bb in graph.iterator():
+            boundary = bb.liveIn | bb.liveOut
+            for tempindex in boundary:
+                first.setdefault(tempindex, position)
+            for loc in bb.locs:
+                for temp in (*loc.instr.srcs, *loc.instr.dsts):
+                    if not isinstance(temp, Reg):
+                        first.setdefault(temp.index, position)
+                        last[temp.index] = position
+                position += 1
+            for tempindex in boundary:
+                last[tempindex] = position
+            position += 1
+        return {tempindex: (first[tempindex], last[tempindex]) for tempindex in first}
+
+    # the bindings a basic block starts with: those of the temps live into it, on which all its
+    # (reachable) predecessors agree at their ends, the entry block being preceded by the function entry
+    def entryBindings(self, graph: CFG, bb: BasicBlock, argBindings: dict[int, tuple[Temp, Reg, bool]]):
+        states = [self.exitBindings.get(pred) for pred in graph.getPrev(bb.id) if graph.reachable(pred)]
+        if bb.id == 0:
+            states.append(argBindings)
+        #! 有前驱尚未分配 (如循环的回边) 时, 无法得知其结束时的寄存器状态
+        if not states or None in states:
+            return {}
+        bindings = {}
+        for tempindex, (temp, reg, dirty) in states[0].items():
+            others = [state.get(tempindex) for state in states[1:]]
+            if tempindex in bb.liveIn and all(other is not None and other[1] is reg for other in others):
+                bindings[tempindex] = (temp, reg, dirty or any(other[2] for other in others))
+        return bindings
+
+    # the temps live out of a basic block which have to be in their stack slots at its end:
+    # those live into a successor which doesn't start with the bindings of the block only
+    def homedLiveOut(self, graph: CFG, bb: BasicBlock) -> set[int]:
+        homed = set()
+        for succ in graph.getSucc(bb.id):
+            if succ <= bb.id or any(pred != bb.id and graph.reachable(pred) for pred in graph.getPrev(succ)):
+                homed |= graph.getBlock(succ).liveIn
+        return homed
+
+    # where to save and restore the CalleeSaved regs and RA (see SubroutineEmitter.emitEnd):
+    # the start of the nearest block dominating all the blocks using them, and the returns reachable from it,
+    # or the prologue and the epilogue if that block is the entry block, is in a loop (the save would be repeated)
+    # or doesn't dominate some of those returns (the restore would be done without the save)
+    def shrinkWrap(self, graph: CFG) -> tuple[Optional[int], list[int]]:
+        wrapped = set(self.calleeSavedRegs) | {Riscv.RA}
+        users = [bbid for bbid, regs in self.blockRegs.items() if regs & wrapped]
+        if not users or 0 in users:
+            return None, []
+        idom, number = self.dominators(graph)
+        point = reduce(lambda a, b: self.commonDominator(idom, number, a, b), users)
+        after = set()
+        stack = list(graph.getSucc(point))
+        while stack:
+            bbid = stack.pop()
+            if bbid not in after:
+                after.add(bbid)
+                stack.extend(graph.getSucc(bbid))
+        if point == 0 or point in after:
+            return None, []
+        after.add(point)
+
+        restorePoints = []
+        for bbid in after:
+            if graph.getBlock(bbid).kind is BlockKind.END_BY_RETURN:
+                if self.commonDominator(idom, number, bbid, point) != point:
+                    return None, []
+                restorePoints.append(self.returnPoints[bbid])
+        self.stats["shrink-wrapped functions"] += 1
+        return self.blockStarts[point], restorePoints
+
+    # the immediate dominator of each reachable basic block (the entry block being its own), and the numbers
+    # of the blocks in postorder, computed as in "A Simple, Fast Dominance Algorithm" (Cooper et al.)
+    def dominators(self, graph: CFG) -> tuple[dict[int, int], dict[int, int]]:
+        order = []
+        visited = {0}
+        stack = [(0, iter(graph.getSucc(0)))]
+        while stack:
+            bbid, succs = stack[-1]
+            succ = next((succ for succ in succs if succ not in visited), None)
+            if succ is None:
+                stack.pop()
+                order.append(bbid)
+            else:
+                visited.add(succ)
+                stack.append((succ, iter(graph.getSucc(succ))))
+        number = {bbid: index for (index, bbid) in enumerate(order)}
+
+        idom = {0: 0}
+        changed = True
+        while changed:
+            changed = False
+            for bbid in reversed(order[:-1]):
+                preds = [pred for pred in graph.getPrev(bbid) if pred in idom]
+                new = reduce(lambda a, b: self.commonDominator(idom, number, a, b), preds)
+                if idom.get(bbid) != new:
+                    idom[bbid] = new
+                    changed = True
+        return idom, number
+
+    # the nearest block dominating both of two blocks, found by walking up the dominator tree from the one
+    # earlier in postorder (i.e. deeper in the tree)
+    def commonDominator(self, idom: dict[int, int], number: dict[int, int], a: int, b: int) -> int:
+        while a != b:
+            while number[a] < number[b]:
+                a = idom[a]
+            while number[b] < number[a]:
+                b = idom[b]
+        return a
 
     def bind(self, temp: Temp, reg: Reg):
-        reg.used = True
+        self.usedRegs.add(reg)
+        self.blockRegs[self.currentBlock].add(reg)
         self.bindings[temp.index] = reg
-        reg.occupied = True
-        reg.temp = temp
+        self.regTemps[reg.id] = temp
 
     def unbind(self, temp: Temp):
         if temp.index in self.bindings:
-            self.bindings[temp.index].occupied = False
-            self.bindings.pop(temp.index)
+            self.regTemps[self.bindings.pop(temp.index).id] = None
+        self.dirty.discard(temp.index)
+
+    # write the value of a temp back to its stack slot, unless it is already there
+    def writeBack(self, reg: Reg, temp: Temp, subEmitter: SubroutineEmitter):
+        if temp.index in self.dirty:
+            subEmitter.emitStoreToStack(reg, temp)
+            self.dirty.discard(temp.index)
+            self.stats["stores"] += 1
+        else:
+            self.stats["stores avoided"] += 1
 
     def callerParamCount(self):
         return len(self.functionParams)
 
-    def localAlloc(self, bb: BasicBlock, subEmitter: SubroutineEmitter):
+    # bindings: the bindings the block starts with (see entryBindings)
+    # homed: the temps to be written back at the end of the block (see homedLiveOut)
+    def localAlloc(
+        self,
+        bb: BasicBlock,
+        subEmitter: SubroutineEmitter,
+        bindings: dict[int, tuple[Temp, Reg, bool]],
+        homed: set[int],
+    ):
+        self.currentBlock = bb.id
+        self.blockRegs[bb.id] = set()
+        self.blockStarts[bb.id] = subEmitter.position()
         self.bindings.clear()
+        self.dirty.clear()
         for reg in self.emitter.allocatableRegs:
-            reg.occupied = False
+            self.regTemps[reg.id] = None
+        for temp, reg, dirty in bindings.values():
+            self.bind(temp, reg)
+            if dirty:
+                self.dirty.add(temp.index)
 
+        crossings = self.callCrossings(bb)
         # in step9, you may need to think about how to store callersave regs here
-        for loc in bb.allSeq():
-            subEmitter.emitComment(str(loc.instr))
+        for (index, loc) in enumerate(bb.allSeq()):
+            subEmitter.emitComment("{}", loc.instr)
 
+            self.crossing = crossings[index]
             self.allocForLoc(loc, subEmitter)
 
-        for tempindex in bb.liveOut:
+        for tempindex in homed:
             if tempindex in self.bindings:
-                subEmitter.emitStoreToStack(self.bindings.get(tempindex))
+                reg = self.bindings[tempindex]
+                self.writeBack(reg, self.regTemps[reg.id], subEmitter)
 
         if (not bb.isEmpty()) and (bb.kind is not BlockKind.CONTINUOUS):
+            if bb.kind is BlockKind.END_BY_RETURN:
+                self.returnPoints[bb.id] = subEmitter.position()
+            self.crossing = crossings[len(bb.locs) - 1]
             self.allocForLoc(bb.locs[len(bb.locs) - 1], subEmitter)
 
+        self.exitBindings[bb.id] = {
+            tempindex: (self.regTemps[reg.id], reg, tempindex in self.dirty)
+            for tempindex, reg in self.bindings.items()
+            if tempindex in bb.liveOut
+        }
+
+    # for each loc of a basic block, the temps whose values after it are live across later calls in the block,
+    # with the number of those calls
+    def callCrossings(self, bb: BasicBlock) -> list[dict[int, int]]:
+        crossings = []
+        crossing = {}
+        for loc in reversed(bb.locs):
+            if loc.instr.kind == InstrKind.CALL:
+                crossing = {tempindex: crossing.get(tempindex, 0) + 1 for tempindex in loc.liveOut}
+            crossings.append(crossing)
+            #! 被写入之前的值与之后的值无关
+            defined = [temp.index for temp in loc.instr.dsts if not isinstance(temp, Reg)]
+            if any(tempindex in crossing for tempindex in defined):
+                crossing = {tempindex: n for tempindex, n in crossing.items() if tempindex not in defined}
+        crossings.reverse()
+        return crossings
+
+    # the registers to try for a temp, in order
+    def candidateRegs(self, temp: Temp) -> list[Reg]:
+        crossed = self.crossing.get(temp.index, 0)
+        if crossed == 0:
+            return self.emitter.allocatableRegs
+        #! 跨越调用的 temp 优先使用已在序言中保存的 callee-saved 寄存器, 调用时不需要保存;
+        #! 新用一个 callee-saved 寄存器需要在序言和尾声中保存和恢复, 只有跨越多次调用时才划算
+        used = [reg for reg in self.calleeSavedRegs if reg in self.usedRegs]
+        unused = [reg for reg in self.calleeSavedRegs if reg not in self.usedRegs]
+        if crossed > 1:
+            return used + unused + self.callerSavedRegs
+        return used + self.callerSavedRegs + unused
+
     def allocForLoc(self, loc: Loc, subEmitter: SubroutineEmitter):
         instr = loc.instr
         srcRegs: list[Reg] = []
         dstRegs: list[Reg] = []
 
+        if instr.kind == InstrKind.PARAM:
+            self.allocForParam(instr)
+            return
+
         for i in range(len(instr.srcs)):
             temp = instr.srcs[i]
             if isinstance(temp, Reg):
                 srcRegs.append(temp)
             else:
-                srcRegs.append(self.allocRegFor(temp, True, loc.liveIn, subEmitter))
+                srcRegs.append(self.allocRegFor(temp, True, loc.liveIn, subEmitter, srcRegs))
 
         for i in range(len(instr.dsts)):
             temp = instr.dsts[i]
@@ -106,85 +371,103 @@ class BruteRegAlloc(RegAlloc):
                 dstRegs.append(temp)
             else:
                 dstRegs.append(self.allocRegFor(temp, False, loc.liveIn, subEmitter))
+                # 被写入的值与栈上的不再一致
+                self.dirty.add(temp.index)
 
-        if instr.kind == InstrKind.PARAM:
-            self.allocForParam(instr, srcRegs, subEmitter)
-        elif instr.kind == InstrKind.CALL:
-            self.allocForCall(instr, srcRegs, dstRegs, subEmitter)
+        if instr.kind == InstrKind.CALL:
+            self.allocForCall(instr, srcRegs, dstRegs, loc.liveOut, subEmitter)
         else:
             subEmitter.emitNative(instr.toNative(dstRegs, srcRegs))
 
-    def allocForParam(self, instr: TACInstr, srcRegs: list[Reg], subEmitter: SubroutineEmitter):
-        # 保存前八个参数到寄存器中
-        if self.callerParamCount() < self.maxNumParams:
-            reg = Riscv.ArgRegs[self.callerParamCount()]
-            # 将寄存器解绑, 稍后恢复
-            if reg.occupied:
-                subEmitter.emitStoreToStack(reg)
-                self.callerSavedRegs[reg] = reg.temp
-                self.unbind(reg.temp)
-            subEmitter.emitReg(reg, srcRegs[0])
+    #! 参数在调用时统一传递, 这里只记录, 不为其分配寄存器
+    def allocForParam(self, instr: TACInstr):
         self.functionParams.append(instr.srcs[0])
 
-    def allocForCall(self, instr: TACInstr, srcRegs: list[Reg], dstRegs: list[Reg], subEmitter: SubroutineEmitter):
-        # 调用前保存 caller-saved 寄存器
-        for reg in Riscv.CallerSaved:
-            if reg.occupied:
-                subEmitter.emitStoreToStack(reg)
-                self.callerSavedRegs[reg] = reg.temp
-                self.unbind(reg.temp)
-
-        # 保存多余的参数到栈中
-        if self.callerParamCount() > self.maxNumParams:
-            for (index, temp) in enumerate(self.functionParams[self.maxNumParams:][::-1]):
-                subEmitter.emitStoreParamToStack(temp, index)
-            subEmitter.emitNative(instr.toNative(dstRegs, srcRegs))
-            subEmitter.emitRestoreStackPointer(4 * (self.callerParamCount() - self.maxNumParams))
-        else:
-            subEmitter.emitNative(instr.toNative(dstRegs, srcRegs))
+    # live: the temps live after the call, only they need to be saved when their registers are clobbered
+    def allocForCall(
+        self, instr: TACInstr, srcRegs: list[Reg], dstRegs: list[Reg], live: set[int], subEmitter: SubroutineEmitter
+    ):
+        # 多余的参数直接从寄存器保存到栈帧底部的传参区域
+        # 此时其余参数仍在使用, 分配寄存器时不能覆盖
+        args = live | {temp.index for temp in self.functionParams}
+        for index in range(self.maxNumParams, self.callerParamCount()):
+            reg = self.allocRegFor(self.functionParams[index], True, args, subEmitter)
+            subEmitter.emitStoreParamToStack(reg, index)
+
+        # 调用前保存被调用破坏的 caller-saved 寄存器, 调用后不再使用的 temp 直接丢弃
+        # 保存的 temp 不在调用后立即恢复, 而是在下次使用时才从栈上加载
+        for reg in self.emitter.callerSaveRegs:
+            temp = self.regTemps[reg.id]
+            if temp is not None and temp.index in live:
+                self.writeBack(reg, temp, subEmitter)
+        self.moveParams(self.functionParams[: self.maxNumParams], subEmitter)
+        for reg in self.emitter.callerSaveRegs:
+            temp = self.regTemps[reg.id]
+            if temp is not None:
+                self.unbind(temp)
+
+        subEmitter.emitNative(instr.toNative(dstRegs, srcRegs))
+        self.blockRegs[self.currentBlock].add(Riscv.RA)
         self.functionParams = []
 
-        # 调用后恢复 caller-saved 寄存器
-        for reg, temp in self.callerSavedRegs.items():
-            # 返回值寄存器不需要恢复, 否则会覆盖
-            if reg != Riscv.A0:
-                self.bind(temp, reg)
-                subEmitter.emitLoadFromStack(reg, temp)
-        self.callerSavedRegs = {}
+    # put the arguments into the argument registers as a parallel move:
+    # a move is done only when its destination is not the source of another pending move,
+    # and a cycle of moves (e.g. swapping a0 and a1) is broken by moving a source to the scratch register;
+    # the arguments not in registers are loaded afterwards, as loading doesn't read any argument register
+    def moveParams(self, params: list[Temp], subEmitter: SubroutineEmitter):
+        moves: dict[Reg, Reg] = {}
+        loads: list[tuple[Reg, Temp]] = []
+        for (index, temp) in enumerate(params):
+            dst = Riscv.ArgRegs[index]
+            src = self.bindings.get(temp.index)
+            if src is None:
+                loads.append((dst, temp))
+            elif src != dst:
+                moves[dst] = src
+
+        while moves:
+            srcs = set(moves.values())
+            dst = next((dst for dst in moves if dst not in srcs), None)
+            if dst is not None:
+                subEmitter.emitReg(dst, moves.pop(dst))
+                continue
+            #! 剩下的赋值都在环中, 先把一个目标寄存器的值移到 SCRATCH, 环就断开了
+            dst = next(iter(moves))
+            subEmitter.emitReg(Riscv.SCRATCH, dst)
+            for other, src in moves.items():
+                if src == dst:
+                    moves[other] = Riscv.SCRATCH
+            self.stats["param cycles"] += 1
+
+        for dst, temp in loads:
+            subEmitter.emitLoadFromStack(dst, temp)
 
-    def allocRegFor(self, temp: Temp, isRead: bool, live: set[int], subEmitter: SubroutineEmitter):
+    # avoid: the registers holding the other operands of the instr, which must not be spilled
+    def allocRegFor(
+        self, temp: Temp, isRead: bool, live: set[int], subEmitter: SubroutineEmitter, avoid: Sequence[Reg] = ()
+    ):
         if temp.index in self.bindings:
             return self.bindings[temp.index]
 
-        for reg in self.emitter.allocatableRegs:
-            if (not reg.occupied) or (not reg.temp.index in live):
-                subEmitter.emitComment(
-                    "  allocate {} to {}  (read: {}):".format(
-                        str(temp), str(reg), str(isRead)
-                    )
-                )
-                if isRead:
-                    # 如果是存储在栈上的参数, 利用 FP 从栈中加载
-                    if (self.maxNumParams <= temp.index < self.numArgs):
-                        subEmitter.emitLoadParamFromStack(reg, temp.index)
-                    # 否则, 利用 SP 从栈中加载
-                    else:
-                        subEmitter.emitLoadFromStack(reg, temp)
-                if reg.occupied:
-                    self.unbind(reg.temp)
+        for reg in self.candidateRegs(temp):
+            occupant = self.regTemps[reg.id]
+            if (occupant is None) or (not occupant.index in live):
+                subEmitter.emitComment("  allocate {} to {}  (read: {}):", temp, reg, isRead)
+                if occupant is not None:
+                    self.unbind(occupant)
                 self.bind(temp, reg)
+                if isRead:
+                    subEmitter.emitLoadFromStack(reg, temp)
                 return reg
 
-        reg = self.emitter.allocatableRegs[
-            random.randint(0, len(self.emitter.allocatableRegs) - 1)
-        ]
-        subEmitter.emitStoreToStack(reg)
-        subEmitter.emitComment("  spill {} ({})".format(str(reg), str(reg.temp)))
-        self.unbind(reg.temp)
+        candidates = [reg for reg in self.emitter.allocatableRegs if reg not in avoid]
+        reg = candidates[self.random.randint(0, len(candidates) - 1)]
+        occupant = self.regTemps[reg.id]
+        self.writeBack(reg, occupant, subEmitter)
+        subEmitter.emitComment("  spill {} ({})", reg, occupant)
+        self.unbind(occupant)
         self.bind(temp, reg)
-        subEmitter.emitComment(
-            "  allocate {} to {} (read: {})".format(str(temp), str(reg), str(isRead))
-        )
+        subEmitter.emitComment("  allocate {} to {} (read: {})", temp, reg, isRead)
         if isRead:
             subEmitter.emitLoadFromStack(reg, temp)
         return reg
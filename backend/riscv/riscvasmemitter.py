@@ -1,10 +1,11 @@
-from typing import Sequence, Tuple
+import math
+from typing import Optional, Sequence, TextIO, Tuple
 
 from frontend.ast.tree import *
-from backend.asmemitter import AsmEmitter
+from backend.asmemitter import AsmEmitter, CodePrinter
 from utils.error import IllegalArgumentException
 from utils.label.label import Label, LabelKind
-from utils.riscv import Riscv, RvBinaryOp, RvUnaryOp
+from utils.riscv import Riscv, RvBinaryOp, RvUnaryOp, isImm12, splitImm
 from utils.tac.reg import Reg
 from utils.tac.tacfunc import TACFunc
 from utils.tac.tacinstr import *
@@ -24,13 +25,20 @@ class RiscvAsmEmitter(AsmEmitter):
         self,
         allocatableRegs: list[Reg],
         callerSaveRegs: list[Reg],
-        globalVars: dict[str, Declaration],
+        globalVars: Optional[dict[str, Declaration]] = None,
+        output: Optional[TextIO] = None,
+        printer: Optional[CodePrinter] = None,
     ) -> None:
-        super().__init__(allocatableRegs, callerSaveRegs)
+        super().__init__(allocatableRegs, callerSaveRegs, output, printer)
 
         #! the start of the asm code
-        #! the declaration of global var here
-        self.printer.println(".data")
+        #! left out if this emitter only generates code for functions (e.g. in a backend worker process)
+        if globalVars is not None:
+            self.emitHeader(globalVars)
+
+    #! the declaration of global var here
+    def emitHeader(self, globalVars: dict[str, Declaration]) -> None:
+        self.printer.printSection(".data")
         for symbol, decl in globalVars.items():
             if not decl.init_dim:
                 self.printer.printGlobalVar(symbol, decl.getattr("symbol").initValue)
@@ -38,21 +46,22 @@ class RiscvAsmEmitter(AsmEmitter):
                 self.printer.printGlobalInitArray(symbol, decl.getattr("symbol").initValue)
         self.printer.println("")
 
-        self.printer.println(".bss")
+        self.printer.printSection(".bss")
         for symbol, decl in globalVars.items():
             if decl.init_dim and not decl.init_expr:
                 self.printer.printGlobalArray(symbol, decl.getattr("symbol").type.size)
         self.printer.println("")
 
-        self.printer.println(".text")
-        self.printer.println(".global main")
+        self.printer.printSection(".text")
+        self.printer.printGlobal("main")
         self.printer.println("")
+        self.printer.flush()
 
     # transform tac instrs to RiscV instrs
     # collect some info which is saved in SubroutineInfo for SubroutineEmitter
     def selectInstr(self, func: TACFunc) -> tuple[list[str], SubroutineInfo]:
         #! Visitor 模式
-        info = SubroutineInfo(func.entry, func.numArgs, func.arrays)
+        info = SubroutineInfo(func.entry, func.numArgs, func.arrays, func.temps[:func.numArgs])
 
         selector: RiscvAsmEmitter.RiscvInstrSelector = (
             RiscvAsmEmitter.RiscvInstrSelector(func.entry, info)
@@ -68,7 +77,7 @@ class RiscvAsmEmitter(AsmEmitter):
     def emitSubroutine(self, info: SubroutineInfo):
         return RiscvSubroutineEmitter(self, info)
 
-    # return all the string stored in asmcodeprinter
+    # return all the string stored in asmcodeprinter (empty if it has been written to the output)
     def emitEnd(self):
         return self.printer.close()
 
@@ -78,6 +87,8 @@ class RiscvAsmEmitter(AsmEmitter):
             self.entry = entry
             self.info = info
             self.seq = []
+            # the number of params of the pending call
+            self.numParams = 0
 
         def visitOther(self, instr: TACInstr) -> None:
             raise NotImplementedError("RiscvInstrSelector visit{} not implemented".format(type(instr).__name__))
@@ -95,8 +106,14 @@ class RiscvAsmEmitter(AsmEmitter):
         def visitLoadAddress(self, instr: LoadAddress) -> None:
             if instr.symbol.isGlobal:
                 self.seq.append(Riscv.LoadAddress(instr.symbol.name, instr.dsts[0]))
+            #! 局部数组位于栈帧顶部, 通过 FP 寻址, 偏移量超过 12 位时先加载到目标寄存器
             else:
-                self.seq.append(Riscv.ImmAdd(instr.dsts[0], Riscv.SP, self.info.offsets[instr.symbol.name]))
+                offset = self.info.offsets[instr.symbol.name] - self.info.size
+                if isImm12(offset):
+                    self.seq.append(Riscv.ImmAdd(instr.dsts[0], Riscv.FP, offset))
+                else:
+                    self.seq.append(Riscv.LoadImm(instr.dsts[0], offset))
+                    self.seq.append(Riscv.Binary(RvBinaryOp.ADD, instr.dsts[0], Riscv.FP, instr.dsts[0]))
 
         def visitLoadIntLiteral(self, instr: LoadIntLiteral) -> None:
             self.seq.append(Riscv.LoadIntLiteral(instr.dsts[0], instr.srcs[0], instr.offset)) 
@@ -109,8 +126,12 @@ class RiscvAsmEmitter(AsmEmitter):
 
         def visitParam(self, instr: Param) -> None:
             self.seq.append(Riscv.Param(instr.param))
+            self.numParams += 1
 
         def visitCall(self, instr: Call) -> None:
+            self.info.maxCallArgs = max(self.info.maxCallArgs, self.numParams)
+            self.info.isLeaf = False
+            self.numParams = 0
             self.seq.append(Riscv.Call(instr.label))
             self.seq.append(Riscv.Move(instr.param, Riscv.A0))
 
@@ -126,6 +147,8 @@ class RiscvAsmEmitter(AsmEmitter):
             self.seq.append(Riscv.Unary(op, instr.dst, instr.operand))
 
         def visitBinary(self, instr: Binary) -> None:
+            #! TACGen 把 && 和 || 翻译为短路跳转, 不再生成 LOR/LAND;
+            #! 但二进制 TAC 格式 (按 TacBinaryOp 编号) 仍可以包含它们, 经 --from-tac-bin 进入这里, 所以保留
             if instr.op == TacBinaryOp.LOR:
                 self.seq.append(Riscv.Binary(RvBinaryOp.OR, instr.dst, instr.lhs, instr.rhs))
                 self.seq.append(Riscv.Unary(RvUnaryOp.SNEZ, instr.dst, instr.dst))
@@ -161,13 +184,24 @@ class RiscvAsmEmitter(AsmEmitter):
                 self.seq.append(Riscv.Binary(op, instr.dst, instr.lhs, instr.rhs))
 
         def visitCondBranch(self, instr: CondBranch) -> None:
-            self.seq.append(Riscv.Branch(instr.cond, instr.label))
+            self.seq.append(Riscv.Branch(instr.op, instr.cond, instr.label))
         
         def visitBranch(self, instr: Branch) -> None:
             self.seq.append(Riscv.Jump(instr.target))
 
 """
 RiscvAsmEmitter: an SubroutineEmitter for RiscV
+
+stack frame layout (from low address to high address):
+    sp + 0              params passed by stack to the callees (the outgoing params, see emitStoreParamToStack)
+    sp + o              spilled temps, where o = outParamsSize
+    sp + o + 4 * n      the CalleeSaved regs used, then RA and FP if saved, where n = the number of stack slots
+    fp - info.size      local arrays
+    fp                  params passed by stack (the caller's frame), which are also their stack slots
+
+only what is used takes space in the frame: RA is saved only if the function makes calls, and FP is saved
+and set up only if it is used (to address local arrays and params passed by stack); a leaf function
+which doesn't spill or use CalleeSaved regs has no frame at all, and its prologue and epilogue are empty
 """
 
 #! RISC-V 汇编「子函数」生成器
@@ -175,8 +209,16 @@ class RiscvSubroutineEmitter(SubroutineEmitter):
     def __init__(self, emitter: RiscvAsmEmitter, info: SubroutineInfo) -> None:
         super().__init__(emitter, info)
         
-        # + 8 is for the RA and S0 reg 
-        self.nextLocalOffset = 4 * len(Riscv.CalleeSaved) + self.info.size + 8
+        #! 传参区域的大小取决于函数中参数最多的调用, 调用时不需要移动 SP
+        self.outParamsSize = 4 * max(info.maxCallArgs - 8, 0)
+
+        #! RA 只在有调用时保存, FP 只在用于寻址局部数组和栈上参数时保存并设置
+        self.savesRA = not info.isLeaf
+        self.usesFP = info.size > 0 or info.numArgs > 8
+
+        # the saved regs are placed above the spilled temps, as which CalleeSaved regs are used is known only at the end
+        # local arrays are placed on the top of the frame, so that spilled temps can be addressed by small offsets
+        self.nextLocalOffset = self.outParamsSize
 
         # the buf which stored all the NativeInstrs in this function
         self.buf: list[NativeInstr] = []
@@ -185,40 +227,66 @@ class RiscvSubroutineEmitter(SubroutineEmitter):
         # record where a temp is stored in the stack
         self.offsets = {}
 
+        # the offset of each stack slot, and the live ranges of the temps stored in it (see allocSlot)
+        self.slotOffsets: list[int] = []
+        self.slotRanges: list[list[tuple[int, int]]] = []
+
         self.printer.printLabel(info.funcLabel)
 
         # in step9, step11 you can compute the offset of local array and parameters here
 
-    def emitComment(self, comment: str) -> None:
-        # self.printer.printComment(comment)
+    # the comment is formatted (by `fmt.format(*args)`) only if it is printed
+    def emitComment(self, fmt: str, *args) -> None:
+        # self.printer.printComment(fmt.format(*args))
         pass
 
-    # store some param to stack
-    def emitStoreParamToStack(self, src: Temp, index: int) -> None:
-        self.buf.append(Riscv.SPAdd(-4))
-        self.buf.append(Riscv.NativeLoadWord(Riscv.T0, Riscv.SP, self.offsets[src.index] + 4 * index + 4))
-        self.buf.append(Riscv.NativeStoreWord(Riscv.T0, Riscv.SP, 0))
+    # whether a temp holds a param passed by stack, whose stack slot is where it is passed (see emitLoadParamFromStack)
+    def isStackParam(self, temp: Temp) -> bool:
+        return 8 <= temp.index < self.info.numArgs
+
+    # store the param of the given index (>= 8) of a call to stack, i.e. to the outgoing params
+    # which become the params passed by stack of the callee, as its FP is our SP
+    def emitStoreParamToStack(self, src: Reg, index: int) -> None:
+        self.buf.extend(self.storeWord(src, Riscv.SP, 4 * (index - 8)))
 
     # load some param from stack
     def emitLoadParamFromStack(self, dst: Reg, index: int) -> None:
-        self.buf.append(Riscv.NativeLoadWord(dst, Riscv.FP, 4 * (index - 8)))
+        self.buf.extend(self.loadWord(dst, Riscv.FP, 4 * (index - 8)))
 
     # store some temp to stack
     # usually happen when reaching the end of a basicblock
-    def emitStoreToStack(self, src: Reg) -> None:
-        if src.temp.index not in self.offsets:
-            self.offsets[src.temp.index] = self.nextLocalOffset
-            self.nextLocalOffset += 4
-        self.buf.append(Riscv.NativeStoreWord(src, Riscv.SP, self.offsets[src.temp.index]))
+    def emitStoreToStack(self, src: Reg, temp: Temp) -> None:
+        if self.isStackParam(temp):
+            self.buf.extend(self.storeWord(src, Riscv.FP, 4 * (temp.index - 8)))
+            return
+        if temp.index not in self.offsets:
+            self.offsets[temp.index] = self.allocSlot(temp)
+        self.buf.extend(self.storeWord(src, Riscv.SP, self.offsets[temp.index]))
+
+    #! 栈槽着色: 活跃区间不相交的 temp 共用一个栈槽, 取第一个可用的栈槽
+    # a temp without a live range (see SubroutineInfo.liveRanges) gets a slot of its own
+    def allocSlot(self, temp: Temp) -> int:
+        liveRanges = self.info.liveRanges or {}
+        first, last = liveRanges.get(temp.index, (0, math.inf))
+        for slot, ranges in enumerate(self.slotRanges):
+            if all(last < other[0] or other[1] < first for other in ranges):
+                ranges.append((first, last))
+                return self.slotOffsets[slot]
+        self.slotOffsets.append(self.nextLocalOffset)
+        self.slotRanges.append([(first, last)])
+        self.nextLocalOffset += 4
+        return self.slotOffsets[-1]
 
     # load some temp from stack
     # usually happen when using a temp which is stored to stack before
     #! in step9, you need to think about the fuction parameters here
     def emitLoadFromStack(self, dst: Reg, src: Temp):
-        if src.index not in self.offsets:
+        if self.isStackParam(src):
+            self.emitLoadParamFromStack(dst, src.index)
+        elif src.index not in self.offsets:
             raise IllegalArgumentException()
         else:
-            self.buf.append(Riscv.NativeLoadWord(dst, Riscv.SP, self.offsets[src.index]))
+            self.buf.extend(self.loadWord(dst, Riscv.SP, self.offsets[src.index]))
 
     #! add a NativeInstr to buf
     # when calling the fuction emitEnd, all the instr in buf will be transformed to RiscV code
@@ -231,22 +299,78 @@ class RiscvSubroutineEmitter(SubroutineEmitter):
     def emitReg(self, dst: Reg, src: Temp):
         self.buf.append(Riscv.Move(dst, src))
 
-    # restore stack after calling a function
-    def emitRestoreStackPointer(self, offset:int) -> None:
-        self.buf.append(Riscv.SPAdd(offset))
-
-    def emitEnd(self):
+    def position(self) -> int:
+        return len(self.buf)
+
+    # the following helpers take care of offsets which do not fit in a 12-bit immediate,
+    # these offsets are materialized by lui/addi into Riscv.SCRATCH first
+    def addImm(self, dst: Reg, src: Reg, value: int) -> list[NativeInstr]:
+        if isImm12(value):
+            return [Riscv.ImmAdd(dst, src, value)]
+        return [Riscv.LoadImm(Riscv.SCRATCH, value), Riscv.Binary(RvBinaryOp.ADD, dst, src, Riscv.SCRATCH)]
+
+    def loadWord(self, dst: Reg, base: Reg, offset: int) -> list[NativeInstr]:
+        if isImm12(offset):
+            return [Riscv.NativeLoadWord(dst, base, offset)]
+        hi, lo = splitImm(offset)
+        return [
+            Riscv.LoadUpperImm(Riscv.SCRATCH, hi),
+            Riscv.Binary(RvBinaryOp.ADD, Riscv.SCRATCH, Riscv.SCRATCH, base),
+            Riscv.NativeLoadWord(dst, Riscv.SCRATCH, lo),
+        ]
+
+    def storeWord(self, src: Reg, base: Reg, offset: int) -> list[NativeInstr]:
+        if isImm12(offset):
+            return [Riscv.NativeStoreWord(src, base, offset)]
+        hi, lo = splitImm(offset)
+        return [
+            Riscv.LoadUpperImm(Riscv.SCRATCH, hi),
+            Riscv.Binary(RvBinaryOp.ADD, Riscv.SCRATCH, Riscv.SCRATCH, base),
+            Riscv.NativeStoreWord(src, Riscv.SCRATCH, lo),
+        ]
+
+    # save (or restore) some regs to the saved regs area
+    def saveRegs(self, regs: list[Reg], savedOffset: int, restore: bool = False) -> list[NativeInstr]:
+        instrs = []
+        for i, reg in enumerate(regs):
+            instrs.extend((self.loadWord if restore else self.storeWord)(reg, Riscv.SP, savedOffset + 4 * i))
+        return instrs
+
+    # usedRegs: the registers allocated in this function, the CalleeSaved ones among them are saved and restored
+    #! shrink-wrapping: 给出 savePoint 时, CalleeSaved 寄存器和 RA 只在 savePoint 处保存, 在 restorePoints 处恢复,
+    #! 不经过 savePoint 的路径 (如递归的出口) 不需要保存它们; FP 和 SP 仍在序言和尾声中处理
+    def emitEnd(self, usedRegs: set[Reg], savePoint: Optional[int] = None, restorePoints: Sequence[int] = ()):
+        savedRegs = [reg for reg in Riscv.CalleeSaved if reg in usedRegs]
+        if self.savesRA:
+            savedRegs.append(Riscv.RA)
+        # the saved regs wrapped at savePoint and restorePoints, and those saved in the prologue, placed after them
+        wrappedRegs, frameRegs = (savedRegs, []) if savePoint is not None else ([], savedRegs)
+        if self.usesFP:
+            frameRegs = frameRegs + [Riscv.FP]
+        savedOffset = self.nextLocalOffset
+        frameOffset = savedOffset + 4 * len(wrappedRegs)
+        frameSize = frameOffset + 4 * len(frameRegs) + self.info.size
+        if wrappedRegs:
+            # inserted from the last position on, so that the positions before stay valid;
+            # at the same position the save is inserted last, so it comes before the restores
+            points = [(point, self.saveRegs(wrappedRegs, savedOffset, True)) for point in restorePoints]
+            points.append((savePoint, self.saveRegs(wrappedRegs, savedOffset)))
+            for point, instrs in sorted(points, key=lambda p: p[0], reverse=True):
+                self.buf[point:point] = instrs
+        self.frameSize = frameSize
+        self.numSlots = len(self.slotOffsets)
+        self.numSpilled = len(self.offsets)
         self.printer.printComment("start of prologue")
 
-        # store RA and CalleeSaved regs here
-        self.printer.printInstr(Riscv.SPAdd(-self.nextLocalOffset))
-        self.printer.printInstr(Riscv.NativeStoreWord(Riscv.RA, Riscv.SP, 4 * len(Riscv.CalleeSaved) + self.info.size))
-        self.printer.printInstr(Riscv.NativeStoreWord(Riscv.FP, Riscv.SP, 4 * len(Riscv.CalleeSaved) + self.info.size + 4))
-        self.printer.printInstr(Riscv.FPAdd(self.nextLocalOffset))
-
-        for i in range(len(Riscv.CalleeSaved)):
-            if Riscv.CalleeSaved[i].isUsed():
-                self.printer.printInstr(Riscv.NativeStoreWord(Riscv.CalleeSaved[i], Riscv.SP, 4 * i + self.info.size))
+        # store RA, FP and CalleeSaved regs here
+        if frameSize > 0:
+            for instr in self.addImm(Riscv.SP, Riscv.SP, -frameSize):
+                self.printer.printInstr(instr)
+        for instr in self.saveRegs(frameRegs, frameOffset):
+            self.printer.printInstr(instr)
+        if self.usesFP:
+            for instr in self.addImm(Riscv.FP, Riscv.SP, frameSize):
+                self.printer.printInstr(instr)
 
         self.printer.printComment("end of prologue")
         self.printer.println("")
@@ -263,16 +387,16 @@ class RiscvSubroutineEmitter(SubroutineEmitter):
         self.printer.printLabel(Label(LabelKind.TEMP, self.info.funcLabel.name + Riscv.EPILOGUE_SUFFIX))
         self.printer.printComment("start of epilogue")
 
-        self.printer.printInstr(Riscv.NativeLoadWord(Riscv.RA, Riscv.SP, 4 * len(Riscv.CalleeSaved) + self.info.size))
-        self.printer.printInstr(Riscv.NativeLoadWord(Riscv.FP, Riscv.SP, 4 * len(Riscv.CalleeSaved) + self.info.size + 4))
-
-        for i in range(len(Riscv.CalleeSaved)):
-            if Riscv.CalleeSaved[i].isUsed():
-                self.printer.printInstr(Riscv.NativeLoadWord(Riscv.CalleeSaved[i], Riscv.SP, 4 * i + self.info.size))
-
-        self.printer.printInstr(Riscv.SPAdd(self.nextLocalOffset))
+        for instr in self.saveRegs(frameRegs, frameOffset, True):
+            self.printer.printInstr(instr)
+        if frameSize > 0:
+            for instr in self.addImm(Riscv.SP, Riscv.SP, frameSize):
+                self.printer.printInstr(instr)
         self.printer.printComment("end of epilogue")
         self.printer.println("")
 
         self.printer.printInstr(Riscv.NativeReturn())
         self.printer.println("")
+
+        # the code of this function is complete, write it out
+        self.printer.flush()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Sequence
 
 from backend.subroutineinfo import SubroutineInfo
 from utils.label.label import Label
@@ -10,9 +11,13 @@ from .asmemitter import AsmEmitter
 """
 SubroutineEmitter: emit asm code for a fuction
 
-printer: the same as AsmEmitter, which we use to output the asm code
-   info: subroutineInfo for the function
+   printer: the same as AsmEmitter, which we use to output the asm code
+      info: subroutineInfo for the function
+ frameSize: the size of the stack frame (known after emitEnd, as the following ones)
+  numSlots: the number of stack slots for temps
+numSpilled: the number of temps stored in the stack slots
 
+position: the position of the next instr emitted in the function, to refer to in emitEnd
 emitEnd: output all the asm code for the function
 """
 
@@ -22,13 +27,16 @@ class SubroutineEmitter(ABC):
     def __init__(self, emitter: AsmEmitter, info: SubroutineInfo) -> None:
         self.info = info
         self.printer = emitter.printer
+        self.frameSize = 0
+        self.numSlots = 0
+        self.numSpilled = 0
 
     @abstractmethod
-    def emitComment(self, comment: str) -> None:
+    def emitComment(self, fmt: str, *args) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    def emitStoreParamToStack(self, src:Temp, index: int):
+    def emitStoreParamToStack(self, src: Reg, index: int):
         raise NotImplementedError
 
     @abstractmethod
@@ -36,7 +44,7 @@ class SubroutineEmitter(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def emitStoreToStack(self, src: Reg) -> None:
+    def emitStoreToStack(self, src: Reg, temp: Temp) -> None:
         raise NotImplementedError
 
     @abstractmethod
@@ -56,9 +64,11 @@ class SubroutineEmitter(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def emitRestoreStackPointer(self, offset: int):
+    def position(self) -> int:
         raise NotImplementedError
 
+    # savePoint, restorePoints: where the CalleeSaved regs (and RA) are saved and restored (see position),
+    # instead of in the prologue and the epilogue
     @abstractmethod
-    def emitEnd(self):
+    def emitEnd(self, usedRegs: set[Reg], savePoint: Optional[int] = None, restorePoints: Sequence[int] = ()):
         raise NotImplementedError
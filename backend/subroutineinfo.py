@@ -1,7 +1,8 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 from frontend.symbol.varsymbol import VarSymbol
 from utils.label.funclabel import FuncLabel
+from utils.tac.temp import Temp
 
 """
 SubroutineInfo: collect some info when selecting instr which will be used in SubroutineEmitter
@@ -9,12 +10,21 @@ SubroutineInfo: collect some info when selecting instr which will be used in Sub
 
 
 class SubroutineInfo:
-    def __init__(self, funcLabel: FuncLabel, numArgs: int, arrays: Dict[str, VarSymbol]) -> None:
+    def __init__(self, funcLabel: FuncLabel, numArgs: int, arrays: Dict[str, VarSymbol], argTemps: List[Temp]) -> None:
         self.funcLabel = funcLabel
         self.numArgs = numArgs
+        # the temps holding the arguments (the first temps of the function)
+        self.argTemps = argTemps
         self.arrays = arrays
         self.offsets: Dict[str, int] = {}
         self.size = 0
+        # the largest number of args passed by a call in the function (set when selecting instrs)
+        self.maxCallArgs = 0
+        # whether the function makes no calls (set when selecting instrs), so that RA is never overwritten
+        self.isLeaf = True
+        # the live range (the first and the last position) of each temp, set by the register allocator,
+        # temps with disjoint live ranges can share a stack slot
+        self.liveRanges: Optional[Dict[int, Tuple[int, int]]] = None
 
         for name, symbol in self.arrays.items():
             self.offsets[name] = self.size
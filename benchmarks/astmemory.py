@@ -0,0 +1,56 @@
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+"""
+astmemory: measure the memory taken by the AST of a large generated program (see genprogram) with tracemalloc
+
+    python3 -m benchmarks.astmemory [--funcs 2000] [--root DIR]
+
+--root measures the compiler in another directory, e.g. a `git worktree` of an older commit, to compare with;
+the program is parsed by the ply parser, which every version has
+"""
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="measure the memory taken by the AST")
+    parser.add_argument("--funcs", type=int, default=2000, help="the number of functions in the program")
+    parser.add_argument("--root", type=str, default=os.path.dirname(BENCHMARKS_DIR), help="the compiler to measure")
+    args = parser.parse_args()
+
+    sys.path.insert(0, BENCHMARKS_DIR)
+    from genprogram import generate
+
+    code = generate(args.funcs)
+    sys.path.insert(0, os.path.abspath(args.root))
+    os.chdir(args.root)
+    import frontend.ast.tree
+    from frontend.ast.node import Node
+    from frontend.lexer.ply_lexer import lexer as ply_lexer
+    from frontend.parser.ply_parser import parser as ply_parser
+
+    # build the parse tables before measuring
+    ply_parser.parse("int main() { return 0; }", lexer=ply_lexer)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    program = ply_parser.parse(code, lexer=ply_lexer)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    numNodes = 0
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        numNodes += 1
+        stack.extend(child for child in node if isinstance(child, Node))
+    print("{} nodes, {} bytes, {:.1f} bytes/node".format(numNodes, size, size / numNodes))
+
+
+if __name__ == "__main__":
+    main()
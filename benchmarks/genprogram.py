@@ -0,0 +1,36 @@
+import argparse
+import random
+
+"""
+genprogram: generate a large MiniDecaf program for the benchmarks,
+with `n` functions each using locals, arrays, loops, branches, short-circuit operators and calls
+"""
+
+
+def generate(n: int, seed: int = 1) -> str:
+    rand = random.Random(seed)
+    out = ["int g0 = 1;", "int garr[100];"]
+    for f in range(n):
+        out.append("int f{}(int a, int b, int c) {{".format(f))
+        out.append("    int x = a + b * 3; int y = c - a; int arr[8];")
+        out.append("    for (int i = 0; i < 8; i = i + 1) arr[i] = i * x + y;")
+        out.append("    if (x > y && y != 0 || a == b) { x = x + arr[3] % 7; } else { y = y * 2 - arr[5]; }")
+        out.append("    while (x > 100) x = x / 2;")
+        if f > 0:
+            out.append("    x = x + f{}(y % 10, x % 10, {}) % 11;".format(rand.randrange(f), f % 5))
+        out.append("    garr[a % 100] = x + y;")
+        out.append("    return (x * 7 + y) % 1000;")
+        out.append("}")
+    out.append("int main() { int s = 0;")
+    for f in range(0, n, max(1, n // 50)):
+        out.append("    s = (s + f{}({}, {}, {})) % 1000;".format(f, f % 7, f % 3, f % 11))
+    out.append("    return s % 256; }")
+    return "\n".join(out) + "\n"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="generate a large MiniDecaf program")
+    parser.add_argument("n", type=int, help="the number of functions")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    print(generate(args.n, args.seed), end="")
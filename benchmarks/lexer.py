@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+import time
+
+"""
+lexer: measure the tokens per second of the ply lexer and the table-driven lexer (--lexer table)
+on a large generated program (see genprogram), the best of a few runs each
+
+    python3 -m benchmarks.lexer [--funcs 20000] [--runs 3]
+"""
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(lexer, code: str, runs: int) -> tuple[int, float]:
+    best = float("inf")
+    for _ in range(runs):
+        lexer.input(code)
+        numTokens = 0
+        start = time.perf_counter()
+        while lexer.token() is not None:
+            numTokens += 1
+        best = min(best, time.perf_counter() - start)
+    return numTokens, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="measure the tokens per second of the lexers")
+    parser.add_argument("--funcs", type=int, default=20000, help="the number of functions in the program")
+    parser.add_argument("--runs", type=int, default=3, help="the number of runs of each lexer")
+    args = parser.parse_args()
+
+    sys.path.insert(0, BENCHMARKS_DIR)
+    from genprogram import generate
+
+    sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+    import frontend.ast.tree
+    from frontend.lexer import ply_lexer, table_lexer
+
+    code = generate(args.funcs)
+    print("input: {:.1f} MB".format(len(code) / 1e6))
+    for name, lexer in (("ply", ply_lexer), ("table", table_lexer)):
+        numTokens, seconds = measure(lexer, code, args.runs)
+        print("{:<6} {} tokens in {:.2f}s, {:.2f} M tokens/s".format(name, numTokens, seconds, numTokens / seconds / 1e6))
+
+
+if __name__ == "__main__":
+    main()
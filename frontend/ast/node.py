@@ -86,15 +86,26 @@ it's no need to make a enumeration for it.
 class Node(ABC):
     """
     Base class of all AST nodes.
+    All AST nodes declare `__slots__`, so that a node doesn't carry a `__dict__`.
     """
 
+    #! 常用的附加信息直接存放在 slot 中, 其余的放在按需创建的 `_attrs` 中
+    ATTRS = frozenset(("symbol", "type", "val", "addr", "slice"))
+
+    __slots__ = ("name", "symbol", "type", "val", "addr", "slice", "_attrs")
+
     def __init__(self, name: str) -> None:
         """Constructor.
         `name`: name of this kind of node. Used when represents the node by a string.
-        `_attrs`: used to store additional information on AST nodes.
+        `_attrs`: used to store additional information (other than those in `ATTRS`) on AST nodes.
         """
         self.name = name
-        self._attrs = dict[str, Any]()
+        self.symbol = None
+        self.type = None
+        self.val = None
+        self.addr = None
+        self.slice = None
+        self._attrs: Optional[dict[str, Any]] = None
 
     @abstractmethod
     def __len__(self) -> int:
@@ -119,13 +130,22 @@ class Node(ABC):
 
     def setattr(self, name: str, value: Any):
         """Set additional information on AST node."""
-        self._attrs[name] = value
+        if name in self.ATTRS:
+            object.__setattr__(self, name, value)
+        else:
+            if self._attrs is None:
+                self._attrs = {}
+            self._attrs[name] = value
 
     def getattr(self, name: str) -> Any:
         """
         Get additional information on AST node.
         Note that the default return value is `None` when the given name is not present.
         """
+        if name in self.ATTRS:
+            return object.__getattribute__(self, name)
+        if self._attrs is None:
+            return None
         return self._attrs.get(name, None) #! 默认返回 None
 
     def __iter__(self):
@@ -163,6 +183,8 @@ class NullType(Node):
     You can take `If` in `.tree` as an example.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("NULL")
 
@@ -6,7 +6,7 @@ Modify this file if you want to add a new AST node.
 
 from __future__ import annotations
 
-from typing import Any, Generic, Optional, TypeVar, Union, List
+from typing import Any, Generic, Iterator, Optional, TypeVar, Union, List
 
 from frontend.type import INT, DecafType
 from utils import T, U
@@ -30,6 +30,8 @@ class ListNode(Node, Generic[_T]):
     E.g. `Block` (sequence of statements).
     """
 
+    __slots__ = ("children",)
+
     def __init__(self, name: str, children: list[_T]) -> None:
         super().__init__(name)
         self.children = children
@@ -50,12 +52,25 @@ class Program(ListNode[Union["Function", "Declaration"]]):
     AST root. It should have only one children before step9.
     """
 
+    __slots__ = ("globalScope",)
+
     def __init__(self, *children: Union[Function, Declaration]) -> None:
         super().__init__("program", list(children))
 
     def functions(self) -> dict[str, Function]:
         return {func.ident.value: func for func in self if isinstance(func, Function)}
 
+    def takeFunctions(self) -> Iterator[Function]:
+        """
+        Iterate over the functions in order, removing them from the program.
+        A function can be released as soon as the caller is done with it.
+        """
+        funcs = [child for child in self.children if isinstance(child, Function)]
+        self.children = [child for child in self.children if not isinstance(child, Function)]
+        funcs.reverse()
+        while funcs:
+            yield funcs.pop()
+
     def globalVars(self) -> dict[str, int]:
         return {decl.ident.value: decl for decl in self if isinstance(decl, Declaration)}
 
@@ -74,6 +89,8 @@ class Function(Node):
     AST node that represents a function.
     """
 
+    __slots__ = ("ret_t", "ident", "params", "body", "arrays", "p_arrays")
+
     def __init__(
         self,
         ret_t: TypeLiteral,
@@ -109,6 +126,8 @@ class Parameter(Node):
     AST node that represents a parameter.
     """
 
+    __slots__ = ("var_t", "ident", "init_dim")
+
     def __init__(self, var_t: TypeLiteral, ident: Identifier, init_dim: Optional[list[IntLiteral]] = None) -> None:
         super().__init__("parameter")
         self.var_t = var_t
@@ -130,6 +149,8 @@ class ParameterList(ListNode["Parameter"]):
     AST node that represents parameters list for a function.
     """
 
+    __slots__ = ()
+
     def __init__(self, *children:Parameter) -> None:
         super().__init__('parameter_list',list(children))
 
@@ -143,6 +164,8 @@ class Statement(Node):
     Abstract type that represents a statement.
     """
 
+    __slots__ = ()
+
     def is_block(self) -> bool:
         """
         Determine if this type of statement is `Block`.
@@ -155,6 +178,8 @@ class Return(Statement):
     AST node of return statement.
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Expression) -> None:
         super().__init__("return")
         self.expr = expr
@@ -162,7 +187,7 @@ class Return(Statement):
     def __getitem__(self, key: Union[int, str]) -> Node:
         if isinstance(key, int):
             return (self.expr,)[key]
-        return self.__dict__[key]
+        return getattr(self, key)
 
     def __len__(self) -> int:
         return 1
@@ -176,6 +201,8 @@ class If(Statement):
     AST node of if statement.
     """
 
+    __slots__ = ("cond", "then", "otherwise")
+
     def __init__(
         self, cond: Expression, then: Statement, otherwise: Optional[Statement] = None
     ) -> None:
@@ -199,6 +226,8 @@ class While(Statement):
     AST node of while statement.
     """
 
+    __slots__ = ("cond", "body")
+
     def __init__(self, cond: Expression, body: Statement) -> None:
         super().__init__("while")
         self.cond = cond
@@ -219,6 +248,8 @@ class For(Statement):
     AST node of for statement.
     """
 
+    __slots__ = ("init", "cond", "update", "body")
+
     def __init__(
         self, init: Union["Expression", "Declaration"], cond: Expression, update: Expression, body: Statement
     ) -> None:
@@ -243,6 +274,8 @@ class Break(Statement):
     AST node of break statement.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("break")
 
@@ -264,6 +297,8 @@ class Continue(Statement):
     AST node of continue statement.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("continue")
 
@@ -285,6 +320,8 @@ class Block(Statement, ListNode[Union["Statement", "Declaration"]]):
     AST node of block "statement".
     """
 
+    __slots__ = ()
+
     def __init__(self, *children: Union[Statement, Declaration]) -> None:
         super().__init__("block", list(children))
 
@@ -300,6 +337,8 @@ class Declaration(Node):
     AST node of declaration.
     """
 
+    __slots__ = ("var_t", "ident", "init_expr", "init_dim")
+
     def __init__(
         self,
         var_t: TypeLiteral,
@@ -329,6 +368,8 @@ class Expression(Node):
     Abstract type that represents an evaluable expression.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
         self.type: Optional[DecafType] = None
@@ -339,6 +380,8 @@ class ExpressionList(ListNode["Expression"]):
     AST node that represents expression list for a function.
     """
 
+    __slots__ = ()
+
     def __init__(self, *children: Expression) -> None:
         super().__init__('expression_list',list(children))
 
@@ -352,6 +395,8 @@ class IndexExpr(Expression):
     AST node of index expression.
     """
 
+    __slots__ = ("base", "index")
+
     def __init__(self, base: Expression, index: Expression) -> None:
         super().__init__("index_expr")
         self.base = base
@@ -368,6 +413,8 @@ class IndexExpr(Expression):
 
 
 class InitList(Node):
+    __slots__ = ("init_list", "value")
+
     def __init__(self, init_list: List[IntLiteral]):
         super().__init__("init_list")
         self.init_list = init_list
@@ -388,6 +435,8 @@ class Call(Expression):
     AST node that represents a call function.
     """
 
+    __slots__ = ("ident", "args")
+
     def __init__(
         self,
         ident: Identifier,
@@ -416,6 +465,8 @@ class Unary(Expression):
     Note that the operation type (like negative) is not among its children.
     """
 
+    __slots__ = ("op", "operand")
+
     def __init__(self, op: UnaryOp, operand: Expression) -> None:
         super().__init__(f"unary({op.value})")
         self.op = op
@@ -443,6 +494,8 @@ class Binary(Expression):
     Note that the operation type (like plus or subtract) is not among its children.
     """
 
+    __slots__ = ("lhs", "op", "rhs")
+
     def __init__(self, op: BinaryOp, lhs: Expression, rhs: Expression) -> None:
         super().__init__(f"binary({op.value})")
         self.lhs = lhs
@@ -472,6 +525,8 @@ class Assignment(Binary):
     It's actually a kind of binary expression, but it'll make things easier if we use another accept method to handle it.
     """
 
+    __slots__ = ()
+
     def __init__(self, lhs: Identifier, rhs: Expression) -> None:
         super().__init__(BinaryOp.Assign, lhs, rhs)
 
@@ -484,6 +539,8 @@ class ConditionExpression(Expression):
     AST node of condition expression (`?:`).
     """
 
+    __slots__ = ("cond", "then", "otherwise")
+
     def __init__(
         self, cond: Expression, then: Expression, otherwise: Expression
     ) -> None:
@@ -495,7 +552,7 @@ class ConditionExpression(Expression):
     def __getitem__(self, key: Union[int, str]) -> Node:
         if isinstance(key, int):
             return (self.cond, self.then, self.otherwise)[key]
-        return self.__dict__[key]
+        return getattr(self, key)
 
     def __len__(self) -> int:
         return 3
@@ -516,6 +573,8 @@ class Identifier(Expression):
     AST node of identifier "expression".
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str) -> None:
         super().__init__("identifier")
         self.value = value
@@ -541,6 +600,8 @@ class IntLiteral(Expression):
     AST node of int literal like `0`.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Union[int, str]) -> None:
         super().__init__("int_literal")
         self.value = int(value)
@@ -566,6 +627,8 @@ class TypeLiteral(Node):
     Abstract node type that represents a type literal like `int`.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, _type: DecafType) -> None:
         super().__init__(name)
         self.type = _type
@@ -580,6 +643,8 @@ class TypeLiteral(Node):
 class TInt(TypeLiteral):
     "AST node of type `int`."
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("type_int", INT)
 
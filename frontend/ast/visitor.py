@@ -5,7 +5,8 @@ Module that defines the base type of visitor.
 
 from __future__ import annotations
 
-from typing import Callable, Protocol, Sequence, TypeVar
+from types import GeneratorType
+from typing import Any, Callable, Generator, Optional, Protocol, Sequence, TypeVar, Union
 
 from .node import *
 from .tree import *
@@ -94,7 +95,52 @@ class Visitor(Protocol[T, U]):  # type: ignore
         return self.visitOther(that, ctx)
 
 
-class RecursiveVisitor(Visitor[T, U]):
-    def visitOther(self, node: Node, ctx: T) -> Optional[Sequence[Optional[U]]]:
-        ret = tuple(map(accept(self, ctx), node))
+#! 一个访问步骤: `yield` 一个子节点 (或另一个步骤) 以访问它, 得到其返回值
+Step = Generator["Union[Node, Step]", Any, Any]
+
+
+class IterativeVisitor(Visitor[T, U]):
+    """
+    A visitor which traverses the AST with an explicit stack rather than nested `accept` calls,
+    so that arbitrarily deep trees (e.g. `1+1+...+1` generated by a program) don't hit the recursion limit.
+
+    A visit method with children is written as a generator (a `Step`):
+    `value = yield child` visits `child` with the same ctx and resumes with its result,
+    so the code before visiting a child is its pre hook, and the code after is its post hook.
+    A helper which visits nodes (e.g. a branching condition) is a step as well, and `yield helper(...)` runs it.
+    Visit methods without children are plain methods as usual.
+    """
+
+    def visit(self, node: Node, ctx: T) -> Optional[U]:
+        return self.run(node.accept(self, ctx), ctx)
+
+    #! 以显式栈运行一个访问步骤, 栈中是尚未结束的步骤
+    def run(self, step: Union[Step, Optional[U]], ctx: T) -> Optional[U]:
+        if not isinstance(step, GeneratorType):
+            return step
+        stack = [step]
+        value = None
+        while stack:
+            try:
+                item = stack[-1].send(value)
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+                continue
+            if not isinstance(item, GeneratorType):
+                item = item.accept(self, ctx)
+            if isinstance(item, GeneratorType):
+                stack.append(item)
+                value = None
+            else:
+                value = item
+        return value
+
+
+class RecursiveVisitor(IterativeVisitor[T, U]):
+    def visitOther(self, node: Node, ctx: T) -> Step:
+        ret = []
+        for child in node:
+            ret.append((yield child))
+        ret = tuple(ret)
         return ret if ret and ret.count(None) == len(ret) else None
@@ -10,6 +10,7 @@ from . import lex
 # * replace the '.ply-lexer' by '.xxx' to use your own-defined lexer, where 'xxx' is the module/package name of it
 # * note that your lexer should be iterable, and should have the method 'input' in order to accept the input source file
 from .ply_lexer import lexer as ply_lexer
+from .table_lexer import lexer as table_lexer
 
 
 class LexToken(Protocol):
@@ -60,6 +61,7 @@ class Lexer(Protocol):
         ...
 
 
+# `table_lexer` is a faster hand-written lexer accepting exactly the same tokens, opted in with `--lexer table`
 lexer: Lexer = ply_lexer
 
 __all__ = [
@@ -68,4 +70,5 @@ __all__ = [
     "LexToken",
     "Lexer",
     "ply_lexer",
+    "table_lexer",
 ]
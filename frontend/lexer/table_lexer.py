@@ -0,0 +1,154 @@
+"""
+Module that defines a hand-written lexer, which accepts the same tokens as `ply_lexer`.
+
+All the rules in `lex` are joined into a single compiled regex with a group per kind of rule,
+so a token is recognized by a single match, which is dispatched by the index of the group matched.
+Keywords are looked up in `lex.reserved` after matching an identifier,
+and operators in a table from their text to their token types.
+"""
+
+import re
+from typing import Iterator, List, Optional, Union
+
+from frontend.ast import tree
+from frontend.ast.node import Node
+from utils.error import DecafLexError
+
+from . import lex
+
+
+class LexToken:
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, type: str, value: Union[str, Node], lineno: int, lexpos: int, lexer: "TableLexer") -> None:
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.lexer = lexer
+
+    def __str__(self) -> str:
+        return "LexToken(%s,%r,%d,%d)" % (self.type, self.value, self.lineno, self.lexpos)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+# the fixed tokens (operators and punctuations) from their (escaped) patterns in `lex`
+_FIXED_TOKENS = {
+    re.sub(r"\\(.)", r"\1", getattr(lex, "t_" + name)): name
+    for name in lex.tokens
+    if name not in lex.reserved.values() and isinstance(getattr(lex, "t_" + name, None), str)
+}
+
+#! 所有规则合并为一个正则表达式, 匹配到的分组序号即为以下规则种类
+#! 各条规则的先后顺序与 ply_lexer 一致, 空白符并入其后的词法单元
+(IDENTIFIER, INTEGER, NEWLINE, COMMENT, OPEN_COMMENT, LINE_COMMENT, FIXED, ERROR) = range(1, 9)
+
+_SCANNER = re.compile(
+    r"{}*(?:{})".format(
+        lex.t_ignore_Whitespace.removesuffix("+"),
+        "|".join(
+            "({})".format(pattern)
+            for pattern in [
+                lex.t_Identifier.__doc__,
+                lex.t_Integer.__doc__,
+                lex.t_ignore_Newline,
+                # a block comment, or the rest of the input if it is never closed
+                r"/\*[\s\S]*?\*/",
+                r"/\*[\s\S]*",
+                lex.t_ignore_LineComment,
+                # longer ones come first, so that e.g. "<=" is not taken as "<" followed by "="
+                "|".join(map(re.escape, sorted(_FIXED_TOKENS, key=len, reverse=True))),
+                # anything else is an invalid token
+                r"[\s\S]",
+            ]
+        ),
+    )
+)
+
+_NEWLINE = re.compile(lex.t_ignore_Newline)
+
+
+class TableLexer:
+    def __init__(self) -> None:
+        self.lexdata = ""
+        self.lexpos = 0
+        self.lineno = 1
+        self.error_stack: List[DecafLexError] = []
+        self.tokens: Iterator[LexToken] = iter(())
+
+    def input(self, s: str) -> None:
+        self.lexdata = s
+        self.lexpos = 0
+        self.lineno = 1
+        self.error_stack.clear()
+        self.tokens = self.scan()
+
+    def token(self) -> Optional[LexToken]:
+        return next(self.tokens, None)
+
+    def __iter__(self) -> Iterator[LexToken]:
+        return self
+
+    def __next__(self) -> LexToken:
+        return next(self.tokens)
+
+    def error(self, lexpos: int) -> None:
+        self.error_stack.append(DecafLexError(LexToken("error", self.lexdata[lexpos], self.lineno, lexpos, self)))
+
+    def scan(self) -> Iterator[LexToken]:
+        reserved = lex.reserved
+        fixed = _FIXED_TOKENS
+        Identifier = tree.Identifier
+        IntLiteral = tree.IntLiteral
+        lineno = 1
+        for m in _SCANNER.finditer(self.lexdata):
+            kind = m.lastindex
+            if kind == IDENTIFIER:
+                value = m.group(kind)
+                type = reserved.get(value)
+                if type is None:
+                    token = LexToken("Identifier", Identifier(value), lineno, m.start(kind), self)
+                else:
+                    token = LexToken(type, value, lineno, m.start(kind), self)
+            elif kind == FIXED:
+                value = m.group(kind)
+                token = LexToken(fixed[value], value, lineno, m.start(kind), self)
+            elif kind == INTEGER:
+                token = LexToken("Integer", IntLiteral(m.group(kind)), lineno, m.start(kind), self)
+            elif kind == NEWLINE:
+                lineno += 1
+                continue
+            elif kind == LINE_COMMENT:
+                continue
+            elif kind == COMMENT:
+                lineno += len(_NEWLINE.findall(m.group(kind)))
+                continue
+            else:
+                self.lineno = lineno
+                self.scanError(m)
+                lineno = self.lineno
+                continue
+            self.lexpos = m.end()
+            self.lineno = lineno
+            yield token
+        self.lexpos = len(self.lexdata)
+        self.lineno = lineno
+
+    # report an invalid token, or the end of a comment which is never closed
+    def scanError(self, m: "re.Match[str]") -> None:
+        if m.lastindex == ERROR:
+            self.error(m.start(ERROR))
+            return
+        # like ply_lexer, the lines of the comment are skipped,
+        # while every char on its last line is an invalid token unless the line is ended by a newline
+        lexpos = m.start(OPEN_COMMENT) + 2
+        for newline in _NEWLINE.finditer(self.lexdata, lexpos):
+            self.lineno += 1
+            lexpos = newline.end()
+        for i in range(lexpos, len(self.lexdata)):
+            self.error(i)
+
+
+lexer = TableLexer()
@@ -5,6 +5,7 @@ from frontend.lexer import Lexer
 from utils.error import DecafSyntaxError
 
 from .ply_parser import parser as _parser
+from .rd_parser import parser as _rd_parser
 
 
 class Parser(Protocol):
@@ -21,9 +22,16 @@ class Parser(Protocol):
         ...
 
 
-parser = cast(Parser, _parser)
+ply_parser = cast(Parser, _parser)
+rd_parser = cast(Parser, _rd_parser)
+
+# `rd_parser` is a faster hand-written parser accepting the same grammar and building the same AST,
+# opted in with `--parser rd`; it recurses on nested code, so it's not the default (see rd_parser)
+parser = ply_parser
 
 
 __all__ = [
     "parser",
+    "ply_parser",
+    "rd_parser",
 ]
@@ -0,0 +1,116 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programAnd Assign BitAnd BitNot BitOr Break Colon Comma Continue Div Else Equal For Greater GreaterEqual Identifier If Int Integer LBrace LBracket LParen Less LessEqual Minus Mod Mul Not NotEqual Or Plus Question RBrace RBracket RParen Return Semi While Xor\n    empty :\n    \n    program : program function\n        | program declaration Semi\n    \n    program : empty\n    \n    type : Int\n    \n    function : type Identifier LParen parameter_list RParen LBrace block RBrace\n    \n    parameter_list : empty\n    \n    parameter_list : parameter\n    \n    parameter_list : parameter_list Comma parameter\n    \n    parameter : type Identifier\n    \n    parameter : type Identifier dim_list\n    \n    dim_list : LBracket RBracket\n    \n    dim_list : LBracket Integer RBracket\n    \n    dim_list : dim_list LBracket Integer RBracket\n    \n    block : block block_item\n    \n    block : empty\n    \n    block_item : statement\n        | declaration Semi\n    \n    statement : statement_matched\n        | statement_unmatched\n    \n    statement_matched : If LParen expression RParen statement_matched Else statement_matched\n    statement_unmatched : If LParen expression RParen statement_matched Else statement_unmatched\n    \n    statement_unmatched : If LParen expression RParen statement\n    \n    statement_matched : While LParen expression RParen statement_matched\n    statement_unmatched : While LParen expression RParen statement_unmatched\n    \n    statement_matched : For LParen init_expression Semi opt_expression Semi opt_expression RParen statement_matched\n    statement_unmatched : For LParen init_expression Semi opt_expression Semi opt_expression RParen statement_unmatched\n    \n    init_expression : opt_expression\n    init_expression : declaration\n    \n    statement_matched : Return expression Semi\n    \n    statement_matched : opt_expression Semi\n    \n    statement_matched : LBrace block RBrace\n    \n    statement_matched : Break Semi\n    \n    statement_matched : Continue Semi\n    \n    opt_expression : expression\n    \n    opt_expression : empty\n    \n    declaration : type Identifier\n    \n    declaration : type Identifier Assign expression\n    \n    declaration : type Identifier dim_list\n    \n    declaration : type Identifier dim_list Assign init_list\n    \n    init_elem : Integer\n    \n    init_elem : init_elem Comma Integer\n    \n    init_list : LBrace init_elem RBrace\n    \n    postfix : Identifier LParen expression_list RParen\n    \n    postfix : postfix LBracket expression RBracket\n    \n    expression_list : empty\n    \n    expression_list : expression\n    \n    expression_list : expression_list Comma expression\n    \n    expression : assignment\n    assignment : conditional\n    conditional : logical_or\n    logical_or : logical_and\n    logical_and : bit_or\n    bit_or : xor\n    xor : bit_and\n    bit_and : equality\n    equality : relational\n    relational : additive\n    additive : multiplicative\n    multiplicative : unary\n    unary : postfix\n    postfix : primary\n    \n    unary : Minus unary\n        | BitNot unary\n        | Not unary\n    \n    assignment : postfix Assign expression\n    logical_or : logical_or Or logical_and\n    logical_and : logical_and And bit_or\n    bit_or : bit_or BitOr xor\n    xor : xor Xor bit_and\n    bit_and : bit_and BitAnd equality\n    equality : equality NotEqual relational\n        | equality Equal relational\n    relational : relational Less additive\n        | relational Greater additive\n        | relational LessEqual additive\n        | relational GreaterEqual additive\n    additive : additive Plus multiplicative\n        | additive Minus multiplicative\n    multiplicative : multiplicative Mul unary\n        | multiplicative Div unary\n        | multiplicative Mod unary\n    \n    conditional : logical_or Question expression Colon conditional\n    \n    primary : Integer\n    \n    primary : Identifier\n    \n    primary : LParen expression RParen\n    '
+    
+_lr_action_items = {'Int':([0,1,2,3,7,9,44,75,103,104,112,113,114,115,117,118,132,133,136,137,139,140,141,147,151,152,153,154,158,159,162,163,],[-1,6,-4,-2,-3,6,6,-1,6,-16,-1,-6,-15,-17,-19,-20,6,-18,6,-31,-33,-34,-32,-30,-19,-23,-24,-25,-21,-22,-26,-27,]),'$end':([0,1,2,3,7,113,],[-1,0,-4,-2,-3,-6,]),'Semi':([4,8,11,17,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,35,40,66,67,68,69,70,73,75,80,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,107,109,112,114,115,116,117,118,119,123,125,126,127,129,131,132,133,136,137,138,139,140,141,144,145,146,147,148,149,150,151,152,153,154,155,156,158,159,161,162,163,],[7,-37,-39,-85,-38,-49,-50,-61,-51,-62,-52,-84,-53,-54,-55,-56,-57,-58,-59,-60,-12,-63,-61,-64,-65,-40,-13,-1,-66,-67,-86,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-14,-1,-16,-44,-45,-43,-1,-15,-17,133,-19,-20,-35,137,139,140,-36,-83,-37,-1,-18,-1,-31,147,-33,-34,-32,150,-28,-29,-30,-1,-1,-1,-19,-23,-24,-25,157,-1,-21,-22,-1,-26,-27,]),'Identifier':([5,6,10,13,23,34,36,37,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,75,103,104,106,108,111,112,114,115,117,118,124,132,133,134,135,136,137,139,140,141,147,148,149,150,151,152,153,154,156,157,158,159,161,162,163,],[8,-5,17,42,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-1,17,-16,17,17,131,-1,-15,-17,-19,-20,17,17,-18,17,17,17,-31,-33,-34,-32,-30,17,17,17,-19,-23,-24,-25,17,17,-21,-22,17,-26,-27,]),'LParen':([8,10,17,23,34,36,37,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,75,103,104,106,108,112,114,115,117,118,120,121,122,124,132,133,134,135,136,137,139,140,141,147,148,149,150,151,152,153,154,156,157,158,159,161,162,163,],[9,23,45,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-1,23,-16,23,23,-1,-15,-17,-19,-20,134,135,136,23,23,-18,23,23,23,-31,-33,-34,-32,-30,23,23,23,-19,-23,-24,-25,23,23,-21,-22,23,-26,-27,]),'Assign':([8,11,17,21,24,26,40,73,84,102,105,107,131,],[10,38,-85,46,-62,-84,-12,-13,-86,-14,-44,-45,10,]),'LBracket':([8,11,17,21,24,26,40,42,67,73,74,84,102,105,107,131,],[12,39,-85,47,-62,-84,-12,12,47,-13,39,-86,-14,-44,-45,12,]),'RParen':([9,14,15,16,17,19,20,21,22,24,25,26,27,28,29,30,31,32,33,35,40,42,45,50,66,67,68,69,73,74,76,77,78,79,80,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,102,105,107,119,127,128,129,142,143,157,160,],[-1,43,-7,-8,-85,-49,-50,-61,-51,-62,-52,-84,-53,-54,-55,-56,-57,-58,-59,-60,-12,-10,-1,84,-63,-61,-64,-65,-13,-11,-9,105,-46,-47,-66,-67,-86,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-14,-44,-45,-35,-36,-48,-83,148,149,-1,161,]),'Comma':([9,14,15,16,17,19,20,21,22,24,25,26,27,28,29,30,31,32,33,35,40,42,45,66,67,68,69,73,74,76,77,78,79,80,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,105,107,128,129,130,],[-1,44,-7,-8,-85,-49,-50,-61,-51,-62,-52,-84,-53,-54,-55,-56,-57,-58,-59,-60,-12,-10,-1,-63,-61,-64,-65,-13,-11,-9,106,-46,-47,-66,-67,-86,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,110,-41,-14,-44,-45,-48,-83,-42,]),'Integer':([10,12,23,34,36,37,39,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,71,75,103,104,106,108,110,112,114,115,117,118,124,132,133,134,135,136,137,139,140,141,147,148,149,150,151,152,153,154,156,157,158,159,161,162,163,],[26,41,26,26,26,26,72,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,101,-1,26,-16,26,26,130,-1,-15,-17,-19,-20,26,26,-18,26,26,26,-31,-33,-34,-32,-30,26,26,26,-19,-23,-24,-25,26,26,-21,-22,26,-26,-27,]),'Minus':([10,17,21,23,24,26,32,33,34,35,36,37,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,75,84,91,92,93,94,95,96,97,98,99,103,104,105,106,107,108,112,114,115,117,118,124,132,133,134,135,136,137,139,140,141,147,148,149,150,151,152,153,154,156,157,158,159,161,162,163,],[34,-85,-61,34,-62,-84,62,-59,34,-60,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-63,-61,-64,-65,-1,-86,62,62,62,62,-78,-79,-80,-81,-82,34,-16,-44,34,-45,34,-1,-15,-17,-19,-20,34,34,-18,34,34,34,-31,-33,-34,-32,-30,34,34,34,-19,-23,-24,-25,34,34,-21,-22,34,-26,-27,]),'BitNot':([10,23,34,36,37,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,75,103,104,106,108,112,114,115,117,118,124,132,133,134,135,136,137,139,140,141,147,148,149,150,151,152,153,154,156,157,158,159,161,162,163,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-1,36,-16,36,36,-1,-15,-17,-19,-20,36,36,-18,36,36,36,-31,-33,-34,-32,-30,36,36,36,-19,-23,-24,-25,36,36,-21,-22,36,-26,-27,]),'Not':([10,23,34,36,37,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,75,103,104,106,108,112,114,115,117,118,124,132,133,134,135,136,137,139,140,141,147,148,149,150,151,152,153,154,156,157,158,159,161,162,163,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-1,37,-16,37,37,-1,-15,-17,-19,-20,37,37,-18,37,37,37,-31,-33,-34,-32,-30,37,37,37,-19,-23,-24,-25,37,37,-21,-22,37,-26,-27,]),'RBracket':([12,17,19,20,21,22,24,25,26,27,28,29,30,31,32,33,35,41,66,67,68,69,72,80,81,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,105,107,129,],[40,-85,-49,-50,-61,-51,-62,-52,-84,-53,-54,-55,-56,-57,-58,-59,-60,73,-63,-61,-64,-65,102,-66,107,-67,-86,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,-83,]),'Mul':([17,21,24,26,33,35,66,67,68,69,84,95,96,97,98,99,105,107,],[-85,-61,-62,-84,63,-60,-63,-61,-64,-65,-86,63,63,-80,-81,-82,-44,-45,]),'Div':([17,21,24,26,33,35,66,67,68,69,84,95,96,97,98,99,105,107,],[-85,-61,-62,-84,64,-60,-63,-61,-64,-65,-86,64,64,-80,-81,-82,-44,-45,]),'Mod':([17,21,24,26,33,35,66,67,68,69,84,95,96,97,98,99,105,107,],[-85,-61,-62,-84,65,-60,-63,-61,-64,-65,-86,65,65,-80,-81,-82,-44,-45,]),'Plus':([17,21,24,26,32,33,35,66,67,68,69,84,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,61,-59,-60,-63,-61,-64,-65,-86,61,61,61,61,-78,-79,-80,-81,-82,-44,-45,]),'Less':([17,21,24,26,31,32,33,35,66,67,68,69,84,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,57,-58,-59,-60,-63,-61,-64,-65,-86,57,57,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'Greater':([17,21,24,26,31,32,33,35,66,67,68,69,84,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,58,-58,-59,-60,-63,-61,-64,-65,-86,58,58,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'LessEqual':([17,21,24,26,31,32,33,35,66,67,68,69,84,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,59,-58,-59,-60,-63,-61,-64,-65,-86,59,59,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'GreaterEqual':([17,21,24,26,31,32,33,35,66,67,68,69,84,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,60,-58,-59,-60,-63,-61,-64,-65,-86,60,60,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'NotEqual':([17,21,24,26,30,31,32,33,35,66,67,68,69,84,88,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,55,-57,-58,-59,-60,-63,-61,-64,-65,-86,55,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'Equal':([17,21,24,26,30,31,32,33,35,66,67,68,69,84,88,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,56,-57,-58,-59,-60,-63,-61,-64,-65,-86,56,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'BitAnd':([17,21,24,26,29,30,31,32,33,35,66,67,68,69,84,87,88,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,54,-56,-57,-58,-59,-60,-63,-61,-64,-65,-86,54,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'Xor':([17,21,24,26,28,29,30,31,32,33,35,66,67,68,69,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,53,-55,-56,-57,-58,-59,-60,-63,-61,-64,-65,-86,53,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'BitOr':([17,21,24,26,27,28,29,30,31,32,33,35,66,67,68,69,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,-84,52,-54,-55,-56,-57,-58,-59,-60,-63,-61,-64,-65,-86,52,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'And':([17,21,24,25,26,27,28,29,30,31,32,33,35,66,67,68,69,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,-62,51,-84,-53,-54,-55,-56,-57,-58,-59,-60,-63,-61,-64,-65,51,-86,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'Question':([17,21,22,24,25,26,27,28,29,30,31,32,33,35,66,67,68,69,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,48,-62,-52,-84,-53,-54,-55,-56,-57,-58,-59,-60,-63,-61,-64,-65,-67,-86,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'Or':([17,21,22,24,25,26,27,28,29,30,31,32,33,35,66,67,68,69,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,105,107,],[-85,-61,49,-62,-52,-84,-53,-54,-55,-56,-57,-58,-59,-60,-63,-61,-64,-65,-67,-86,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,]),'Colon':([17,19,20,21,22,24,25,26,27,28,29,30,31,32,33,35,66,67,68,69,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,105,107,129,],[-85,-49,-50,-61,-51,-62,-52,-84,-53,-54,-55,-56,-57,-58,-59,-60,-63,-61,-64,-65,-66,108,-67,-86,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-44,-45,-83,]),'LBrace':([38,43,75,103,104,112,114,115,117,118,132,133,137,139,140,141,147,148,149,151,152,153,154,156,158,159,161,162,163,],[71,75,-1,112,-16,-1,-15,-17,-19,-20,112,-18,-31,-33,-34,-32,-30,112,112,-19,-23,-24,-25,112,-21,-22,112,-26,-27,]),'RBrace':([75,100,101,103,104,112,114,115,117,118,130,132,133,137,139,140,141,147,151,152,153,154,158,159,162,163,],[-1,109,-41,113,-16,-1,-15,-17,-19,-20,-42,141,-18,-31,-33,-34,-32,-30,-19,-23,-24,-25,-21,-22,-26,-27,]),'If':([75,103,104,112,114,115,117,118,132,133,137,139,140,141,147,148,149,151,152,153,154,156,158,159,161,162,163,],[-1,120,-16,-1,-15,-17,-19,-20,120,-18,-31,-33,-34,-32,-30,120,120,-19,-23,-24,-25,120,-21,-22,120,-26,-27,]),'While':([75,103,104,112,114,115,117,118,132,133,137,139,140,141,147,148,149,151,152,153,154,156,158,159,161,162,163,],[-1,121,-16,-1,-15,-17,-19,-20,121,-18,-31,-33,-34,-32,-30,121,121,-19,-23,-24,-25,121,-21,-22,121,-26,-27,]),'For':([75,103,104,112,114,115,117,118,132,133,137,139,140,141,147,148,149,151,152,153,154,156,158,159,161,162,163,],[-1,122,-16,-1,-15,-17,-19,-20,122,-18,-31,-33,-34,-32,-30,122,122,-19,-23,-24,-25,122,-21,-22,122,-26,-27,]),'Return':([75,103,104,112,114,115,117,118,132,133,137,139,140,141,147,148,149,151,152,153,154,156,158,159,161,162,163,],[-1,124,-16,-1,-15,-17,-19,-20,124,-18,-31,-33,-34,-32,-30,124,124,-19,-23,-24,-25,124,-21,-22,124,-26,-27,]),'Break':([75,103,104,112,114,115,117,118,132,133,137,139,140,141,147,148,149,151,152,153,154,156,158,159,161,162,163,],[-1,125,-16,-1,-15,-17,-19,-20,125,-18,-31,-33,-34,-32,-30,125,125,-19,-23,-24,-25,125,-21,-22,125,-26,-27,]),'Continue':([75,103,104,112,114,115,117,118,132,133,137,139,140,141,147,148,149,151,152,153,154,156,158,159,161,162,163,],[-1,126,-16,-1,-15,-17,-19,-20,126,-18,-31,-33,-34,-32,-30,126,126,-19,-23,-24,-25,126,-21,-22,126,-26,-27,]),'Else':([137,139,140,141,147,151,153,158,162,],[-31,-33,-34,-32,-30,156,-24,-21,-26,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'empty':([0,9,45,75,103,112,132,136,148,149,150,156,157,161,],[2,15,78,104,127,104,127,127,127,127,127,127,127,127,]),'function':([1,],[3,]),'declaration':([1,103,132,136,],[4,116,116,146,]),'type':([1,9,44,103,132,136,],[5,13,13,111,111,111,]),'dim_list':([8,42,131,],[11,74,11,]),'parameter_list':([9,],[14,]),'parameter':([9,44,],[16,76,]),'expression':([10,23,45,46,47,48,103,106,124,132,134,135,136,148,149,150,156,157,161,],[18,50,79,80,81,82,119,128,138,119,142,143,119,119,119,119,119,119,119,]),'assignment':([10,23,45,46,47,48,103,106,124,132,134,135,136,148,149,150,156,157,161,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'conditional':([10,23,45,46,47,48,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[20,20,20,20,20,20,20,20,129,20,20,20,20,20,20,20,20,20,20,20,]),'postfix':([10,23,34,36,37,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[21,21,67,67,67,21,21,21,21,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,21,21,67,21,21,21,21,21,21,21,21,21,21,21,]),'logical_or':([10,23,45,46,47,48,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'primary':([10,23,34,36,37,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'logical_and':([10,23,45,46,47,48,49,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[25,25,25,25,25,25,83,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'bit_or':([10,23,45,46,47,48,49,51,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[27,27,27,27,27,27,27,85,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'xor':([10,23,45,46,47,48,49,51,52,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[28,28,28,28,28,28,28,28,86,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'bit_and':([10,23,45,46,47,48,49,51,52,53,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[29,29,29,29,29,29,29,29,29,87,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'equality':([10,23,45,46,47,48,49,51,52,53,54,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[30,30,30,30,30,30,30,30,30,30,88,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'relational':([10,23,45,46,47,48,49,51,52,53,54,55,56,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[31,31,31,31,31,31,31,31,31,31,31,89,90,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'additive':([10,23,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[32,32,32,32,32,32,32,32,32,32,32,32,32,91,92,93,94,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'multiplicative':([10,23,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,95,96,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'unary':([10,23,34,36,37,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,103,106,108,124,132,134,135,136,148,149,150,156,157,161,],[35,35,66,68,69,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,97,98,99,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'init_list':([38,],[70,]),'expression_list':([45,],[77,]),'init_elem':([71,],[100,]),'block':([75,112,],[103,132,]),'block_item':([103,132,],[114,114,]),'statement':([103,132,148,],[115,115,152,]),'statement_matched':([103,132,148,149,156,161,],[117,117,151,153,158,162,]),'statement_unmatched':([103,132,148,149,156,161,],[118,118,118,154,159,163,]),'opt_expression':([103,132,136,148,149,150,156,157,161,],[123,123,145,123,123,155,123,160,123,]),'init_expression':([136,],[144,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('empty -> <empty>','empty',0,'p_empty','ply_parser.py',41),
+  ('program -> program function','program',2,'p_program','ply_parser.py',49),
+  ('program -> program declaration Semi','program',3,'p_program','ply_parser.py',50),
+  ('program -> empty','program',1,'p_program_empty','ply_parser.py',59),
+  ('type -> Int','type',1,'p_type','ply_parser.py',66),
+  ('function -> type Identifier LParen parameter_list RParen LBrace block RBrace','function',8,'p_function_def','ply_parser.py',73),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list_empty','ply_parser.py',80),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list_single','ply_parser.py',87),
+  ('parameter_list -> parameter_list Comma parameter','parameter_list',3,'p_parameter_list','ply_parser.py',95),
+  ('parameter -> type Identifier','parameter',2,'p_parameter','ply_parser.py',104),
+  ('parameter -> type Identifier dim_list','parameter',3,'p_parameter_array','ply_parser.py',111),
+  ('dim_list -> LBracket RBracket','dim_list',2,'p_dim_list_empty','ply_parser.py',118),
+  ('dim_list -> LBracket Integer RBracket','dim_list',3,'p_dim_list_not_empty','ply_parser.py',125),
+  ('dim_list -> dim_list LBracket Integer RBracket','dim_list',4,'p_dim_list','ply_parser.py',132),
+  ('block -> block block_item','block',2,'p_block','ply_parser.py',140),
+  ('block -> empty','block',1,'p_block_empty','ply_parser.py',149),
+  ('block_item -> statement','block_item',1,'p_block_item','ply_parser.py',156),
+  ('block_item -> declaration Semi','block_item',2,'p_block_item','ply_parser.py',157),
+  ('statement -> statement_matched','statement',1,'p_statement','ply_parser.py',164),
+  ('statement -> statement_unmatched','statement',1,'p_statement','ply_parser.py',165),
+  ('statement_matched -> If LParen expression RParen statement_matched Else statement_matched','statement_matched',7,'p_if_else','ply_parser.py',172),
+  ('statement_unmatched -> If LParen expression RParen statement_matched Else statement_unmatched','statement_unmatched',7,'p_if_else','ply_parser.py',173),
+  ('statement_unmatched -> If LParen expression RParen statement','statement_unmatched',5,'p_if','ply_parser.py',180),
+  ('statement_matched -> While LParen expression RParen statement_matched','statement_matched',5,'p_while','ply_parser.py',187),
+  ('statement_unmatched -> While LParen expression RParen statement_unmatched','statement_unmatched',5,'p_while','ply_parser.py',188),
+  ('statement_matched -> For LParen init_expression Semi opt_expression Semi opt_expression RParen statement_matched','statement_matched',9,'p_for','ply_parser.py',195),
+  ('statement_unmatched -> For LParen init_expression Semi opt_expression Semi opt_expression RParen statement_unmatched','statement_unmatched',9,'p_for','ply_parser.py',196),
+  ('init_expression -> opt_expression','init_expression',1,'p_for_init','ply_parser.py',203),
+  ('init_expression -> declaration','init_expression',1,'p_for_init','ply_parser.py',204),
+  ('statement_matched -> Return expression Semi','statement_matched',3,'p_return','ply_parser.py',211),
+  ('statement_matched -> opt_expression Semi','statement_matched',2,'p_expression_statement','ply_parser.py',218),
+  ('statement_matched -> LBrace block RBrace','statement_matched',3,'p_block_statement','ply_parser.py',225),
+  ('statement_matched -> Break Semi','statement_matched',2,'p_break','ply_parser.py',232),
+  ('statement_matched -> Continue Semi','statement_matched',2,'p_continue','ply_parser.py',239),
+  ('opt_expression -> expression','opt_expression',1,'p_opt_expression','ply_parser.py',246),
+  ('opt_expression -> empty','opt_expression',1,'p_opt_expression_empty','ply_parser.py',253),
+  ('declaration -> type Identifier','declaration',2,'p_declaration','ply_parser.py',260),
+  ('declaration -> type Identifier Assign expression','declaration',4,'p_declaration_init','ply_parser.py',267),
+  ('declaration -> type Identifier dim_list','declaration',3,'p_declaration_array','ply_parser.py',274),
+  ('declaration -> type Identifier dim_list Assign init_list','declaration',5,'p_declaration_array_init','ply_parser.py',281),
+  ('init_elem -> Integer','init_elem',1,'p_declaration_array_init_elem_single','ply_parser.py',288),
+  ('init_elem -> init_elem Comma Integer','init_elem',3,'p_declaration_array_init_elem_','ply_parser.py',295),
+  ('init_list -> LBrace init_elem RBrace','init_list',3,'p_declaration_array_elem','ply_parser.py',303),
+  ('postfix -> Identifier LParen expression_list RParen','postfix',4,'p_postfix','ply_parser.py',310),
+  ('postfix -> postfix LBracket expression RBracket','postfix',4,'p_postfix_index_expr','ply_parser.py',317),
+  ('expression_list -> empty','expression_list',1,'p_expression_list_empty','ply_parser.py',324),
+  ('expression_list -> expression','expression_list',1,'p_expression_list_single','ply_parser.py',331),
+  ('expression_list -> expression_list Comma expression','expression_list',3,'p_expression_list','ply_parser.py',339),
+  ('expression -> assignment','expression',1,'p_expression_precedence','ply_parser.py',348),
+  ('assignment -> conditional','assignment',1,'p_expression_precedence','ply_parser.py',349),
+  ('conditional -> logical_or','conditional',1,'p_expression_precedence','ply_parser.py',350),
+  ('logical_or -> logical_and','logical_or',1,'p_expression_precedence','ply_parser.py',351),
+  ('logical_and -> bit_or','logical_and',1,'p_expression_precedence','ply_parser.py',352),
+  ('bit_or -> xor','bit_or',1,'p_expression_precedence','ply_parser.py',353),
+  ('xor -> bit_and','xor',1,'p_expression_precedence','ply_parser.py',354),
+  ('bit_and -> equality','bit_and',1,'p_expression_precedence','ply_parser.py',355),
+  ('equality -> relational','equality',1,'p_expression_precedence','ply_parser.py',356),
+  ('relational -> additive','relational',1,'p_expression_precedence','ply_parser.py',357),
+  ('additive -> multiplicative','additive',1,'p_expression_precedence','ply_parser.py',358),
+  ('multiplicative -> unary','multiplicative',1,'p_expression_precedence','ply_parser.py',359),
+  ('unary -> postfix','unary',1,'p_expression_precedence','ply_parser.py',360),
+  ('postfix -> primary','postfix',1,'p_expression_precedence','ply_parser.py',361),
+  ('unary -> Minus unary','unary',2,'p_unary_expression','ply_parser.py',368),
+  ('unary -> BitNot unary','unary',2,'p_unary_expression','ply_parser.py',369),
+  ('unary -> Not unary','unary',2,'p_unary_expression','ply_parser.py',370),
+  ('assignment -> postfix Assign expression','assignment',3,'p_binary_expression','ply_parser.py',377),
+  ('logical_or -> logical_or Or logical_and','logical_or',3,'p_binary_expression','ply_parser.py',378),
+  ('logical_and -> logical_and And bit_or','logical_and',3,'p_binary_expression','ply_parser.py',379),
+  ('bit_or -> bit_or BitOr xor','bit_or',3,'p_binary_expression','ply_parser.py',380),
+  ('xor -> xor Xor bit_and','xor',3,'p_binary_expression','ply_parser.py',381),
+  ('bit_and -> bit_and BitAnd equality','bit_and',3,'p_binary_expression','ply_parser.py',382),
+  ('equality -> equality NotEqual relational','equality',3,'p_binary_expression','ply_parser.py',383),
+  ('equality -> equality Equal relational','equality',3,'p_binary_expression','ply_parser.py',384),
+  ('relational -> relational Less additive','relational',3,'p_binary_expression','ply_parser.py',385),
+  ('relational -> relational Greater additive','relational',3,'p_binary_expression','ply_parser.py',386),
+  ('relational -> relational LessEqual additive','relational',3,'p_binary_expression','ply_parser.py',387),
+  ('relational -> relational GreaterEqual additive','relational',3,'p_binary_expression','ply_parser.py',388),
+  ('additive -> additive Plus multiplicative','additive',3,'p_binary_expression','ply_parser.py',389),
+  ('additive -> additive Minus multiplicative','additive',3,'p_binary_expression','ply_parser.py',390),
+  ('multiplicative -> multiplicative Mul unary','multiplicative',3,'p_binary_expression','ply_parser.py',391),
+  ('multiplicative -> multiplicative Div unary','multiplicative',3,'p_binary_expression','ply_parser.py',392),
+  ('multiplicative -> multiplicative Mod unary','multiplicative',3,'p_binary_expression','ply_parser.py',393),
+  ('conditional -> logical_or Question expression Colon conditional','conditional',5,'p_conditional_expression','ply_parser.py',400),
+  ('primary -> Integer','primary',1,'p_int_literal_expression','ply_parser.py',407),
+  ('primary -> Identifier','primary',1,'p_identifier_expression','ply_parser.py',414),
+  ('primary -> LParen expression RParen','primary',3,'p_brace_expression','ply_parser.py',421),
+]
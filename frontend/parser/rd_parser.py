@@ -0,0 +1,367 @@
+"""
+Module that defines a hand-written recursive descent parser, which accepts the same grammar as `ply_parser`
+and builds the same AST.
+
+Statements are parsed by recursive descent, and expressions by precedence climbing (Pratt parsing):
+a binary operator is looked up in `BINARY_OPS` for its precedence, so that a primary expression
+doesn't have to go through a function per precedence level as in the grammar.
+Long `else if` chains, assignment chains and unary operator chains are parsed by loops rather than recursion,
+but nesting is not: every level of nested parentheses, blocks, `if`/loop bodies or `?:` branches
+takes a few Python frames, so a few hundred levels exceed the default recursion limit (RecursionError),
+which is why `ply_parser` stays the default.
+
+Syntax errors are reported like `ply_parser`: the unexpected token is reported and skipped,
+and parsing goes on as if it never appeared.
+"""
+
+from typing import Optional
+
+from frontend.ast.node import NullType
+from frontend.ast.tree import *
+from frontend.lexer import Lexer, LexToken
+from frontend.lexer import lexer as defaultLexer
+from utils.error import DecafSyntaxError
+
+
+# binary operators: token type -> (precedence, operator), all of them are left associative
+BINARY_OPS = {
+    "Or": (1, BinaryOp.LogicOr),
+    "And": (2, BinaryOp.LogicAnd),
+    "BitOr": (3, BinaryOp.BitOr),
+    "Xor": (4, BinaryOp.Xor),
+    "BitAnd": (5, BinaryOp.BitAnd),
+    "Equal": (6, BinaryOp.EQ),
+    "NotEqual": (6, BinaryOp.NE),
+    "Less": (7, BinaryOp.LT),
+    "Greater": (7, BinaryOp.GT),
+    "LessEqual": (7, BinaryOp.LE),
+    "GreaterEqual": (7, BinaryOp.GE),
+    "Plus": (8, BinaryOp.Add),
+    "Minus": (8, BinaryOp.Sub),
+    "Mul": (9, BinaryOp.Mul),
+    "Div": (9, BinaryOp.Div),
+    "Mod": (9, BinaryOp.Mod),
+}
+
+UNARY_OPS = {
+    "Minus": UnaryOp.Neg,
+    "BitNot": UnaryOp.BitNot,
+    "Not": UnaryOp.LogicNot,
+}
+
+
+class _EndToken:
+    "The token after the last one."
+
+    type = "$end"
+
+
+_END = _EndToken()
+
+
+# raised to give up parsing at the end of input
+class _UnexpectedEnd(Exception):
+    pass
+
+
+class RDParser:
+    def __init__(self) -> None:
+        self.error_stack: list[DecafSyntaxError] = []
+        self.lexer: Lexer = defaultLexer
+        self.tok: LexToken = _END
+
+    def parse(self, input: str, lexer: Optional[Lexer] = None) -> Optional[Program]:
+        self.lexer = lexer or defaultLexer
+        self.lexer.input(input)
+        self.nextToken = self.lexer.token
+        self.advance()
+        try:
+            return self.parseProgram()
+        except _UnexpectedEnd:
+            return None
+
+    def advance(self) -> LexToken:
+        tok = self.tok
+        self.tok = self.nextToken() or _END
+        return tok
+
+    #! 与 ply_parser 的 p_error 一致: 报告并跳过当前 token, 然后继续分析
+    def syntaxError(self) -> None:
+        t = self.tok
+        if t is _END:
+            self.error_stack.append(DecafSyntaxError(None, "EOF"))
+            raise _UnexpectedEnd()
+        if not hasattr(t, "lexer"):
+            t.lexer = self.lexer
+        inp = self.lexer.lexdata
+        self.error_stack.append(DecafSyntaxError(t, f"\n{inp.splitlines()[t.lineno - 1]}"))
+        self.advance()
+
+    def expect(self, type: str) -> LexToken:
+        while self.tok.type != type:
+            self.syntaxError()
+        return self.advance()
+
+    # program : (function | declaration Semi)*
+    def parseProgram(self) -> Program:
+        program = Program()
+        while self.tok is not _END:
+            if self.tok.type != "Int":
+                self.syntaxError()
+                continue
+            self.advance()
+            type = TInt()
+            ident = self.expect("Identifier").value
+            if self.tok.type == "LParen":
+                program.children.append(self.parseFunction(type, ident))
+            else:
+                program.children.append(self.parseDeclaration(type, ident))
+                self.expect("Semi")
+        return program
+
+    def parseType(self) -> TypeLiteral:
+        self.expect("Int")
+        return TInt()
+
+    # function : type Identifier LParen parameter_list RParen LBrace block RBrace
+    # parameter_list : [parameter] (Comma parameter)*, note that the first parameter can be left out as in the grammar
+    def parseFunction(self, type: TypeLiteral, ident: Identifier) -> Function:
+        self.expect("LParen")
+        params = ParameterList()
+        if self.tok.type != "RParen" and self.tok.type != "Comma":
+            params.children.append(self.parseParameter())
+        while self.tok.type == "Comma":
+            self.advance()
+            params.children.append(self.parseParameter())
+        self.expect("RParen")
+        self.expect("LBrace")
+        return Function(type, ident, params, self.parseBlock())
+
+    def parseParameter(self) -> Parameter:
+        type = self.parseType()
+        ident = self.expect("Identifier").value
+        if self.tok.type == "LBracket":
+            return Parameter(type, ident, self.parseDimList())
+        return Parameter(type, ident, None)
+
+    # dim_list : LBracket [Integer] RBracket (LBracket Integer RBracket)*
+    def parseDimList(self) -> list[Union[IntLiteral, NullType]]:
+        self.expect("LBracket")
+        if self.tok.type == "RBracket":
+            dims = [NULL]
+        else:
+            dims = [self.expect("Integer").value]
+        self.expect("RBracket")
+        while self.tok.type == "LBracket":
+            self.advance()
+            dims.append(self.expect("Integer").value)
+            self.expect("RBracket")
+        return dims
+
+    # the rest of a declaration after `type Identifier`
+    def parseDeclaration(self, type: TypeLiteral, ident: Identifier) -> Declaration:
+        if self.tok.type == "Assign":
+            self.advance()
+            return Declaration(type, ident, self.parseExpression(), None)
+        if self.tok.type == "LBracket":
+            dims = self.parseDimList()
+            if self.tok.type == "Assign":
+                self.advance()
+                return Declaration(type, ident, self.parseInitList(), dims)
+            return Declaration(type, ident, None, dims)
+        return Declaration(type, ident, None, None)
+
+    # init_list : LBrace Integer (Comma Integer)* RBrace
+    def parseInitList(self) -> InitList:
+        self.expect("LBrace")
+        elems = [self.expect("Integer").value]
+        while self.tok.type == "Comma":
+            self.advance()
+            elems.append(self.expect("Integer").value)
+        self.expect("RBrace")
+        return InitList(elems)
+
+    # the rest of a block after LBrace, empty statements are left out
+    def parseBlock(self) -> Block:
+        block = Block()
+        children = block.children
+        while self.tok.type != "RBrace":
+            if self.tok is _END:
+                self.syntaxError()
+            if self.tok.type == "Int":
+                self.advance()
+                item = self.parseDeclaration(TInt(), self.expect("Identifier").value)
+                self.expect("Semi")
+            else:
+                item = self.parseStatement()
+            if item is not NULL:
+                children.append(item)
+        self.advance()
+        return block
+
+    def parseStatement(self) -> Union[Statement, Expression, NullType]:
+        type = self.tok.type
+        if type == "If":
+            return self.parseIf()
+        if type == "While":
+            self.advance()
+            self.expect("LParen")
+            cond = self.parseExpression()
+            self.expect("RParen")
+            return While(cond, self.parseStatement())
+        if type == "For":
+            self.advance()
+            self.expect("LParen")
+            if self.tok.type == "Int":
+                self.advance()
+                init = self.parseDeclaration(TInt(), self.expect("Identifier").value)
+            else:
+                init = self.parseOptExpression()
+            self.expect("Semi")
+            cond = self.parseOptExpression()
+            self.expect("Semi")
+            update = self.parseOptExpression()
+            self.expect("RParen")
+            return For(init, cond, update, self.parseStatement())
+        if type == "Return":
+            self.advance()
+            expr = self.parseExpression()
+            self.expect("Semi")
+            return Return(expr)
+        if type == "LBrace":
+            self.advance()
+            return self.parseBlock()
+        if type == "Break":
+            self.advance()
+            self.expect("Semi")
+            return Break()
+        if type == "Continue":
+            self.advance()
+            self.expect("Semi")
+            return Continue()
+        expr = self.parseOptExpression()
+        self.expect("Semi")
+        return expr
+
+    # if ... else if ... else ..., where the `else if`s are nested in the else branches
+    def parseIf(self) -> If:
+        arms = []
+        otherwise = None
+        while True:
+            self.advance()
+            self.expect("LParen")
+            cond = self.parseExpression()
+            self.expect("RParen")
+            arms.append((cond, self.parseStatement()))
+            if self.tok.type != "Else":
+                break
+            self.advance()
+            if self.tok.type != "If":
+                otherwise = self.parseStatement()
+                break
+        for cond, then in reversed(arms):
+            otherwise = If(cond, then, otherwise)
+        return otherwise
+
+    def parseOptExpression(self) -> Union[Expression, NullType]:
+        if self.tok.type == "Semi" or self.tok.type == "RParen":
+            return NULL
+        return self.parseExpression()
+
+    # expression : (postfix Assign)* conditional
+    def parseExpression(self) -> Expression:
+        targets = []
+        while True:
+            if self.tok.type in UNARY_OPS:
+                expr = self.parseUnary()
+                break
+            expr = self.parsePostfix()
+            if self.tok.type != "Assign":
+                break
+            self.advance()
+            targets.append(expr)
+        expr = self.parseConditionalRest(self.parseBinary(expr, 1))
+        for target in reversed(targets):
+            expr = Assignment(target, expr)
+        return expr
+
+    # conditional : logical_or [Question expression Colon conditional]
+    def parseConditional(self) -> Expression:
+        return self.parseConditionalRest(self.parseBinary(self.parseUnary(), 1))
+
+    def parseConditionalRest(self, cond: Expression) -> Expression:
+        if self.tok.type != "Question":
+            return cond
+        self.advance()
+        then = self.parseExpression()
+        self.expect("Colon")
+        return ConditionExpression(cond, then, self.parseConditional())
+
+    #! 优先级爬升: 只处理优先级不低于 minPrec 的二元运算符
+    def parseBinary(self, lhs: Expression, minPrec: int) -> Expression:
+        while True:
+            entry = BINARY_OPS.get(self.tok.type)
+            if entry is None or entry[0] < minPrec:
+                return lhs
+            prec, op = entry
+            self.advance()
+            rhs = self.parseUnary()
+            while True:
+                next = BINARY_OPS.get(self.tok.type)
+                if next is None or next[0] <= prec:
+                    break
+                rhs = self.parseBinary(rhs, prec + 1)
+            lhs = Binary(op, lhs, rhs)
+
+    # unary : (Minus | BitNot | Not)* postfix
+    def parseUnary(self) -> Expression:
+        ops = []
+        while self.tok.type in UNARY_OPS:
+            ops.append(UNARY_OPS[self.advance().type])
+        expr = self.parsePostfix()
+        for op in reversed(ops):
+            expr = Unary(op, expr)
+        return expr
+
+    # postfix : (Identifier LParen expression_list RParen | primary) (LBracket expression RBracket)*
+    def parsePostfix(self) -> Expression:
+        while True:
+            t = self.tok
+            if t.type == "Identifier":
+                self.advance()
+                if self.tok.type == "LParen":
+                    self.advance()
+                    expr = Call(t.value, self.parseExpressionList())
+                    self.expect("RParen")
+                else:
+                    expr = t.value
+                break
+            if t.type == "Integer":
+                self.advance()
+                expr = t.value
+                break
+            if t.type == "LParen":
+                self.advance()
+                expr = self.parseExpression()
+                self.expect("RParen")
+                break
+            self.syntaxError()
+        while self.tok.type == "LBracket":
+            self.advance()
+            index = self.parseExpression()
+            self.expect("RBracket")
+            expr = IndexExpr(expr, index)
+        return expr
+
+    # expression_list : [expression] (Comma expression)*, the first one can be left out like a parameter
+    def parseExpressionList(self) -> ExpressionList:
+        args = ExpressionList()
+        if self.tok.type != "RParen" and self.tok.type != "Comma":
+            args.children.append(self.parseExpression())
+        while self.tok.type == "Comma":
+            self.advance()
+            args.children.append(self.parseExpression())
+        return args
+
+
+parser = RDParser()
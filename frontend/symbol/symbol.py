@@ -21,6 +21,13 @@ class Symbol(ABC):
     def __str__(self) -> str:
         raise NotImplementedError()
 
+    # The defining scope is left out when pickling (e.g. sending TAC to a backend worker process),
+    # otherwise the whole symbol table would be dragged along.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("definedIn", None)
+        return state
+
     # To set which scope is this symbol belonged to.
     def setDomain(self, scope) -> None:
         self.definedIn = scope
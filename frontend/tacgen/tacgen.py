@@ -2,9 +2,9 @@ from typing import Dict
 
 from frontend.ast.node import Optional
 from frontend.ast.tree import Function, Optional
-from frontend.ast import node
+from frontend.ast import node, tree
 from frontend.ast.tree import *
-from frontend.ast.visitor import Visitor
+from frontend.ast.visitor import IterativeVisitor, Step
 from frontend.symbol.varsymbol import VarSymbol
 from frontend.type.array import ArrayType
 from utils.label.blocklabel import BlockLabel
@@ -24,16 +24,18 @@ The TAC generation phase: translate the abstract syntax tree into three-address
 #! 用于生成唯一的标签
 class LabelManager:
     """
-    A global label manager (just a counter).
-    We use this to create unique (block) labels accross functions.
+    A label manager of a function (just a counter).
+    Labels are prefixed with the function name, so they are unique accross functions
+    while only depending on the function itself (which allows caching the code of a function).
     """
 
-    def __init__(self):
+    def __init__(self, prefix: str):
+        self.prefix = prefix
         self.nextTempLabelId = 0
 
     def freshLabel(self) -> BlockLabel:
         self.nextTempLabelId += 1
-        return BlockLabel(str(self.nextTempLabelId))
+        return BlockLabel("{}_{}".format(self.prefix, self.nextTempLabelId))
 
 #! 从一个 AST 函数生成 TAC 指令
 class TACFuncEmitter(TACVisitor):
@@ -52,16 +54,13 @@ class TACFuncEmitter(TACVisitor):
         self.labelManager = labelManager
         self.func = TACFunc(entry, numArgs, arrays, p_arrays)
         self.visitLabel(entry)
-        self.nextTempId = 0
 
         self.continueLabelStack = []
         self.breakLabelStack = []
 
     # To get a fresh new temporary variable.
     def freshTemp(self) -> Temp:
-        temp = Temp(self.nextTempId)
-        self.nextTempId += 1
-        return temp
+        return self.func.freshTemp()
 
     # To get a fresh new label (for jumping and branching, etc).
     def freshLabel(self) -> Label:
@@ -69,7 +68,7 @@ class TACFuncEmitter(TACVisitor):
 
     # To count how many temporary variables have been used.
     def getUsedTemp(self) -> int:
-        return self.nextTempId
+        return len(self.func.temps)
 
     # The following methods can be named 'appendXXX' to add an instruction to the current function.
     def visitAssignment(self, dst: Temp, src: Temp) -> Temp:
@@ -170,37 +169,41 @@ class TACFuncEmitter(TACVisitor):
         return self.continueLabelStack[-1]
 
 
-class TACGen(Visitor[TACFuncEmitter, None]):
+class TACGen(IterativeVisitor[TACFuncEmitter, None]):
     # Entry of this phase
     def transform(self, program: Program) -> TACProg:
-        labelManager = LabelManager()
         tacFuncs = []
         tacGlobalVars = program.globalVars()
-        for funcName, astFunc in program.functions().items():
-            # in step9, you need to use real parameter count
-            emitter = TACFuncEmitter(FuncLabel(funcName), len(astFunc.params.children), astFunc.arrays, astFunc.p_arrays, labelManager)
-            for child in astFunc.params.children:
-                child.accept(self, emitter)
-            astFunc.body.accept(self, emitter)
-            tacFuncs.append(emitter.visitEnd())
+        for astFunc in program.functions().values():
+            tacFuncs.append(self.transformFunc(astFunc))
         return TACProg(tacFuncs, tacGlobalVars)
 
-    def visitBlock(self, block: Block, mv: TACFuncEmitter) -> None:
+    # Translate a single function, so that functions can be handled one at a time
+    def transformFunc(self, astFunc: Function) -> TACFunc:
+        # in step9, you need to use real parameter count
+        funcName = astFunc.ident.value
+        emitter = TACFuncEmitter(FuncLabel(funcName), len(astFunc.params.children), astFunc.arrays, astFunc.p_arrays, LabelManager(funcName))
+        for child in astFunc.params.children:
+            self.visit(child, emitter)
+        self.visit(astFunc.body, emitter)
+        return emitter.visitEnd()
+
+    def visitBlock(self, block: Block, mv: TACFuncEmitter) -> Step:
         for child in block:
-            child.accept(self, mv)
+            yield child
 
     def visitParameter(self, param: Parameter, mv: TACFuncEmitter) -> None:
         param.getattr('symbol').temp = mv.freshTemp()
 
-    def visitCall(self, call: Call, mv: TACFuncEmitter) -> None:
+    def visitCall(self, call: Call, mv: TACFuncEmitter) -> Step:
         for arg in call.args.children:
-            arg.accept(self, mv)
+            yield arg
         for arg in call.args.children:
             mv.visitParam(arg.getattr("val"))
         call.setattr('val', mv.visitCall(FuncLabel(call.ident.value)))
 
-    def visitReturn(self, stmt: Return, mv: TACFuncEmitter) -> None:
-        stmt.expr.accept(self, mv)
+    def visitReturn(self, stmt: Return, mv: TACFuncEmitter) -> Step:
+        yield stmt.expr
         mv.visitReturn(stmt.expr.getattr("val"))
 
     def visitBreak(self, stmt: Break, mv: TACFuncEmitter) -> None:
@@ -223,7 +226,7 @@ class TACGen(Visitor[TACFuncEmitter, None]):
             ident.setattr('val', symbol.temp)
         # 设置返回值为标识符对应的 temp 寄存器
 
-    def visitDeclaration(self, decl: Declaration, mv: TACFuncEmitter) -> None:
+    def visitDeclaration(self, decl: Declaration, mv: TACFuncEmitter) -> Step:
         decl.getattr("symbol").temp = mv.freshTemp()
         if decl.init_expr:
             if isinstance(decl.init_expr, InitList):
@@ -241,16 +244,16 @@ class TACGen(Visitor[TACFuncEmitter, None]):
                     mv.visitBinarySelf(tacop.TacBinaryOp.ADD, addr, interval)
             else:
                 #! 对子节点进行 accept
-                decl.init_expr.accept(self, mv)
+                yield decl.init_expr
                 #! 模仿 `visitAssignment` 函数进行赋值
                 decl.setattr(
                     "val", mv.visitAssignment(decl.getattr("symbol").temp, decl.init_expr.getattr("val"))
                 )            
 
-    def visitIndexExpr(self, expr: IndexExpr, mv: TACFuncEmitter) -> None:
+    def visitIndexExpr(self, expr: IndexExpr, mv: TACFuncEmitter) -> Step:
         expr.base.setattr('slice', True)
-        expr.base.accept(self, mv)
-        expr.index.accept(self, mv)
+        yield expr.base
+        yield expr.index
         #! 递归计算偏移量
         addr = mv.visitLoad(expr.getattr('type').size)
         mv.visitBinarySelf(tacop.TacBinaryOp.MUL, addr, expr.index.getattr('val'))
@@ -260,83 +263,75 @@ class TACGen(Visitor[TACFuncEmitter, None]):
         if not expr.getattr('slice'):
             expr.setattr('val', mv.visitLoadByAddress(addr))
 
-    def visitAssignment(self, expr: Assignment, mv: TACFuncEmitter) -> None:
+    def visitAssignment(self, expr: Assignment, mv: TACFuncEmitter) -> Step:
         #! 对右值进行 accept
-        expr.rhs.accept(self, mv)
+        yield expr.rhs
         #! 左值是数组元素
         if isinstance(expr.lhs, IndexExpr):
             expr.lhs.setattr('slice', True)
-            expr.lhs.accept(self, mv)
+            yield expr.lhs
             mv.visitStoreByAddress(expr.rhs.getattr('val'), expr.lhs.getattr('addr'))
         #! 左值是全局变量
         elif expr.lhs.getattr('symbol').isGlobal:
             mv.visitStoreIntLiteral(expr.lhs.getattr('symbol'), expr.rhs.getattr("val"))
         else:
-            expr.lhs.accept(self, mv)
+            yield expr.lhs
             #! 设置返回值为赋值指令的返回值, 赋值操作更新左值, 左端项是左值 temp
             mv.visitAssignment(expr.lhs.getattr("symbol").temp, expr.rhs.getattr("val"))
         expr.setattr('val', expr.rhs.getattr("val"))
 
-    def visitIf(self, stmt: If, mv: TACFuncEmitter) -> None:
-        stmt.cond.accept(self, mv)
-
+    def visitIf(self, stmt: If, mv: TACFuncEmitter) -> Step:
         if stmt.otherwise is NULL:
             skipLabel = mv.freshLabel()
-            mv.visitCondBranch(
-                tacop.CondBranchOp.BEQ, stmt.cond.getattr("val"), skipLabel
-            )
-            stmt.then.accept(self, mv)
+            yield self.visitCondJump(stmt.cond, mv, skipLabel)
+            yield stmt.then
             mv.visitLabel(skipLabel)
         else:
             skipLabel = mv.freshLabel()
             exitLabel = mv.freshLabel()
-            mv.visitCondBranch(
-                tacop.CondBranchOp.BEQ, stmt.cond.getattr("val"), skipLabel
-            )
-            stmt.then.accept(self, mv)
+            yield self.visitCondJump(stmt.cond, mv, skipLabel)
+            yield stmt.then
             mv.visitBranch(exitLabel)
             mv.visitLabel(skipLabel)
-            stmt.otherwise.accept(self, mv)
+            yield stmt.otherwise
             mv.visitLabel(exitLabel)
 
-    def visitWhile(self, stmt: While, mv: TACFuncEmitter) -> None:
+    def visitWhile(self, stmt: While, mv: TACFuncEmitter) -> Step:
         beginLabel = mv.freshLabel()
         loopLabel = mv.freshLabel()
         breakLabel = mv.freshLabel()
         mv.openLoop(breakLabel, loopLabel)
 
         mv.visitLabel(beginLabel)
-        stmt.cond.accept(self, mv)
-        mv.visitCondBranch(tacop.CondBranchOp.BEQ, stmt.cond.getattr("val"), breakLabel)
+        yield self.visitCondJump(stmt.cond, mv, breakLabel)
 
-        stmt.body.accept(self, mv)
+        yield stmt.body
         mv.visitLabel(loopLabel)
         mv.visitBranch(beginLabel)
         mv.visitLabel(breakLabel)
         mv.closeLoop()
 
-    def visitFor(self, stmt: For, mv: TACFuncEmitter) -> None:
+    def visitFor(self, stmt: For, mv: TACFuncEmitter) -> Step:
         beginLabel = mv.freshLabel()
         loopLabel = mv.freshLabel()
         breakLabel = mv.freshLabel()
         mv.openLoop(breakLabel, loopLabel)
 
-        stmt.init.accept(self, mv)
+        yield stmt.init
         mv.visitLabel(beginLabel)
         #! cond 可能为空
         if stmt.cond:
-            stmt.cond.accept(self, mv)
-            mv.visitCondBranch(tacop.CondBranchOp.BEQ, stmt.cond.getattr("val"), breakLabel)
+            yield self.visitCondJump(stmt.cond, mv, breakLabel)
 
-        stmt.body.accept(self, mv)
+        yield stmt.body
         mv.visitLabel(loopLabel)
-        stmt.update.accept(self, mv)
+        yield stmt.update
         mv.visitBranch(beginLabel)
         mv.visitLabel(breakLabel)
         mv.closeLoop()
 
-    def visitUnary(self, expr: Unary, mv: TACFuncEmitter) -> None:
-        expr.operand.accept(self, mv)
+    def visitUnary(self, expr: Unary, mv: TACFuncEmitter) -> Step:
+        yield expr.operand
         op = {
             node.UnaryOp.Neg: tacop.TacUnaryOp.NEG,
             node.UnaryOp.BitNot: tacop.TacUnaryOp.BIT_NOT,
@@ -345,17 +340,25 @@ class TACGen(Visitor[TACFuncEmitter, None]):
         }[expr.op]
         expr.setattr("val", mv.visitUnary(op, expr.operand.getattr("val")))
 
-    def visitBinary(self, expr: Binary, mv: TACFuncEmitter) -> None:
-        expr.lhs.accept(self, mv)
-        expr.rhs.accept(self, mv)
+    def visitBinary(self, expr: Binary, mv: TACFuncEmitter) -> Step:
+        #! 逻辑运算短路求值: 结果先置 0, 条件成立时再置 1
+        if expr.op in (node.BinaryOp.LogicAnd, node.BinaryOp.LogicOr):
+            exitLabel = mv.freshLabel()
+            temp = mv.visitLoad(0)
+            yield self.visitCondJump(expr, mv, exitLabel)
+            mv.visitRaw(LoadImm4(temp, 1))
+            mv.visitLabel(exitLabel)
+            expr.setattr("val", temp)
+            return
+
+        yield expr.lhs
+        yield expr.rhs
         op = {
             node.BinaryOp.Add: tacop.TacBinaryOp.ADD,
             node.BinaryOp.Sub: tacop.TacBinaryOp.SUB,
             node.BinaryOp.Mul: tacop.TacBinaryOp.MUL,
             node.BinaryOp.Div: tacop.TacBinaryOp.DIV,
             node.BinaryOp.Mod: tacop.TacBinaryOp.MOD,
-            node.BinaryOp.LogicOr: tacop.TacBinaryOp.LOR,
-            node.BinaryOp.LogicAnd: tacop.TacBinaryOp.LAND,
             node.BinaryOp.EQ: tacop.TacBinaryOp.EQU,
             node.BinaryOp.NE: tacop.TacBinaryOp.NEQ,
             node.BinaryOp.LT: tacop.TacBinaryOp.SLT,
@@ -368,22 +371,44 @@ class TACGen(Visitor[TACFuncEmitter, None]):
             "val", mv.visitBinary(op, expr.lhs.getattr("val"), expr.rhs.getattr("val"))
         )
 
-    def visitCondExpr(self, expr: ConditionExpression, mv: TACFuncEmitter) -> None:
-        expr.cond.accept(self, mv)
+    def visitCondExpr(self, expr: ConditionExpression, mv: TACFuncEmitter) -> Step:
         skipLabel = mv.freshLabel()
         exitLabel = mv.freshLabel()
-        exprVal = expr.cond.getattr("val")
-        mv.visitCondBranch(
-            tacop.CondBranchOp.BEQ, exprVal, skipLabel
-        )
-        expr.then.accept(self, mv)
+        #! 结果存入新的 temp, 避免覆盖条件表达式对应的变量
+        exprVal = mv.freshTemp()
+        yield self.visitCondJump(expr.cond, mv, skipLabel)
+        yield expr.then
         mv.visitAssignment(exprVal, expr.then.getattr("val"))
         mv.visitBranch(exitLabel)
         mv.visitLabel(skipLabel)
-        expr.otherwise.accept(self, mv)
+        yield expr.otherwise
         mv.visitAssignment(exprVal, expr.otherwise.getattr("val"))
         mv.visitLabel(exitLabel)
         expr.setattr("val", exprVal)
 
     def visitIntLiteral(self, expr: IntLiteral, mv: TACFuncEmitter) -> None:
         expr.setattr("val", mv.visitLoad(expr.value))
+
+    def visitCondJump(self, cond: Expression, mv: TACFuncEmitter, target: Label, onTrue: bool = False) -> Step:
+        """
+        Translate `cond` used as a branching condition:
+        jump to `target` if its truth value equals `onTrue`, otherwise fall through.
+        `&&`, `||` and `!` are lowered into control flow, so operands are only evaluated when needed.
+        """
+        if isinstance(cond, tree.Binary) and cond.op in (node.BinaryOp.LogicAnd, node.BinaryOp.LogicOr):
+            #! `a && b` 为假或 `a || b` 为真: 任一操作数满足即可跳转
+            if (cond.op == node.BinaryOp.LogicOr) == onTrue:
+                yield self.visitCondJump(cond.lhs, mv, target, onTrue)
+                yield self.visitCondJump(cond.rhs, mv, target, onTrue)
+            #! 否则左操作数已决定结果时直接跳过右操作数
+            else:
+                skipLabel = mv.freshLabel()
+                yield self.visitCondJump(cond.lhs, mv, skipLabel, not onTrue)
+                yield self.visitCondJump(cond.rhs, mv, target, onTrue)
+                mv.visitLabel(skipLabel)
+        elif isinstance(cond, tree.Unary) and cond.op == node.UnaryOp.LogicNot:
+            yield self.visitCondJump(cond.operand, mv, target, not onTrue)
+        else:
+            yield cond
+            op = tacop.CondBranchOp.BNE if onTrue else tacop.CondBranchOp.BEQ
+            mv.visitCondBranch(op, cond.getattr("val"), target)
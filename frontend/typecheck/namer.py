@@ -2,7 +2,7 @@ from typing import Protocol, TypeVar, cast
 
 from frontend.ast.node import Node, NullType
 from frontend.ast.tree import *
-from frontend.ast.visitor import RecursiveVisitor, Visitor
+from frontend.ast.visitor import IterativeVisitor, RecursiveVisitor, Step, Visitor
 from frontend.scope.globalscope import GlobalScope
 from frontend.scope.scope import Scope, ScopeKind
 from frontend.scope.scopestack import ScopeStack
@@ -20,7 +20,7 @@ syntax tree and store them in symbol tables (i.e. scopes).
 """
 
 
-class Namer(Visitor[ScopeStack, None]):
+class Namer(IterativeVisitor[ScopeStack, None]):
     def __init__(self) -> None:
         self.arrays = {}
         self.p_arrays = []
@@ -30,18 +30,18 @@ class Namer(Visitor[ScopeStack, None]):
         program.globalScope = GlobalScope
         ctx = ScopeStack(program.globalScope)
 
-        program.accept(self, ctx)
+        self.visit(program, ctx)
         return program
 
-    def visitProgram(self, program: Program, ctx: ScopeStack) -> None:
+    def visitProgram(self, program: Program, ctx: ScopeStack) -> Step:
         #! Check if the 'main' function is missing
         if not program.hasMainFunc():
             raise DecafNoMainFuncError()
 
         for func in program.children:
-            func.accept(self, ctx)
+            yield func
 
-    def visitFunction(self, func: Function, ctx: ScopeStack) -> None:
+    def visitFunction(self, func: Function, ctx: ScopeStack) -> Step:
         if GlobalScope.lookup(func.ident.value):
             raise DecafDeclConflictError(func.ident.value)
         symbol = FuncSymbol(func.ident.value, func.ret_t.type, GlobalScope)
@@ -53,22 +53,22 @@ class Namer(Visitor[ScopeStack, None]):
         ctx.open()
         self.arrays = {}
         self.p_arrays = []
-        func.params.accept(self, ctx)
+        yield func.params
         for index, param in enumerate(func.params.children):
             if isinstance(param.ident.getattr('type'), ArrayType):
                 self.p_arrays.append(param.getattr('symbol'))
         for child in func.body.children:
-            child.accept(self, ctx)
+            yield child
         func.arrays = self.arrays
         self.arrays = {}
         func.p_arrays = self.p_arrays
         self.p_arrays = []
         ctx.close()
 
-    def visitBlock(self, block: Block, ctx: ScopeStack) -> None:
+    def visitBlock(self, block: Block, ctx: ScopeStack) -> Step:
         ctx.open()
         for child in block:
-            child.accept(self, ctx)
+            yield child
         ctx.close()
 
     def visitParameter(self, param: Parameter, ctx: ScopeStack) -> None:
@@ -88,15 +88,15 @@ class Namer(Visitor[ScopeStack, None]):
         param.setattr("symbol", symbol)
         param.ident.setattr('type', symbol.type)
 
-    def visitParameterList(self, params: ParameterList, ctx: ScopeStack) -> None:
+    def visitParameterList(self, params: ParameterList, ctx: ScopeStack) -> Step:
         for param in params.children:
-            param.accept(self, ctx)
+            yield param
 
-    def visitExpressionList(self, exprs: ExpressionList, ctx: ScopeStack) -> None:
+    def visitExpressionList(self, exprs: ExpressionList, ctx: ScopeStack) -> Step:
         for expr in exprs.children:
-            expr.accept(self, ctx)
+            yield expr
 
-    def visitCall(self, call: Call, ctx: ScopeStack) -> None:
+    def visitCall(self, call: Call, ctx: ScopeStack) -> Step:
         if ctx.lookup(call.ident.value):
             raise DecafBadFuncCallError(call.ident.value)
 
@@ -109,36 +109,36 @@ class Namer(Visitor[ScopeStack, None]):
         call.ident.setattr('symbol', func)
         call.setattr('type', func.type)
         for arg in call.args:
-            arg.accept(self, ctx)
+            yield arg
 
-    def visitReturn(self, stmt: Return, ctx: ScopeStack) -> None:
-        stmt.expr.accept(self, ctx)
+    def visitReturn(self, stmt: Return, ctx: ScopeStack) -> Step:
+        yield stmt.expr
         if stmt.expr.getattr('type') != INT:
             raise DecafBadReturnTypeError()
 
-    def visitFor(self, stmt: For, ctx: ScopeStack) -> None:
+    def visitFor(self, stmt: For, ctx: ScopeStack) -> Step:
         ctx.open()
-        stmt.init.accept(self, ctx)
-        stmt.cond.accept(self, ctx)
-        stmt.update.accept(self, ctx)
+        yield stmt.init
+        yield stmt.cond
+        yield stmt.update
         #! check the validity of `Break` or `Continue`
         ctx.enterLoop()
-        stmt.body.accept(self, ctx)
+        yield stmt.body
         ctx.exitLoop()
         ctx.close()
 
-    def visitIf(self, stmt: If, ctx: ScopeStack) -> None:
-        stmt.cond.accept(self, ctx)
-        stmt.then.accept(self, ctx)
+    def visitIf(self, stmt: If, ctx: ScopeStack) -> Step:
+        yield stmt.cond
+        yield stmt.then
 
         # check if the else branch exists
         if not stmt.otherwise is NULL:
-            stmt.otherwise.accept(self, ctx)
+            yield stmt.otherwise
 
-    def visitWhile(self, stmt: While, ctx: ScopeStack) -> None:
-        stmt.cond.accept(self, ctx)
+    def visitWhile(self, stmt: While, ctx: ScopeStack) -> Step:
+        yield stmt.cond
         ctx.enterLoop()
-        stmt.body.accept(self, ctx)
+        yield stmt.body
         ctx.exitLoop()
 
     def visitBreak(self, stmt: Break, ctx: ScopeStack) -> None:
@@ -150,7 +150,7 @@ class Namer(Visitor[ScopeStack, None]):
         if not ctx.insideLoop():
             raise DecafContinueOutsideLoopError()
 
-    def visitDeclaration(self, decl: Declaration, ctx: ScopeStack) -> None:
+    def visitDeclaration(self, decl: Declaration, ctx: ScopeStack) -> Step:
         #! decl.ident.value 是变量名字符串
         if ctx.lookup(decl.ident.value):
             raise DecafDeclConflictError(decl.ident.value)
@@ -175,43 +175,43 @@ class Namer(Visitor[ScopeStack, None]):
         decl.setattr("type", symbol.type)
         decl.ident.type = symbol.type
         if decl.init_expr:
-            decl.init_expr.accept(self, ctx)
+            yield decl.init_expr
 
-    def visitIndexExpr(self, expr: IndexExpr, ctx: ScopeStack) -> None:
+    def visitIndexExpr(self, expr: IndexExpr, ctx: ScopeStack) -> Step:
         if isinstance(expr.base, Identifier) and not ctx.lookupOverStack(expr.base.value):
             raise DecafUndefinedVarError(expr.base.value)
-        expr.base.accept(self, ctx)
-        expr.index.accept(self, ctx)
+        yield expr.base
+        yield expr.index
         #! 根据 base 类型设置 expr 的类型
         if isinstance(expr.base, Identifier):
             expr.setattr('type', expr.base.getattr('symbol').type.indexed)
         else:
             expr.setattr('type', expr.base.getattr('type').indexed)
 
-    def visitAssignment(self, expr: Assignment, ctx: ScopeStack) -> None:
+    def visitAssignment(self, expr: Assignment, ctx: ScopeStack) -> Step:
         if (not isinstance(expr.lhs, Identifier)) and (not isinstance(expr.lhs, IndexExpr)):
             raise DecafBadAssignTypeError()
-        self.visitBinary(expr, ctx)
+        yield from self.visitBinary(expr, ctx)
 
-    def visitUnary(self, expr: Unary, ctx: ScopeStack) -> None:
-        expr.operand.accept(self, ctx)
+    def visitUnary(self, expr: Unary, ctx: ScopeStack) -> Step:
+        yield expr.operand
         if expr.operand.getattr('type') != INT:
             raise DecafTypeMismatchError()
         expr.setattr('type', INT)
 
-    def visitBinary(self, expr: Binary, ctx: ScopeStack) -> None:
-        expr.lhs.accept(self, ctx)
-        expr.rhs.accept(self, ctx)
+    def visitBinary(self, expr: Binary, ctx: ScopeStack) -> Step:
+        yield expr.lhs
+        yield expr.rhs
         if isinstance(expr.lhs.getattr('type'), ArrayType):
             raise DecafTypeMismatchError()
         if expr.lhs.getattr('type') != expr.rhs.getattr('type'):
             raise DecafTypeMismatchError()
         expr.setattr('type', expr.lhs.getattr('type'))
 
-    def visitCondExpr(self, expr: ConditionExpression, ctx: ScopeStack) -> None:
-        expr.cond.accept(self, ctx)
-        expr.then.accept(self, ctx)
-        expr.otherwise.accept(self, ctx)
+    def visitCondExpr(self, expr: ConditionExpression, ctx: ScopeStack) -> Step:
+        yield expr.cond
+        yield expr.then
+        yield expr.otherwise
         if expr.then.getattr('type') != expr.otherwise.getattr('type'):
             raise DecafTypeMismatchError()
         expr.setattr('type', INT)
@@ -1,17 +1,25 @@
 import argparse
 import sys
+from collections import Counter
+from contextlib import redirect_stdout
+from typing import BinaryIO, Optional, TextIO
 
 from backend.asm import Asm
+from backend.asmemitter import CodePrinter
 from backend.reg.bruteregalloc import BruteRegAlloc
 from backend.riscv.riscvasmemitter import RiscvAsmEmitter
 from frontend.ast.tree import Program
-from frontend.lexer import lexer
-from frontend.parser import parser
+from frontend.lexer import lexer, table_lexer
+from frontend.parser import ply_parser, rd_parser
 from frontend.tacgen.tacgen import TACGen
 from frontend.typecheck.namer import Namer
 from frontend.typecheck.typer import Typer
 from utils.printtree import TreePrinter
+from utils.funccache import FuncCache
+from utils.objcodeprinter import ObjCodePrinter
 from utils.riscv import Riscv
+from utils.tac.tacbinary import TACBinReader, TACBinWriter
+from utils.tac.tacfunc import TACFunc
 from utils.tac.tacprog import TACProg
 
 memsetFunc = r"""
@@ -29,7 +37,32 @@ def parseArgs():
     parser.add_argument("--parse", action="store_true", help="output parsed AST")
     parser.add_argument("--tac", action="store_true", help="output transformed TAC")
     parser.add_argument("--riscv", action="store_true", help="output generated RISC-V")
-    return parser.parse_args()
+    parser.add_argument("--obj", action="store_true", help="output generated RISC-V as an ELF relocatable object")
+    parser.add_argument("--emit-tac-bin", action="store_true", help="output transformed TAC in a binary format")
+    parser.add_argument("--from-tac-bin", type=str, help="start from a binary TAC file instead of the input C file")
+    parser.add_argument("--lexer", choices=["ply", "table"], default="ply", help="the lexer to use (default: ply)")
+    parser.add_argument(
+        "--parser",
+        choices=["ply", "rd"],
+        default="ply",
+        help="the parser to use (default: ply), rd is faster but recurses on deeply nested code",
+    )
+    parser.add_argument("-o", "--output", type=str, help="the output file (default: stdout)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of processes for generating RISC-V")
+    parser.add_argument("--cache", type=str, help="directory to cache the RISC-V code of each function")
+    parser.add_argument("--stats", action="store_true", help="print statistics of the generated code to stderr")
+    args = parser.parse_args()
+    # workers and the cache pass around assembly code, which can not be put into an object
+    if args.obj and (args.jobs != 1 or args.cache is not None):
+        parser.error("--obj can not be used with --jobs or --cache")
+    # the statistics are gathered by the register allocator, which runs in the workers with --jobs,
+    # and doesn't run at all for the functions found in the cache
+    if args.stats and (args.jobs != 1 or args.cache is not None):
+        parser.error("--stats can not be used with --jobs or --cache")
+    # the frontend is skipped, so there is no AST to output or to cache by
+    if args.from_tac_bin and (args.parse or args.cache is not None):
+        parser.error("--from-tac-bin can not be used with --parse or --cache")
+    return args
 
 
 def readCode(fileName):
@@ -40,7 +73,8 @@ def readCode(fileName):
 # The parser stage: MiniDecaf code -> Abstract syntax tree
 def step_parse(args: argparse.Namespace):
     code = memsetFunc + "\n" + readCode(args.input)
-    r: Program = parser.parse(code, lexer=lexer)
+    parser = rd_parser if args.parser == "rd" else ply_parser
+    r: Program = parser.parse(code, lexer=table_lexer if args.lexer == "table" else lexer)
 
     errors = parser.error_stack
     if errors:
@@ -50,25 +84,105 @@ def step_parse(args: argparse.Namespace):
     return r
 
 
-# IR generation stage: Abstract syntax tree -> Three-address code
-def step_tac(p: Program):
+# Semantic analysis stage: resolve symbols and check types of the whole program
+def step_check(p: Program):
     namer = Namer()
     p = namer.transform(p)
     typer = Typer()
     p = typer.transform(p)
 
+    return p
+
+
+# IR generation stage: Abstract syntax tree -> Three-address code
+def step_tac(p: Program):
+    p = step_check(p)
+
     tacgen = TACGen()
     tac_prog = tacgen.transform(p)
 
     return tac_prog
 
 
+# IR generation stage, writing the TAC in the binary format (see `TACBinWriter`) function by function
+def step_tac_bin(p: Program, output: BinaryIO):
+    p = step_check(p)
+
+    tacgen = TACGen()
+    writer = TACBinWriter(output, p.globalVars())
+    for astFunc in p.takeFunctions():
+        writer.writeFunc(tacgen.transformFunc(astFunc))
+    writer.close()
+
+
 # Target code generation stage: Three-address code -> RISC-V assembly code
-def step_asm(p: TACProg):
-    riscvAsmEmitter = RiscvAsmEmitter(Riscv.AllocatableRegs, Riscv.CallerSaved, p.vars)
-    asm = Asm(riscvAsmEmitter, BruteRegAlloc(riscvAsmEmitter))
-    prog = asm.transform(p)
-    return prog
+# the code is written to `output` function by function if given, otherwise returned as a string
+# `jobs`, `printer` and `stats` are as in `step_pipeline`
+def step_asm(
+    p: TACProg,
+    output: Optional[TextIO] = None,
+    jobs: int = 1,
+    printer: Optional[CodePrinter] = None,
+    stats: Optional[Counter] = None,
+):
+    riscvAsmEmitter = RiscvAsmEmitter(Riscv.AllocatableRegs, Riscv.CallerSaved, p.vars, output, printer)
+    asm = Asm(riscvAsmEmitter, BruteRegAlloc(riscvAsmEmitter, stats))
+    if jobs == 1:
+        return asm.transform(p)
+    asm.transformFuncs(p.funcs, jobs)
+    return riscvAsmEmitter.emitEnd()
+
+
+# The whole compilation after parsing, done function by function:
+# each function goes through TAC generation and code generation, and its AST/TAC/CFG are released
+# once its asm code is written out, so that only a single function is alive at a time
+# with `jobs` > 1, code generation of the functions is spread over a pool of processes
+# with `cacheDir`, the code of functions unchanged since the last compilation is taken from the cache
+# with `printer` (e.g. an ObjCodePrinter), the code goes to it instead of `output`
+# with `stats`, the statistics of the code generated (in this process) are added to it
+def step_pipeline(
+    p: Program,
+    output: Optional[TextIO] = None,
+    jobs: int = 1,
+    cacheDir: Optional[str] = None,
+    printer: Optional[CodePrinter] = None,
+    stats: Optional[Counter] = None,
+):
+    p = step_check(p)
+
+    tacgen = TACGen()
+    riscvAsmEmitter = RiscvAsmEmitter(Riscv.AllocatableRegs, Riscv.CallerSaved, p.globalVars(), output, printer)
+    asm = Asm(riscvAsmEmitter, BruteRegAlloc(riscvAsmEmitter, stats))
+    if jobs == 1 and cacheDir is None:
+        for astFunc in p.takeFunctions():
+            asm.transformFunc(tacgen.transformFunc(astFunc))
+        return riscvAsmEmitter.emitEnd()
+
+    cache = FuncCache(cacheDir, "riscv") if cacheDir is not None else None
+    keys = {}
+
+    def funcs():
+        for astFunc in p.takeFunctions():
+            if cache is not None:
+                key = cache.keyOf(astFunc)
+                code = cache.load(key)
+                if code is not None:
+                    yield code
+                    continue
+                keys[astFunc.ident.value] = key
+            yield tacgen.transformFunc(astFunc)
+
+    def onGenerated(func: TACFunc, code: str):
+        if cache is not None:
+            cache.store(keys.pop(func.entry.name), code)
+
+    asm.transformFuncs(funcs(), jobs, onGenerated)
+    return riscvAsmEmitter.emitEnd()
+
+# print the statistics gathered with --stats, a counter per line
+def printStats(stats: Counter):
+    for name, value in sorted(stats.items()):
+        print("{}: {}".format(name, value), file=sys.stderr)
 
 # hope all of you happiness
 # enjoy potato chips
@@ -80,24 +194,56 @@ def main():
         r = step_parse(args)
         return r
 
+    # the TAC read from --from-tac-bin, whose functions are decoded one at a time
+    reader = TACBinReader(args.from_tac_bin) if args.from_tac_bin else None
+    stats = Counter() if args.stats else None
+
     def _tac():
+        if reader is not None:
+            return reader.prog()
         tac = step_tac(_parse())
         return tac
 
-    def _asm():
-        asm = step_asm(_tac())
+    def _asm(output: TextIO):
+        if reader is not None:
+            return step_asm(reader.prog(), output, args.jobs, stats=stats)
+        asm = step_pipeline(_parse(), output, args.jobs, args.cache, stats=stats)
         return asm
 
-    if args.riscv:
-        prog = _asm()
-        print(prog)
-    elif args.tac:
-        prog = _tac()
-        prog.printTo()
-    elif args.parse:
-        prog = _parse()
-        printer = TreePrinter(indentLen=2)
-        printer.work(prog)
+    if args.obj or args.emit_tac_bin:
+        output = open(args.output, "wb") if args.output else sys.stdout.buffer
+        if args.obj and reader is not None:
+            step_asm(reader.prog(), printer=ObjCodePrinter(output), stats=stats)
+        elif args.obj:
+            step_pipeline(_parse(), printer=ObjCodePrinter(output), stats=stats)
+        elif reader is not None:
+            writer = TACBinWriter(output, reader.vars)
+            for func in reader:
+                writer.writeFunc(func)
+            writer.close()
+        else:
+            step_tac_bin(_parse(), output)
+        if output is not sys.stdout.buffer:
+            output.close()
+        if stats is not None:
+            printStats(stats)
+        return
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    with redirect_stdout(output):
+        if args.riscv:
+            _asm(output)
+        elif args.tac:
+            prog = _tac()
+            prog.printTo()
+        elif args.parse:
+            prog = _parse()
+            printer = TreePrinter(indentLen=2)
+            printer.work(prog)
+    if output is not sys.stdout:
+        output.close()
+    if stats is not None:
+        printStats(stats)
 
     return
 
@@ -0,0 +1,39 @@
+// exit code: 144
+// call arguments that are a permutation of the caller's own parameters, so moving them into a0-a7 has cycles:
+// swaps, rotations, a full reversal of 8 registers, the same value passed several times, and constants mixed in
+
+int digits(int a, int b, int c) {
+    return a * 100 + b * 10 + c;
+}
+
+int eight(int a, int b, int c, int d, int e, int f, int g, int h) {
+    return a * 1 + b * 2 + c * 3 + d * 4 + e * 5 + f * 6 + g * 7 + h * 8;
+}
+
+int swap(int a, int b, int c) {
+    return digits(b, a, c);
+}
+
+int rotate(int a, int b, int c) {
+    return digits(c, a, b);
+}
+
+int reverse(int a, int b, int c, int d, int e, int f, int g, int h) {
+    return eight(h, g, f, e, d, c, b, a);
+}
+
+int shift(int a, int b, int c, int d, int e, int f, int g, int h) {
+    return eight(b, c, d, e, f, g, h, a) - eight(a, a, b, b, 1, c, c, 2);
+}
+
+int recurse(int a, int b, int c) {
+    if (a > 50) return a;
+    return recurse(digits(b, a, c) % 7 + a + 1, c, b) + digits(c, a, b) % 10;
+}
+
+int main() {
+    int r = swap(1, 2, 3) + rotate(4, 5, 6);
+    r = r + reverse(1, 2, 3, 4, 5, 6, 7, 8) + shift(1, 2, 3, 4, 5, 6, 7, 8);
+    r = r + recurse(1, 2, 3);
+    return r % 256;
+}
@@ -0,0 +1,116 @@
+// exit code: 73
+// large stack frames: a local array of more than 1 MiB, a frame of more than 2 KiB, and calls passing
+// more than 512 args, so that the offsets of the outgoing args, the params passed by stack and
+// the saved regs don't fit in 12-bit immediates (and are materialized in t0, which is never allocated)
+
+int many(
+    int p0, int p1, int p2, int p3, int p4, int p5, int p6, int p7, int p8, int p9, int p10,
+    int p11, int p12, int p13, int p14, int p15, int p16, int p17, int p18, int p19, int p20,
+    int p21, int p22, int p23, int p24, int p25, int p26, int p27, int p28, int p29, int p30,
+    int p31, int p32, int p33, int p34, int p35, int p36, int p37, int p38, int p39, int p40,
+    int p41, int p42, int p43, int p44, int p45, int p46, int p47, int p48, int p49, int p50,
+    int p51, int p52, int p53, int p54, int p55, int p56, int p57, int p58, int p59, int p60,
+    int p61, int p62, int p63, int p64, int p65, int p66, int p67, int p68, int p69, int p70,
+    int p71, int p72, int p73, int p74, int p75, int p76, int p77, int p78, int p79, int p80,
+    int p81, int p82, int p83, int p84, int p85, int p86, int p87, int p88, int p89, int p90,
+    int p91, int p92, int p93, int p94, int p95, int p96, int p97, int p98, int p99, int p100,
+    int p101, int p102, int p103, int p104, int p105, int p106, int p107, int p108, int p109,
+    int p110, int p111, int p112, int p113, int p114, int p115, int p116, int p117, int p118,
+    int p119, int p120, int p121, int p122, int p123, int p124, int p125, int p126, int p127,
+    int p128, int p129, int p130, int p131, int p132, int p133, int p134, int p135, int p136,
+    int p137, int p138, int p139, int p140, int p141, int p142, int p143, int p144, int p145,
+    int p146, int p147, int p148, int p149, int p150, int p151, int p152, int p153, int p154,
+    int p155, int p156, int p157, int p158, int p159, int p160, int p161, int p162, int p163,
+    int p164, int p165, int p166, int p167, int p168, int p169, int p170, int p171, int p172,
+    int p173, int p174, int p175, int p176, int p177, int p178, int p179, int p180, int p181,
+    int p182, int p183, int p184, int p185, int p186, int p187, int p188, int p189, int p190,
+    int p191, int p192, int p193, int p194, int p195, int p196, int p197, int p198, int p199,
+    int p200, int p201, int p202, int p203, int p204, int p205, int p206, int p207, int p208,
+    int p209, int p210, int p211, int p212, int p213, int p214, int p215, int p216, int p217,
+    int p218, int p219, int p220, int p221, int p222, int p223, int p224, int p225, int p226,
+    int p227, int p228, int p229, int p230, int p231, int p232, int p233, int p234, int p235,
+    int p236, int p237, int p238, int p239, int p240, int p241, int p242, int p243, int p244,
+    int p245, int p246, int p247, int p248, int p249, int p250, int p251, int p252, int p253,
+    int p254, int p255, int p256, int p257, int p258, int p259, int p260, int p261, int p262,
+    int p263, int p264, int p265, int p266, int p267, int p268, int p269, int p270, int p271,
+    int p272, int p273, int p274, int p275, int p276, int p277, int p278, int p279, int p280,
+    int p281, int p282, int p283, int p284, int p285, int p286, int p287, int p288, int p289,
+    int p290, int p291, int p292, int p293, int p294, int p295, int p296, int p297, int p298,
+    int p299, int p300, int p301, int p302, int p303, int p304, int p305, int p306, int p307,
+    int p308, int p309, int p310, int p311, int p312, int p313, int p314, int p315, int p316,
+    int p317, int p318, int p319, int p320, int p321, int p322, int p323, int p324, int p325,
+    int p326, int p327, int p328, int p329, int p330, int p331, int p332, int p333, int p334,
+    int p335, int p336, int p337, int p338, int p339, int p340, int p341, int p342, int p343,
+    int p344, int p345, int p346, int p347, int p348, int p349, int p350, int p351, int p352,
+    int p353, int p354, int p355, int p356, int p357, int p358, int p359, int p360, int p361,
+    int p362, int p363, int p364, int p365, int p366, int p367, int p368, int p369, int p370,
+    int p371, int p372, int p373, int p374, int p375, int p376, int p377, int p378, int p379,
+    int p380, int p381, int p382, int p383, int p384, int p385, int p386, int p387, int p388,
+    int p389, int p390, int p391, int p392, int p393, int p394, int p395, int p396, int p397,
+    int p398, int p399, int p400, int p401, int p402, int p403, int p404, int p405, int p406,
+    int p407, int p408, int p409, int p410, int p411, int p412, int p413, int p414, int p415,
+    int p416, int p417, int p418, int p419, int p420, int p421, int p422, int p423, int p424,
+    int p425, int p426, int p427, int p428, int p429, int p430, int p431, int p432, int p433,
+    int p434, int p435, int p436, int p437, int p438, int p439, int p440, int p441, int p442,
+    int p443, int p444, int p445, int p446, int p447, int p448, int p449, int p450, int p451,
+    int p452, int p453, int p454, int p455, int p456, int p457, int p458, int p459, int p460,
+    int p461, int p462, int p463, int p464, int p465, int p466, int p467, int p468, int p469,
+    int p470, int p471, int p472, int p473, int p474, int p475, int p476, int p477, int p478,
+    int p479, int p480, int p481, int p482, int p483, int p484, int p485, int p486, int p487,
+    int p488, int p489, int p490, int p491, int p492, int p493, int p494, int p495, int p496,
+    int p497, int p498, int p499, int p500, int p501, int p502, int p503, int p504, int p505,
+    int p506, int p507, int p508, int p509, int p510, int p511, int p512, int p513, int p514,
+    int p515, int p516, int p517, int p518, int p519, int p520, int p521, int p522, int p523,
+    int p524, int p525, int p526, int p527, int p528, int p529
+) {
+    p525 = p525 + p0;
+    return p0 + p8 * 2 + p519 * 3 + p520 * 5 + p525 * 7 + p529 * 11;
+}
+
+int medium(int n) {
+    int a[700];
+    for (int i = 0; i < 700; i = i + 100) a[i] = i + n;
+    a[699] = n * 3;
+    return a[0] + a[600] + a[699];
+}
+
+int main() {
+    int big[300000];
+    int x = 7;
+    int y = 11;
+    big[0] = 1;
+    big[150000] = x + y;
+    big[299999] = medium(x);
+    int r = many(
+        0, 1, 2, x, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24,
+        25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47,
+        48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70,
+        71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93,
+        94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112,
+        113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130,
+        131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148,
+        149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166,
+        167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184,
+        185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202,
+        203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220,
+        221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238,
+        239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256,
+        257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274,
+        275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292,
+        293, 294, 295, 296, 297, 298, 299, y, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311,
+        312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329,
+        330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347,
+        348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365,
+        366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383,
+        384, 385, 386, 387, 388, 389, 390, 391, 392, 393, 394, 395, 396, 397, 398, 399, 400, 401,
+        402, 403, 404, 405, 406, 407, 408, 409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419,
+        420, 421, 422, 423, 424, 425, 426, 427, 428, 429, 430, 431, 432, 433, 434, 435, 436, 437,
+        438, 439, 440, 441, 442, 443, 444, 445, 446, 447, 448, 449, 450, 451, 452, 453, 454, 455,
+        456, 457, 458, 459, 460, 461, 462, 463, 464, 465, 466, 467, 468, 469, 470, 471, 472, 473,
+        474, 475, 476, 477, 478, 479, 480, 481, 482, 483, 484, 485, 486, 487, 488, 489, 490, 491,
+        492, 493, 494, 495, 496, 497, 498, 499, 500, 501, 502, 503, 504, 505, 506, 507, 508, 509,
+        510, 511, 512, 513, 514, 515, 516, 517, 518, 519, 520, 521, 522, 523, 524, 525, 526, 527,
+        big[150000], x + y
+    );
+    return (r + big[0] + big[150000] + big[299999] + x * y) % 256;
+}
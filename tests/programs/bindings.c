@@ -0,0 +1,55 @@
+// exit code: 147
+// values kept in registers across basic blocks: defined before a branch and used on both sides and after the join,
+// changed on only one side of an if, carried around loops (nested, with break and continue) and used after them
+
+int g = 3;
+
+int branches(int a, int b) {
+    int x = a * 2;
+    int y = b + 1;
+    int z = x + y;
+    if (a > b) {
+        x = x + z;
+    } else {
+        y = y * z;
+        if (y > 40) y = y - 40;
+    }
+    // x, y and z are each live from a different set of predecessors
+    return x + y * 3 + z;
+}
+
+int loops(int n) {
+    int sum = 0;
+    int prod = 1;
+    int last = 0;
+    int i = 0;
+    while (i < n) {
+        int j = 0;
+        for (; j < i; j = j + 1) {
+            if (j == 3) continue;
+            if (j > 6) break;
+            sum = sum + j * i;
+        }
+        last = j;
+        prod = prod * 3 % 101;
+        i = i + 1;
+    }
+    return sum % 100 + prod + last * 7 + i;
+}
+
+int globals(int n) {
+    int before = g;
+    for (int i = 0; i < n; i = i + 1) {
+        if (i % 2 == 0) g = g + i;
+        else before = before + 1;
+    }
+    return g * 2 + before;
+}
+
+int main() {
+    int a = branches(5, 2);
+    int b = branches(2, 5);
+    int c = loops(10);
+    int d = globals(6);
+    return (a + b * 2 + c + d) % 256;
+}
@@ -0,0 +1,30 @@
+// exit code: 176
+// values live across several calls: more of them than there are callee-saved registers,
+// used after each call and after a loop of calls, and call results combined with values computed before the calls
+
+int counter = 0;
+
+int bump(int x) {
+    counter = counter + 1;
+    return x + counter;
+}
+
+int mix(int a, int b) {
+    return a * 3 - b;
+}
+
+int main() {
+    int v0 = 1; int v1 = 2; int v2 = 3; int v3 = 4; int v4 = 5; int v5 = 6; int v6 = 7;
+    int v7 = 8; int v8 = 9; int v9 = 10; int v10 = 11; int v11 = 12; int v12 = 13; int v13 = 14;
+    int r = bump(v0);
+    r = r + mix(v1, bump(v2));
+    r = r + v3 * v4 + bump(r);
+    for (int i = 0; i < 4; i = i + 1) {
+        r = r + bump(i) - v5;
+        v6 = v6 + mix(i, v7);
+    }
+    int b8 = bump(v8);
+    r = r + mix(b8, bump(v9)) + v10;
+    int total = v0 + v1 + v2 + v3 + v4 + v5 + v6 + v7 + v8 + v9 + v10 + v11 + v12 + v13;
+    return (r + total + counter) % 256;
+}
@@ -0,0 +1,49 @@
+// exit code: 240
+// incoming arguments in registers and on the stack: unused, read once at entry, written before use,
+// updated in a loop, live across a call, and passed on (changed and unchanged) to another call
+
+int unused(int a, int b, int c) {
+    return b;
+}
+
+int h(int a, int b, int c, int d, int e, int f, int g, int k, int m, int n) {
+    int s = 0;
+    for (int i = 0; i < 5; i = i + 1) {
+        s = s + n * 3 + m;
+        n = n + 1;
+        m = m * 2 - a;
+        if (s > 100) k = k + m; else a = a + n;
+    }
+    return s + k + a + m + n;
+}
+
+// m and n come on the stack, m is written before being passed on
+int w(int a, int b, int c, int d, int e, int f, int g, int k, int m, int n) {
+    m = m + 1;
+    return h(n, m, a, b, c, d, e, f, g, m) + m;
+}
+
+// a and the stack parameter j are read only after a call
+int later(int a, int b, int c, int d, int e, int f, int g, int h, int i, int j) {
+    int x = unused(b, c, d);
+    a = a + x;
+    return a * 2 + j + i;
+}
+
+int sum(int a[], int n) {
+    int s = 0;
+    while (n > 0) {
+        n = n - 1;
+        s = s + a[n];
+    }
+    return s;
+}
+
+int main() {
+    int arr[4];
+    arr[0] = 5; arr[1] = 6; arr[2] = 7; arr[3] = 8;
+    int r = w(1, 2, 3, 4, 5, 6, 7, 8, 9, 10);
+    r = r + later(1, 2, 3, 4, 5, 6, 7, 8, 9, 10) + unused(1, 2, 3);
+    r = r + sum(arr, 4);
+    return r % 256;
+}
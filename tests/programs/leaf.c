@@ -0,0 +1,52 @@
+// exit code: 12
+// leaf functions whose frame can be partly or wholly omitted: no frame at all, only an array (addressed via fp),
+// more than 8 parameters (read from the caller's frame), and enough live values to spill;
+// and non-leaf callers of each, whose frames must stay intact around the calls
+
+int tiny(int x) {
+    return x * 3 + 1;
+}
+
+int withArray(int n) {
+    int a[6];
+    for (int i = 0; i < 6; i = i + 1) a[i] = i * n;
+    return a[2] + a[5];
+}
+
+int stackParams(int a, int b, int c, int d, int e, int f, int g, int h, int i, int j) {
+    return a - b + c - d + e - f + g - h + i * j;
+}
+
+int global[3];
+
+int touchGlobal(int x) {
+    global[x % 3] = global[x % 3] + x;
+    return global[0] + global[1] + global[2];
+}
+
+int spilling(int n) {
+    int v0 = n + 0; int v1 = n + 1; int v2 = n + 2; int v3 = n + 3; int v4 = n + 4; int v5 = n + 5;
+    int v6 = n + 6; int v7 = n + 7; int v8 = n + 8; int v9 = n + 9; int v10 = n + 10; int v11 = n + 11;
+    int v12 = n + 12; int v13 = n + 13; int v14 = n + 14; int v15 = n + 15; int v16 = n + 16; int v17 = n + 17;
+    int v18 = n + 18; int v19 = n + 19; int v20 = n + 20; int v21 = n + 21; int v22 = n + 22; int v23 = n + 23;
+    int v24 = n + 24; int v25 = n + 25; int v26 = n + 26; int v27 = n + 27; int v28 = n + 28; int v29 = n + 29;
+    return v0 * v7 + v1 * v8 + v2 * v9 + v3 * v10 + v4 * v11 + v5 * v12
+        + v6 * v13 + v7 * v14 + v8 * v15 + v9 * v16 + v10 * v17 + v11 * v18
+        + v12 * v19 + v13 * v20 + v14 * v21 + v15 * v22 + v16 * v23 + v17 * v24
+        + v18 * v25 + v19 * v26 + v20 * v27 + v21 * v28 + v22 * v29 + v23 * v0
+        + v24 * v1 + v25 * v2 + v26 * v3 + v27 * v4 + v28 * v5 + v29 * v6;
+}
+
+int caller(int n) {
+    int a[2];
+    a[0] = tiny(n);
+    a[1] = withArray(n) + stackParams(1, 2, 3, 4, 5, 6, 7, 8, 9, n);
+    return a[0] + a[1] + spilling(n) + touchGlobal(n);
+}
+
+int main() {
+    int r = tiny(4) + withArray(3) + stackParams(10, 9, 8, 7, 6, 5, 4, 3, 2, 1);
+    r = r + spilling(2) + touchGlobal(4) + touchGlobal(5);
+    r = r + caller(3) + caller(7);
+    return r % 256;
+}
@@ -0,0 +1,27 @@
+// exit code: 130
+// calls with more than 8 arguments, which go through the outgoing-argument area of the caller's frame:
+// different numbers of stack arguments from the same caller, a call with stack arguments as an argument
+// of another one, stack arguments computed by calls, and a caller with locals and an array in its frame
+
+int ten(int a, int b, int c, int d, int e, int f, int g, int h, int i, int j) {
+    return a + b * 2 + c * 3 + d * 4 + e * 5 + f * 6 + g * 7 + h * 8 + i * 9 + j * 10;
+}
+
+int twelve(int a, int b, int c, int d, int e, int f, int g, int h, int i, int j, int k, int l) {
+    return ten(l, k, j, i, h, g, f, e, d, c) - a - b;
+}
+
+int one(int x) {
+    return x + 1;
+}
+
+int main() {
+    int arr[5];
+    for (int i = 0; i < 5; i = i + 1) arr[i] = i * i;
+    int r = ten(1, 2, 3, 4, 5, 6, 7, 8, 9, 10);
+    r = r + twelve(1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12);
+    // the inner call fills the outgoing-argument area while the outer one is being set up
+    r = r + ten(arr[0], arr[1], arr[2], arr[3], arr[4], 1, 2, 3, ten(1, 1, 1, 1, 1, 1, 1, 1, 1, 1), one(arr[4]));
+    r = r + twelve(one(1), one(2), one(3), one(4), one(5), one(6), one(7), one(8), one(9), one(10), one(11), r % 7);
+    return r % 256;
+}
@@ -0,0 +1,192 @@
+// exit code: 150
+// instrs of every kind, globals in .data and .bss, immediates which don't fit in 12 bits, and a branch
+// over more than 4 KiB of code (made long in the object file), for the object code written with --obj
+
+int g[4] = {3, 5, 70000, 4096};
+int h[8];
+int count = 2;
+int zero;
+
+int ops(int a, int b) {
+    int r = a + b - a * b + a / b + a % b;
+    r = r + (a < b) + (a > b) + (a <= b) + (a >= b) + (a == b) + (a != b);
+    r = r + (a && b) + (a || zero) + !a + -b + ~a;
+    return r;
+}
+
+int main() {
+    int x = 123456789;
+    int y = -2147483647;
+    int z = 4096;
+    h[7] = 524288;
+    h[3] = -2049;
+    x = x % 1000 + z / 1024 + (y < 0) + h[7] / 65536 + h[3] % 1000;
+    while (count > 0) {
+        count = count - 1;
+        if (x > -100000) {
+            x = (x * 2 + g[0] - h[0]) % 1000 + (y > x) - (x <= 22);
+            x = (x * 8 + g[1] - h[1]) % 1001 + (y > x) - (x <= 2);
+            x = (x * 2 + g[2] - h[2]) % 1002 + (y > x) - (x <= 19);
+            x = (x * 6 + g[3] - h[3]) % 1003 + (y > x) - (x <= 1);
+            x = (x * 3 + g[0] - h[4]) % 1004 + (y > x) - (x <= 41);
+            x = (x * 4 + g[1] - h[5]) % 1005 + (y > x) - (x <= 16);
+            x = (x * 7 + g[2] - h[6]) % 1006 + (y > x) - (x <= 47);
+            x = (x * 4 + g[3] - h[7]) % 1007 + (y > x) - (x <= 28);
+            x = (x * 4 + g[0] - h[0]) % 1008 + (y > x) - (x <= 36);
+            x = (x * 2 + g[1] - h[1]) % 1009 + (y > x) - (x <= 35);
+            x = (x * 5 + g[2] - h[2]) % 1010 + (y > x) - (x <= 37);
+            x = (x * 5 + g[3] - h[3]) % 1011 + (y > x) - (x <= 32);
+            x = (x * 8 + g[0] - h[4]) % 1012 + (y > x) - (x <= 23);
+            x = (x * 3 + g[1] - h[5]) % 1013 + (y > x) - (x <= 26);
+            x = (x * 3 + g[2] - h[6]) % 1014 + (y > x) - (x <= 26);
+            x = (x * 6 + g[3] - h[7]) % 1015 + (y > x) - (x <= 8);
+            x = (x * 7 + g[0] - h[0]) % 1016 + (y > x) - (x <= 32);
+            x = (x * 3 + g[1] - h[1]) % 1017 + (y > x) - (x <= 49);
+            x = (x * 4 + g[2] - h[2]) % 1018 + (y > x) - (x <= 34);
+            x = (x * 5 + g[3] - h[3]) % 1019 + (y > x) - (x <= 12);
+            x = (x * 6 + g[0] - h[4]) % 1020 + (y > x) - (x <= 46);
+            x = (x * 7 + g[1] - h[5]) % 1021 + (y > x) - (x <= 21);
+            x = (x * 3 + g[2] - h[6]) % 1022 + (y > x) - (x <= 36);
+            x = (x * 6 + g[3] - h[7]) % 1023 + (y > x) - (x <= 1);
+            x = (x * 5 + g[0] - h[0]) % 1024 + (y > x) - (x <= 25);
+            x = (x * 8 + g[1] - h[1]) % 1025 + (y > x) - (x <= 9);
+            x = (x * 5 + g[2] - h[2]) % 1026 + (y > x) - (x <= 14);
+            x = (x * 8 + g[3] - h[3]) % 1027 + (y > x) - (x <= 24);
+            x = (x * 8 + g[0] - h[4]) % 1028 + (y > x) - (x <= 14);
+            x = (x * 7 + g[1] - h[5]) % 1029 + (y > x) - (x <= 32);
+            x = (x * 4 + g[2] - h[6]) % 1030 + (y > x) - (x <= 49);
+            x = (x * 2 + g[3] - h[7]) % 1031 + (y > x) - (x <= 40);
+            x = (x * 7 + g[0] - h[0]) % 1032 + (y > x) - (x <= 16);
+            x = (x * 5 + g[1] - h[1]) % 1033 + (y > x) - (x <= 33);
+            x = (x * 6 + g[2] - h[2]) % 1034 + (y > x) - (x <= 42);
+            x = (x * 5 + g[3] - h[3]) % 1035 + (y > x) - (x <= 19);
+            x = (x * 2 + g[0] - h[4]) % 1036 + (y > x) - (x <= 47);
+            x = (x * 4 + g[1] - h[5]) % 1037 + (y > x) - (x <= 16);
+            x = (x * 6 + g[2] - h[6]) % 1038 + (y > x) - (x <= 14);
+            x = (x * 3 + g[3] - h[7]) % 1039 + (y > x) - (x <= 11);
+            x = (x * 7 + g[0] - h[0]) % 1040 + (y > x) - (x <= 5);
+            x = (x * 4 + g[1] - h[1]) % 1041 + (y > x) - (x <= 16);
+            x = (x * 7 + g[2] - h[2]) % 1042 + (y > x) - (x <= 28);
+            x = (x * 2 + g[3] - h[3]) % 1043 + (y > x) - (x <= 35);
+            x = (x * 5 + g[0] - h[4]) % 1044 + (y > x) - (x <= 40);
+            x = (x * 5 + g[1] - h[5]) % 1045 + (y > x) - (x <= 23);
+            x = (x * 6 + g[2] - h[6]) % 1046 + (y > x) - (x <= 11);
+            x = (x * 7 + g[3] - h[7]) % 1047 + (y > x) - (x <= 37);
+            x = (x * 2 + g[0] - h[0]) % 1048 + (y > x) - (x <= 17);
+            x = (x * 7 + g[1] - h[1]) % 1049 + (y > x) - (x <= 7);
+            x = (x * 3 + g[2] - h[2]) % 1050 + (y > x) - (x <= 30);
+            x = (x * 7 + g[3] - h[3]) % 1051 + (y > x) - (x <= 15);
+            x = (x * 4 + g[0] - h[4]) % 1052 + (y > x) - (x <= 47);
+            x = (x * 8 + g[1] - h[5]) % 1053 + (y > x) - (x <= 10);
+            x = (x * 8 + g[2] - h[6]) % 1054 + (y > x) - (x <= 9);
+            x = (x * 6 + g[3] - h[7]) % 1055 + (y > x) - (x <= 12);
+            x = (x * 2 + g[0] - h[0]) % 1056 + (y > x) - (x <= 41);
+            x = (x * 8 + g[1] - h[1]) % 1057 + (y > x) - (x <= 31);
+            x = (x * 4 + g[2] - h[2]) % 1058 + (y > x) - (x <= 18);
+            x = (x * 2 + g[3] - h[3]) % 1059 + (y > x) - (x <= 19);
+            x = (x * 4 + g[0] - h[4]) % 1060 + (y > x) - (x <= 35);
+            x = (x * 6 + g[1] - h[5]) % 1061 + (y > x) - (x <= 45);
+            x = (x * 4 + g[2] - h[6]) % 1062 + (y > x) - (x <= 4);
+            x = (x * 5 + g[3] - h[7]) % 1063 + (y > x) - (x <= 3);
+            x = (x * 2 + g[0] - h[0]) % 1064 + (y > x) - (x <= 47);
+            x = (x * 7 + g[1] - h[1]) % 1065 + (y > x) - (x <= 25);
+            x = (x * 4 + g[2] - h[2]) % 1066 + (y > x) - (x <= 8);
+            x = (x * 5 + g[3] - h[3]) % 1067 + (y > x) - (x <= 27);
+            x = (x * 4 + g[0] - h[4]) % 1068 + (y > x) - (x <= 12);
+            x = (x * 8 + g[1] - h[5]) % 1069 + (y > x) - (x <= 21);
+            x = (x * 3 + g[2] - h[6]) % 1070 + (y > x) - (x <= 13);
+            x = (x * 5 + g[3] - h[7]) % 1071 + (y > x) - (x <= 19);
+            x = (x * 2 + g[0] - h[0]) % 1072 + (y > x) - (x <= 28);
+            x = (x * 8 + g[1] - h[1]) % 1073 + (y > x) - (x <= 41);
+            x = (x * 2 + g[2] - h[2]) % 1074 + (y > x) - (x <= 12);
+            x = (x * 5 + g[3] - h[3]) % 1075 + (y > x) - (x <= 9);
+            x = (x * 4 + g[0] - h[4]) % 1076 + (y > x) - (x <= 44);
+            x = (x * 6 + g[1] - h[5]) % 1077 + (y > x) - (x <= 20);
+            x = (x * 2 + g[2] - h[6]) % 1078 + (y > x) - (x <= 29);
+            x = (x * 3 + g[3] - h[7]) % 1079 + (y > x) - (x <= 37);
+            x = (x * 2 + g[0] - h[0]) % 1080 + (y > x) - (x <= 25);
+            x = (x * 2 + g[1] - h[1]) % 1081 + (y > x) - (x <= 42);
+            x = (x * 3 + g[2] - h[2]) % 1082 + (y > x) - (x <= 21);
+            x = (x * 3 + g[3] - h[3]) % 1083 + (y > x) - (x <= 32);
+            x = (x * 2 + g[0] - h[4]) % 1084 + (y > x) - (x <= 23);
+            x = (x * 4 + g[1] - h[5]) % 1085 + (y > x) - (x <= 28);
+            x = (x * 4 + g[2] - h[6]) % 1086 + (y > x) - (x <= 10);
+            x = (x * 4 + g[3] - h[7]) % 1087 + (y > x) - (x <= 23);
+            x = (x * 5 + g[0] - h[0]) % 1088 + (y > x) - (x <= 8);
+            x = (x * 5 + g[1] - h[1]) % 1089 + (y > x) - (x <= 40);
+            x = (x * 7 + g[2] - h[2]) % 1090 + (y > x) - (x <= 27);
+            x = (x * 5 + g[3] - h[3]) % 1091 + (y > x) - (x <= 27);
+            x = (x * 3 + g[0] - h[4]) % 1092 + (y > x) - (x <= 6);
+            x = (x * 6 + g[1] - h[5]) % 1093 + (y > x) - (x <= 33);
+            x = (x * 7 + g[2] - h[6]) % 1094 + (y > x) - (x <= 40);
+            x = (x * 8 + g[3] - h[7]) % 1095 + (y > x) - (x <= 38);
+            x = (x * 4 + g[0] - h[0]) % 1096 + (y > x) - (x <= 45);
+            x = (x * 7 + g[1] - h[1]) % 1097 + (y > x) - (x <= 11);
+            x = (x * 2 + g[2] - h[2]) % 1098 + (y > x) - (x <= 2);
+            x = (x * 6 + g[3] - h[3]) % 1099 + (y > x) - (x <= 46);
+            x = (x * 6 + g[0] - h[4]) % 1100 + (y > x) - (x <= 48);
+            x = (x * 2 + g[1] - h[5]) % 1101 + (y > x) - (x <= 17);
+            x = (x * 7 + g[2] - h[6]) % 1102 + (y > x) - (x <= 47);
+            x = (x * 3 + g[3] - h[7]) % 1103 + (y > x) - (x <= 44);
+            x = (x * 7 + g[0] - h[0]) % 1104 + (y > x) - (x <= 44);
+            x = (x * 5 + g[1] - h[1]) % 1105 + (y > x) - (x <= 8);
+            x = (x * 5 + g[2] - h[2]) % 1106 + (y > x) - (x <= 7);
+            x = (x * 6 + g[3] - h[3]) % 1107 + (y > x) - (x <= 35);
+            x = (x * 2 + g[0] - h[4]) % 1108 + (y > x) - (x <= 37);
+            x = (x * 6 + g[1] - h[5]) % 1109 + (y > x) - (x <= 2);
+            x = (x * 5 + g[2] - h[6]) % 1110 + (y > x) - (x <= 41);
+            x = (x * 5 + g[3] - h[7]) % 1111 + (y > x) - (x <= 5);
+            x = (x * 6 + g[0] - h[0]) % 1112 + (y > x) - (x <= 26);
+            x = (x * 7 + g[1] - h[1]) % 1113 + (y > x) - (x <= 42);
+            x = (x * 5 + g[2] - h[2]) % 1114 + (y > x) - (x <= 11);
+            x = (x * 6 + g[3] - h[3]) % 1115 + (y > x) - (x <= 7);
+            x = (x * 3 + g[0] - h[4]) % 1116 + (y > x) - (x <= 32);
+            x = (x * 8 + g[1] - h[5]) % 1117 + (y > x) - (x <= 47);
+            x = (x * 5 + g[2] - h[6]) % 1118 + (y > x) - (x <= 43);
+            x = (x * 2 + g[3] - h[7]) % 1119 + (y > x) - (x <= 45);
+            x = (x * 3 + g[0] - h[0]) % 1120 + (y > x) - (x <= 48);
+            x = (x * 7 + g[1] - h[1]) % 1121 + (y > x) - (x <= 2);
+            x = (x * 3 + g[2] - h[2]) % 1122 + (y > x) - (x <= 12);
+            x = (x * 7 + g[3] - h[3]) % 1123 + (y > x) - (x <= 25);
+            x = (x * 5 + g[0] - h[4]) % 1124 + (y > x) - (x <= 29);
+            x = (x * 6 + g[1] - h[5]) % 1125 + (y > x) - (x <= 18);
+            x = (x * 7 + g[2] - h[6]) % 1126 + (y > x) - (x <= 10);
+            x = (x * 7 + g[3] - h[7]) % 1127 + (y > x) - (x <= 6);
+            x = (x * 6 + g[0] - h[0]) % 1128 + (y > x) - (x <= 45);
+            x = (x * 4 + g[1] - h[1]) % 1129 + (y > x) - (x <= 27);
+            x = (x * 8 + g[2] - h[2]) % 1130 + (y > x) - (x <= 46);
+            x = (x * 5 + g[3] - h[3]) % 1131 + (y > x) - (x <= 1);
+            x = (x * 6 + g[0] - h[4]) % 1132 + (y > x) - (x <= 37);
+            x = (x * 6 + g[1] - h[5]) % 1133 + (y > x) - (x <= 12);
+            x = (x * 7 + g[2] - h[6]) % 1134 + (y > x) - (x <= 1);
+            x = (x * 4 + g[3] - h[7]) % 1135 + (y > x) - (x <= 21);
+            x = (x * 8 + g[0] - h[0]) % 1136 + (y > x) - (x <= 9);
+            x = (x * 6 + g[1] - h[1]) % 1137 + (y > x) - (x <= 47);
+            x = (x * 7 + g[2] - h[2]) % 1138 + (y > x) - (x <= 45);
+            x = (x * 2 + g[3] - h[3]) % 1139 + (y > x) - (x <= 13);
+            x = (x * 8 + g[0] - h[4]) % 1140 + (y > x) - (x <= 49);
+            x = (x * 8 + g[1] - h[5]) % 1141 + (y > x) - (x <= 32);
+            x = (x * 5 + g[2] - h[6]) % 1142 + (y > x) - (x <= 6);
+            x = (x * 2 + g[3] - h[7]) % 1143 + (y > x) - (x <= 15);
+            x = (x * 4 + g[0] - h[0]) % 1144 + (y > x) - (x <= 48);
+            x = (x * 2 + g[1] - h[1]) % 1145 + (y > x) - (x <= 10);
+            x = (x * 3 + g[2] - h[2]) % 1146 + (y > x) - (x <= 15);
+            x = (x * 4 + g[3] - h[3]) % 1147 + (y > x) - (x <= 48);
+            x = (x * 8 + g[0] - h[4]) % 1148 + (y > x) - (x <= 19);
+            x = (x * 5 + g[1] - h[5]) % 1149 + (y > x) - (x <= 22);
+            x = (x * 6 + g[2] - h[6]) % 1150 + (y > x) - (x <= 18);
+            x = (x * 2 + g[3] - h[7]) % 1151 + (y > x) - (x <= 48);
+            x = (x * 5 + g[0] - h[0]) % 1152 + (y > x) - (x <= 20);
+            x = (x * 5 + g[1] - h[1]) % 1153 + (y > x) - (x <= 32);
+            x = (x * 5 + g[2] - h[2]) % 1154 + (y > x) - (x <= 10);
+            x = (x * 5 + g[3] - h[3]) % 1155 + (y > x) - (x <= 6);
+            x = (x * 6 + g[0] - h[4]) % 1156 + (y > x) - (x <= 36);
+            x = (x * 2 + g[1] - h[5]) % 1157 + (y > x) - (x <= 47);
+            x = (x * 6 + g[2] - h[6]) % 1158 + (y > x) - (x <= 47);
+            x = (x * 2 + g[3] - h[7]) % 1159 + (y > x) - (x <= 21);
+        }
+    }
+    h[0] = ops(x, 7) + ops(-x, 3);
+    zero = h[0] % 97;
+    return (x + h[0] + zero + g[2] / 1000) % 256;
+}
@@ -0,0 +1,45 @@
+// exit code: 185
+// precedence, associativity and dangling else, as parsed by both parsers (--parser ply / rd):
+// the arithmetic, relational and logical levels against their neighbours, left associative - / %, right associative = and ?:,
+// unary chains, `else` binding to the nearest `if`, and long `else if` chains
+
+int level(int x) {
+    if (x < 10)
+        if (x < 5) return 1;
+        else return 2;
+    return 3;
+}
+
+int chain(int x) {
+    if (x == 0) return 10;
+    else if (x == 1) return 11;
+    else if (x == 2) return 12;
+    else if (x == 3) return 13;
+    else return 14;
+}
+
+int main() {
+    int a = 7;
+    int b = 3;
+    int c = 2;
+    int r = 0;
+    r = r + (a - b - c);                         // 2
+    r = r + (a * b % 5);                         // 1
+    r = r + (100 / 5 / 2);                       // 10
+    r = r + (a + b * c - a % b);                 // 12
+    r = r + (a < b == b < a);                    // 0
+    r = r + (a == 7 && b == 3 || c == 5);        // 1
+    r = r + (0 || 1 && 0);                       // 0
+    r = r + (-~a + !b - - c);                    // 10
+    r = r + (!!a + ~-a);                         // 7
+    int x;
+    int y;
+    x = y = a + 1;                               // 8, 8
+    r = r + x + y;                               // 16
+    r = r + (a > 5 ? b > 5 ? 1 : 2 : 3);         // 2
+    r = r + (0 ? 1 : 0 ? 2 : 4);                 // 4
+    r = r + (a ? b : c) * 2;                     // 6
+    r = r + level(3) + level(7) * 10 + level(12) * 100;          // 321
+    r = r + chain(0) + chain(2) + chain(3) + chain(9);           // 49
+    return r % 256;
+}
@@ -0,0 +1,57 @@
+// exit code: 132
+// functions whose callee-saved registers and ra need saving on some paths only: an early return before any call,
+// a call on one branch only, calls inside a loop (the saves must not be repeated), returns from both before and
+// after the calls, and values live across calls on one path
+
+int depth = 0;
+
+int fib(int n) {
+    if (n < 2) return n;
+    return fib(n - 1) + fib(n - 2);
+}
+
+int leafOnFastPath(int n, int x) {
+    if (n == 0) return x;
+    int saved = x * 2;
+    int r = leafOnFastPath(n - 1, x + 1);
+    return r + saved;
+}
+
+int callOnOneBranch(int a, int b) {
+    int r = a + b;
+    if (a > b) {
+        r = r + fib(a) * b;
+    } else {
+        r = r - b;
+    }
+    return r;
+}
+
+int callsInLoop(int n) {
+    int s = 0;
+    int i = 0;
+    while (i < n) {
+        if (i % 3 == 0) s = s + fib(i);
+        else s = s + i;
+        i = i + 1;
+    }
+    return s;
+}
+
+// returns on both sides of the calls
+int mixedReturns(int n) {
+    depth = depth + 1;
+    if (n < 0) return 100;
+    int a = n * 5;
+    if (n > 10) return a;
+    int b = mixedReturns(n - 3);
+    if (b > 50) return b - a;
+    return b + a + fib(n % 6);
+}
+
+int main() {
+    int r = fib(10) + leafOnFastPath(0, 9) + leafOnFastPath(4, 1);
+    r = r + callOnOneBranch(7, 2) + callOnOneBranch(2, 7);
+    r = r + callsInLoop(10) + mixedReturns(8) + mixedReturns(12) + mixedReturns(-1);
+    return (r + depth) % 256;
+}
@@ -0,0 +1,48 @@
+// exit code: 205
+// more live values than registers, so temps spill to stack slots, which are shared by temps whose live ranges
+// don't overlap: two phases of spilled values, each dead before the other one starts, values spilled across
+// a loop and a call, and a value defined in the first phase that stays live through the second
+
+int id(int x) {
+    return x;
+}
+
+int main() {
+    int keep = 7;
+    int a0 = 1; int a1 = 2; int a2 = 3; int a3 = 4; int a4 = 5; int a5 = 6;
+    int a6 = 7; int a7 = 8; int a8 = 9; int a9 = 10; int a10 = 11; int a11 = 12;
+    int a12 = 13; int a13 = 14; int a14 = 15; int a15 = 16; int a16 = 17; int a17 = 18;
+    int a18 = 19; int a19 = 20; int a20 = 21; int a21 = 22; int a22 = 23; int a23 = 24;
+    int a24 = 25; int a25 = 26; int a26 = 27; int a27 = 28; int a28 = 29; int a29 = 30;
+    int first = a0 * 1 + a1 * 2 + a2 * 3 + a3 * 4 + a4 * 5 + a5 * 1
+        + a6 * 2 + a7 * 3 + a8 * 4 + a9 * 5 + a10 * 1 + a11 * 2
+        + a12 * 3 + a13 * 4 + a14 * 5 + a15 * 1 + a16 * 2 + a17 * 3
+        + a18 * 4 + a19 * 5 + a20 * 1 + a21 * 2 + a22 * 3 + a23 * 4
+        + a24 * 5 + a25 * 1 + a26 * 2 + a27 * 3 + a28 * 4 + a29 * 5;
+    for (int i = 0; i < 3; i = i + 1) {
+        a0 = a0 + a1; a1 = a1 + a2; a2 = a2 + a3; a3 = a3 + a4; a4 = a4 + a5;
+        a5 = a5 + a6; a6 = a6 + a7; a7 = a7 + a8; a8 = a8 + a9; a9 = a9 + a10;
+        a10 = a10 + a11; a11 = a11 + a12; a12 = a12 + a13; a13 = a13 + a14; a14 = a14 + a15;
+        a15 = a15 + a16; a16 = a16 + a17; a17 = a17 + a18; a18 = a18 + a19; a19 = a19 + a20;
+        a20 = a20 + a21; a21 = a21 + a22; a22 = a22 + a23; a23 = a23 + a24; a24 = a24 + a25;
+        a25 = a25 + a26; a26 = a26 + a27; a27 = a27 + a28; a28 = a28 + a29; a29 = a29 + a0;
+    }
+    first = first + a0 - a1 - a2 - a3 - a4 - a5 - a6 - a7 - a8 - a9
+        - a10 - a11 - a12 - a13 - a14 - a15 - a16 - a17 - a18 - a19
+        - a20 - a21 - a22 - a23 - a24 - a25 - a26 - a27 - a28 - a29;
+    int b0 = first % 2 + keep; int b1 = first % 3 + keep; int b2 = first % 4 + keep; int b3 = first % 5 + keep;
+    int b4 = first % 6 + keep; int b5 = first % 7 + keep; int b6 = first % 8 + keep; int b7 = first % 9 + keep;
+    int b8 = first % 10 + keep; int b9 = first % 11 + keep; int b10 = first % 12 + keep; int b11 = first % 13 + keep;
+    int b12 = first % 14 + keep; int b13 = first % 15 + keep; int b14 = first % 16 + keep; int b15 = first % 17 + keep;
+    int b16 = first % 18 + keep; int b17 = first % 19 + keep; int b18 = first % 20 + keep; int b19 = first % 21 + keep;
+    int b20 = first % 22 + keep; int b21 = first % 23 + keep; int b22 = first % 24 + keep; int b23 = first % 25 + keep;
+    int b24 = first % 26 + keep; int b25 = first % 27 + keep; int b26 = first % 28 + keep; int b27 = first % 29 + keep;
+    int b28 = first % 30 + keep; int b29 = first % 31 + keep;
+    keep = id(keep + b3);
+    int second = b0 * 1 + b1 * 2 + b2 * 3 + b3 * 1 + b4 * 2 + b5 * 3
+        + b6 * 1 + b7 * 2 + b8 * 3 + b9 * 1 + b10 * 2 + b11 * 3
+        + b12 * 1 + b13 * 2 + b14 * 3 + b15 * 1 + b16 * 2 + b17 * 3
+        + b18 * 1 + b19 * 2 + b20 * 3 + b21 * 1 + b22 * 2 + b23 * 3
+        + b24 * 1 + b25 * 2 + b26 * 3 + b27 * 1 + b28 * 2 + b29 * 3;
+    return (first + second + keep) % 256;
+}
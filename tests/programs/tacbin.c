@@ -0,0 +1,50 @@
+// exit code: 70
+// every kind of TAC instr and global var, for the binary TAC format (--emit-tac-bin / --from-tac-bin):
+// int and array globals with and without initializers, local and global arrays of several dims,
+// array params, calls passing more than 8 args, literals of every size and every kind of branch
+
+int answer = 42;
+int unset;
+int table[3][4] = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12};
+int buffer[16];
+
+int sum(int a[], int n) {
+    int s = 0;
+    for (int i = 0; i < n; i = i + 1) {
+        if (a[i] % 3 == 0)
+            continue;
+        s = s + a[i];
+    }
+    return s;
+}
+
+int mix(int a, int b, int c, int d, int e, int f, int g, int h, int i, int j) {
+    return a - b + c * d - e / f + g % h - i + j;
+}
+
+// falls off its end, so it returns without a value (as 0)
+int clear() {
+    buffer[15] = 0;
+}
+
+int main() {
+    int grid[2][3];
+    int big = 2147483647;
+    int small = -2147483647 - 1;
+    int i = 0;
+    while (1) {
+        if (i >= 6)
+            break;
+        grid[i / 3][i % 3] = table[i % 3][i % 4] * (i + 1);
+        buffer[i] = -i;
+        i = i + 1;
+    }
+    buffer[15] = 99;
+    clear();
+    int s = sum(buffer, 6) * 10 + sum(buffer, 16);
+    int m = mix(1, 2, 3, 4, 5, 6, 7, 8, 9, 10);
+    int logic = (big > small) && !(s == 0) || unset;
+    int bits = ~small + -big;
+    unset = grid[1][2] ? answer : m;
+    return (s + m + logic + bits + unset + grid[0][1] + answer * 1000000) % 256;
+}
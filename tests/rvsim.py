@@ -0,0 +1,353 @@
+import re
+import struct
+
+"""
+rvsim: a small RV32IM simulator to run the programs compiled in the tests
+
+A program is run from `main`, with RA set to a sentinel address, until main returns; the exit code is a0 & 0xFF.
+
+The code is decoded into instrs of the form (op, rd, rs1, rs2, imm), where op is a base RV32IM instruction
+(or "li", loading an immediate of any size), and the targets of branches and jumps are offsets from the instr
+as in the machine code; `runAsm` takes the assembly code printed by main.py, whose pseudo instrs are turned
+into base ones, and `runObj` takes the ELF relocatable object written with --obj, which it links as a linker
+would (placing .text, .data and .bss, and applying the relocations) before decoding the machine code.
+"""
+
+REG_NAMES = [
+    "zero", "ra", "sp", "gp", "tp", "t0", "t1", "t2", "fp", "s1", "a0", "a1", "a2", "a3", "a4", "a5",
+    "a6", "a7", "s2", "s3", "s4", "s5", "s6", "s7", "s8", "s9", "s10", "s11", "t3", "t4", "t5", "t6",
+]
+REGS = {name: index for (index, name) in enumerate(REG_NAMES)}
+REGS.update({"x{}".format(index): index for index in range(32)})
+REGS["s0"] = REGS["fp"]
+
+MEMORY_SIZE = 1 << 24
+DATA_BASE = 0x10000
+TEXT_BASE = 0x1000
+RETURN_SENTINEL = 0x4
+MAX_STEPS = 20_000_000
+
+MASK = 0xFFFFFFFF
+
+R_OPS = {"add", "sub", "mul", "div", "rem", "and", "or", "xor", "slt", "sltu", "sll", "srl", "sra"}
+# the I-type instrs, with the R-type ones doing the same on a register
+I_OPS = {
+    "addi": "add", "andi": "and", "ori": "or", "xori": "xor", "slti": "slt", "sltiu": "sltu",
+    "slli": "sll", "srli": "srl", "srai": "sra",
+}
+BRANCH_OPS = {"beq", "bne", "blt", "bge", "bltu", "bgeu"}
+
+# the pseudo instrs printed by main.py: op -> (base op, its operands),
+# where a number is the index of an operand of the pseudo instr, and a string is taken as it is
+PSEUDO_INSTRS = {
+    "mv": ("addi", (0, 1, "0")),
+    "neg": ("sub", (0, "zero", 1)),
+    "not": ("xori", (0, 1, "-1")),
+    "seqz": ("sltiu", (0, 1, "1")),
+    "snez": ("sltu", (0, "zero", 1)),
+    "sltz": ("slt", (0, 1, "zero")),
+    "sgtz": ("slt", (0, "zero", 1)),
+    "sgt": ("slt", (0, 2, 1)),
+}
+
+
+class SimulationError(Exception):
+    pass
+
+
+def signed(value: int) -> int:
+    value &= MASK
+    return value - (1 << 32) if value & 0x80000000 else value
+
+
+# RISC-V division rounds towards zero and never traps
+def divide(x: int, y: int) -> tuple[int, int]:
+    if y == 0:
+        return -1, x
+    if x == -(1 << 31) and y == -1:
+        return x, 0
+    quotient = abs(x) // abs(y)
+    if (x < 0) != (y < 0):
+        quotient = -quotient
+    return quotient, x - quotient * y
+
+
+def compute(op: str, x: int, y: int) -> int:
+    if op == "add":
+        return x + y
+    if op == "sub":
+        return x - y
+    if op == "mul":
+        return x * y
+    if op == "div":
+        return divide(x, y)[0]
+    if op == "rem":
+        return divide(x, y)[1]
+    if op == "and":
+        return x & y
+    if op == "or":
+        return x | y
+    if op == "xor":
+        return x ^ y
+    if op == "slt":
+        return int(x < y)
+    if op == "sltu":
+        return int((x & MASK) < (y & MASK))
+    if op == "sll":
+        return x << (y & 31)
+    if op == "srl":
+        return (x & MASK) >> (y & 31)
+    return x >> (y & 31)
+
+
+class Machine:
+    def __init__(self) -> None:
+        self.memory = bytearray(MEMORY_SIZE)
+        self.regs = [0] * 32
+        # pc -> instr
+        self.code: dict[int, tuple[str, int, int, int, int]] = {}
+        self.symbols: dict[str, int] = {}
+        self.steps = 0
+
+    def load(self, address: int) -> int:
+        if address % 4 or not DATA_BASE <= address <= MEMORY_SIZE - 4:
+            raise SimulationError("bad load address {:#x}".format(address))
+        return signed(int.from_bytes(self.memory[address : address + 4], "little"))
+
+    def store(self, address: int, value: int) -> None:
+        if address % 4 or not DATA_BASE <= address <= MEMORY_SIZE - 4:
+            raise SimulationError("bad store address {:#x}".format(address))
+        self.memory[address : address + 4] = (value & MASK).to_bytes(4, "little")
+
+    # run main and return its exit code
+    def run(self) -> int:
+        regs = self.regs
+        regs[REGS["sp"]] = MEMORY_SIZE - 16
+        regs[REGS["ra"]] = RETURN_SENTINEL
+        pc = self.symbols["main"]
+        while pc != RETURN_SENTINEL:
+            self.steps += 1
+            if self.steps > MAX_STEPS:
+                raise SimulationError("too many steps")
+            if pc not in self.code:
+                raise SimulationError("no instr at {:#x}".format(pc))
+            op, rd, rs1, rs2, imm = self.code[pc]
+            x, y = regs[rs1], regs[rs2]
+            value = None
+            nextPc = pc + 4
+            if op in R_OPS:
+                value = compute(op, x, y)
+            elif op in I_OPS:
+                value = compute(I_OPS[op], x, imm)
+            elif op == "li":
+                value = imm
+            elif op == "lui":
+                value = imm << 12
+            elif op == "auipc":
+                value = pc + (imm << 12)
+            elif op == "lw":
+                value = self.load(x + imm)
+            elif op == "sw":
+                self.store(x + imm, y)
+            elif op in BRANCH_OPS:
+                if {
+                    "beq": x == y,
+                    "bne": x != y,
+                    "blt": x < y,
+                    "bge": x >= y,
+                    "bltu": (x & MASK) < (y & MASK),
+                    "bgeu": (x & MASK) >= (y & MASK),
+                }[op]:
+                    nextPc = pc + imm
+            elif op == "jal":
+                value, nextPc = pc + 4, pc + imm
+            elif op == "jalr":
+                value, nextPc = pc + 4, (x + imm) & ~1
+            else:
+                raise SimulationError("unknown instr " + op)
+            if value is not None and rd != 0:
+                regs[rd] = signed(value)
+            pc = nextPc & MASK
+        return regs[REGS["a0"]] & 0xFF
+
+
+def reg(name: str) -> int:
+    if name not in REGS:
+        raise SimulationError("unknown register " + name)
+    return REGS[name]
+
+
+# run the assembly code printed by main.py, and return the exit code and the number of instrs executed
+def runAsm(code: str) -> tuple[int, int]:
+    machine = Machine()
+    lines: list[tuple[str, list[str]]] = []
+    dataAddress = DATA_BASE
+    section = ".text"
+    for line in code.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.endswith(":"):
+            address = TEXT_BASE + 4 * len(lines) if section == ".text" else dataAddress
+            machine.symbols[line[:-1]] = address
+            continue
+        op, _, rest = line.partition(" ")
+        operands = [operand.strip() for operand in rest.split(",")] if rest else []
+        if op in (".data", ".bss", ".text"):
+            section = op
+        elif op == ".word":
+            machine.store(dataAddress, int(operands[0]))
+            dataAddress += 4
+        elif op == ".space":
+            dataAddress += int(operands[0])
+        elif op not in (".global", ".globl"):
+            lines.append((op, operands))
+
+    for index, (op, operands) in enumerate(lines):
+        pc = TEXT_BASE + 4 * index
+        if op in PSEUDO_INSTRS:
+            op, order = PSEUDO_INSTRS[op]
+            operands = [operands[operand] if isinstance(operand, int) else operand for operand in order]
+        if op in R_OPS:
+            instr = (op, reg(operands[0]), reg(operands[1]), reg(operands[2]), 0)
+        elif op in I_OPS:
+            instr = (op, reg(operands[0]), reg(operands[1]), 0, int(operands[2]))
+        elif op in ("li", "lui"):
+            instr = (op, reg(operands[0]), 0, 0, int(operands[1]))
+        elif op == "la":
+            instr = ("li", reg(operands[0]), 0, 0, machine.symbols[operands[1]])
+        elif op in ("lw", "sw"):
+            match = re.fullmatch(r"(-?\d+)\((\w+)\)", operands[1])
+            if match is None:
+                raise SimulationError("bad address " + operands[1])
+            if op == "lw":
+                instr = (op, reg(operands[0]), reg(match.group(2)), 0, int(match.group(1)))
+            else:
+                instr = (op, 0, reg(match.group(2)), reg(operands[0]), int(match.group(1)))
+        elif op in BRANCH_OPS:
+            instr = (op, 0, reg(operands[0]), reg(operands[1]), machine.symbols[operands[2]] - pc)
+        elif op in ("j", "call"):
+            instr = ("jal", REGS["ra"] if op == "call" else 0, 0, 0, machine.symbols[operands[0]] - pc)
+        elif op == "ret":
+            instr = ("jalr", 0, REGS["ra"], 0, 0)
+        else:
+            raise SimulationError("unknown instr " + op)
+        machine.code[pc] = instr
+
+    return machine.run(), machine.steps
+
+
+# the machine code of an instr -> the instr
+def decode(word: int) -> tuple[str, int, int, int, int]:
+    opcode = word & 0x7F
+    rd = (word >> 7) & 31
+    funct3 = (word >> 12) & 7
+    rs1 = (word >> 15) & 31
+    rs2 = (word >> 20) & 31
+    funct7 = word >> 25
+    immI = signed(word) >> 20
+    if opcode == 0x13:
+        if funct3 == 5:
+            return ("srai" if funct7 == 0x20 else "srli"), rd, rs1, 0, immI & 31
+        op = {0: "addi", 1: "slli", 2: "slti", 3: "sltiu", 4: "xori", 6: "ori", 7: "andi"}[funct3]
+        return op, rd, rs1, 0, immI & 31 if op == "slli" else immI
+    if opcode == 0x33:
+        ops = {
+            (0, 0): "add", (0x20, 0): "sub", (0, 1): "sll", (0, 2): "slt", (0, 3): "sltu", (0, 4): "xor",
+            (0, 5): "srl", (0x20, 5): "sra", (0, 6): "or", (0, 7): "and", (1, 0): "mul", (1, 4): "div", (1, 6): "rem",
+        }
+        if (funct7, funct3) not in ops:
+            raise SimulationError("unknown instr {:08x}".format(word))
+        return ops[(funct7, funct3)], rd, rs1, rs2, 0
+    if opcode in (0x37, 0x17):
+        return ("lui" if opcode == 0x37 else "auipc"), rd, 0, 0, word >> 12
+    if opcode == 0x03 and funct3 == 2:
+        return "lw", rd, rs1, 0, immI
+    if opcode == 0x23 and funct3 == 2:
+        return "sw", 0, rs1, rs2, (immI & ~31) | rd
+    if opcode == 0x63:
+        imm = ((word >> 31) << 12) | (((word >> 7) & 1) << 11) | (((word >> 25) & 0x3F) << 5) | (((word >> 8) & 0xF) << 1)
+        op = {0: "beq", 1: "bne", 4: "blt", 5: "bge", 6: "bltu", 7: "bgeu"}[funct3]
+        return op, 0, rs1, rs2, imm - (1 << 13) if imm & (1 << 12) else imm
+    if opcode == 0x6F:
+        imm = ((word >> 31) << 20) | (((word >> 12) & 0xFF) << 12) | (((word >> 20) & 1) << 11) | (((word >> 21) & 0x3FF) << 1)
+        return "jal", rd, 0, 0, imm - (1 << 21) if imm & (1 << 20) else imm
+    if opcode == 0x67 and funct3 == 0:
+        return "jalr", rd, rs1, 0, immI
+    raise SimulationError("unknown instr {:08x}".format(word))
+
+
+R_RISCV_CALL_PLT = 19
+R_RISCV_HI20 = 26
+R_RISCV_LO12_I = 27
+
+
+# the word with the immediate of a U-type (or I-type) instr replaced
+def withImmU(word: int, value: int) -> int:
+    return (word & 0xFFF) | ((((value + 0x800) >> 12) & 0xFFFFF) << 12)
+
+
+def withImmI(word: int, value: int) -> int:
+    return (word & 0xFFFFF) | ((value & 0xFFF) << 20)
+
+
+# link and run the ELF relocatable object written by main.py with --obj, and return the exit code
+# and the number of instrs executed
+def runObj(data: bytes) -> tuple[int, int]:
+    machine = Machine()
+    if data[:4] != b"\x7fELF" or data[4] != 1 or data[5] != 1:
+        raise SimulationError("not a 32-bit little-endian ELF file")
+    shoff = struct.unpack_from("<I", data, 32)[0]
+    shnum, shstrndx = struct.unpack_from("<HH", data, 48)
+    headers = [struct.unpack_from("<10I", data, shoff + 40 * index) for index in range(shnum)]
+
+    def content(header) -> bytes:
+        return data[header[4] : header[4] + header[5]]
+
+    def string(table: bytes, offset: int) -> str:
+        return table[offset : table.index(b"\0", offset)].decode()
+
+    shstrtab = content(headers[shstrndx])
+    sections = {string(shstrtab, header[0]): (index, header) for (index, header) in enumerate(headers)}
+    text = bytearray(content(sections[".text"][1]))
+    dataSection = content(sections[".data"][1])
+    machine.memory[DATA_BASE : DATA_BASE + len(dataSection)] = dataSection
+    bases = {
+        sections[".text"][0]: TEXT_BASE,
+        sections[".data"][0]: DATA_BASE,
+        sections[".bss"][0]: DATA_BASE + (len(dataSection) + 15) // 16 * 16,
+    }
+
+    symtabHeader = sections[".symtab"][1]
+    symtab = content(symtabHeader)
+    strtab = content(headers[symtabHeader[6]])
+    symbols: list[tuple[str, int]] = []
+    for offset in range(0, len(symtab), 16):
+        name, value, _, _, _, shndx = struct.unpack_from("<IIIBBH", symtab, offset)
+        symbols.append((string(strtab, name), bases[shndx] + value if shndx in bases else -1))
+    machine.symbols = {name: address for (name, address) in symbols if address >= 0}
+
+    relocs = content(sections[".rela.text"][1])
+    for offset in range(0, len(relocs), 12):
+        position, info, addend = struct.unpack_from("<IIi", relocs, offset)
+        name, address = symbols[info >> 8]
+        if address < 0:
+            raise SimulationError("undefined symbol " + name)
+        value = address + addend
+        word = int.from_bytes(text[position : position + 4], "little")
+        if info & 0xFF == R_RISCV_CALL_PLT:
+            value -= TEXT_BASE + position
+            following = int.from_bytes(text[position + 4 : position + 8], "little")
+            text[position + 4 : position + 8] = withImmI(following, value).to_bytes(4, "little")
+            word = withImmU(word, value)
+        elif info & 0xFF == R_RISCV_HI20:
+            word = withImmU(word, value)
+        elif info & 0xFF == R_RISCV_LO12_I:
+            word = withImmI(word, value)
+        else:
+            raise SimulationError("unknown relocation type {}".format(info & 0xFF))
+        text[position : position + 4] = word.to_bytes(4, "little")
+
+    for position in range(0, len(text), 4):
+        machine.code[TEXT_BASE + position] = decode(int.from_bytes(text[position : position + 4], "little"))
+    return machine.run(), machine.steps
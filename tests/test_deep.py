@@ -0,0 +1,67 @@
+import pytest
+
+from .rvsim import runAsm
+from .util import compileWith
+
+"""
+test_deep: deeply nested programs must compile with the default options and the default recursion limit
+(main.py runs in a process of its own), and still run to the right exit code
+"""
+
+DEPTH = {"add": 5000, "if": 300, "else_if": 3000, "cond": 3000, "paren": 800}
+
+
+# 1 + 1 + ... + 1, a left-nested chain of Binary
+def deepAdd(n: int) -> tuple[str, int]:
+    return "int main() {{ int a = 1; return {}; }}".format(" + ".join(["a"] * n)), n % 256
+
+
+# if (a < 1) { if (a < 1) { ... a = a + 1; } } with a block and an `if` per level
+def deepIf(n: int) -> tuple[str, int]:
+    code = "int main() {{ int a = 0; int b = 0;\n{}b = 42;\n{}return b; }}".format("if (a < 1) {\n" * n, "}\n" * n)
+    return code, 42
+
+
+# if (a == 0) x = 0; else if (a == 1) x = 1; ... taking the last branch
+def deepElseIf(n: int) -> tuple[str, int]:
+    chain = " else ".join("if (a == {0}) x = {0};".format(i % 200) if i < n - 1 else "x = 7;" for i in range(n))
+    return "int main() {{ int a = 255; int x = 0;\n{}\nreturn x; }}".format(chain), 7
+
+
+# a == 0 ? 1 : a == 1 ? 2 : ... : 0, right-nested CondExpr
+def deepCond(n: int) -> tuple[str, int]:
+    chain = "".join("a == {} ? {} : ".format(i, i % 100 + 1) for i in range(n))
+    return "int main() {{ int a = {}; return {}0; }}".format(n - 1, chain), (n - 1) % 100 + 1
+
+
+# ((((1 + 1) + 1) ... + 1)
+def deepParen(n: int) -> tuple[str, int]:
+    return "int main() {{ return {}1{}; }}".format("(" * n, " + 1)" * n), (n + 1) % 256
+
+
+GENERATORS = {"add": deepAdd, "if": deepIf, "else_if": deepElseIf, "cond": deepCond, "paren": deepParen}
+
+
+@pytest.mark.parametrize("kind", GENERATORS)
+def test_deep(kind: str, tmp_path):
+    code, exitCode = GENERATORS[kind](DEPTH[kind])
+    path = tmp_path / "deep.c"
+    path.write_text(code)
+    asm = compileWith("--input", str(path), "--riscv")
+    assert runAsm(asm)[0] == exitCode
+
+
+# with --cache the functions are hashed by their AST, the second run must find all of them in the cache,
+# so it writes nothing there
+@pytest.mark.parametrize("kind", GENERATORS)
+def test_deep_cache(kind: str, tmp_path):
+    code, exitCode = GENERATORS[kind](DEPTH[kind])
+    path = tmp_path / "deep.c"
+    path.write_text(code)
+    cache = tmp_path / "cache"
+    cold = compileWith("--input", str(path), "--riscv", "--cache", str(cache))
+    stored = {entry.name: entry.stat().st_mtime_ns for entry in cache.iterdir()}
+    warm = compileWith("--input", str(path), "--riscv", "--cache", str(cache))
+    assert {entry.name: entry.stat().st_mtime_ns for entry in cache.iterdir()} == stored
+    assert warm == cold
+    assert runAsm(warm)[0] == exitCode
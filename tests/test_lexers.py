@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+import frontend.ast.tree
+from frontend.lexer import ply_lexer, table_lexer
+
+from .util import programs
+
+"""
+test_lexers: the table-driven lexer (--lexer table) must give exactly the same tokens and errors as the ply lexer,
+on the regression programs and on inputs around comments, line endings and bad characters
+"""
+
+EDGE_CASES = [
+    "int a = 1; /* unterminated\n more\n last line",
+    "a /* x */ b */ c",
+    "x@y#z $ 'q' \"s\" 1.5",
+    "a\r\nb\rc\nd // tail",
+    "a // tail\n",
+    "/*/ x */ y",
+    "/**/",
+    "a/*\r\n*/b",
+    "int x = 3;\n\n/* abc",
+    "<<=>>===!!=&&&|||^~",
+    "123abc _x1 returnx return int\tif\x0celse",
+    "é",
+]
+
+
+def tokens(lexer, code: str) -> tuple[list, list[str]]:
+    lexer.input(code)
+    #! ply 的 lexer 在 input 时不会重置行号和状态
+    if lexer is ply_lexer:
+        lexer.lineno = 1
+        lexer.begin("INITIAL")
+    numErrors = len(lexer.error_stack)
+    result = []
+    for token in iter(lexer.token, None):
+        value = (type(token.value).__name__, getattr(token.value, "value", token.value))
+        result.append((token.type, value, token.lineno, token.lexpos))
+    return result, [str(error) for error in lexer.error_stack[numErrors:]]
+
+
+def readCode(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    "code",
+    [readCode(path) for path in programs()] + EDGE_CASES,
+    ids=[os.path.basename(path) for path in programs()] + ["edge{}".format(i) for i in range(len(EDGE_CASES))],
+)
+def test_same_tokens(code: str):
+    assert tokens(table_lexer, code) == tokens(ply_lexer, code)
@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from .util import PROGRAMS_DIR, runCompiler
+
+"""
+test_options: main.py must reject the combinations of options it can't honour, rather than silently ignoring one
+"""
+
+PROGRAM = os.path.join(PROGRAMS_DIR, "precedence.c")
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--obj", "-j", "2"],
+        ["--obj", "--cache", "cache"],
+        ["--riscv", "--stats", "-j", "2"],
+        ["--riscv", "--stats", "--cache", "cache"],
+        ["--parse", "--from-tac-bin", "prog.tacbin"],
+    ],
+    ids=" ".join,
+)
+def test_rejected(options: list[str]):
+    result = runCompiler("--input", PROGRAM, *options)
+    assert result.returncode == 2
+    assert "can not be used with" in result.stderr
+
+
+def test_stats():
+    result = runCompiler("--input", PROGRAM, "--riscv", "--stats")
+    assert result.returncode == 0
+    assert result.stderr
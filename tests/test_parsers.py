@@ -0,0 +1,142 @@
+import os
+import random
+
+import pytest
+
+import frontend.ast.tree
+from frontend.lexer import table_lexer
+from frontend.parser import ply_parser, rd_parser
+
+from .util import programs
+
+"""
+test_parsers: differential test of the hand-written parser (--parser rd) against the ply parser,
+on the regression programs, on generated programs and on generated programs with a few random edits
+
+both must build the same AST (compared by `str`) and report the same first syntax error;
+the full lists of errors are NOT compared: they recover from an error differently (ply pops its state stack,
+rd skips the token), so the errors after the first one may differ, and so does the list printed by main.py (step_parse)
+
+the inputs are kept shallow, as rd_parser recurses on nesting (see test_deep)
+"""
+
+NUM_GENERATED = 300
+BINARY_OPS = ["||", "&&", "|", "^", "&", "==", "!=", "<", ">", "<=", ">=", "+", "-", "*", "/", "%"]
+
+
+class Generator:
+    def __init__(self, seed: int) -> None:
+        self.rand = random.Random(seed)
+
+    def expr(self, depth: int = 0) -> str:
+        kind = self.rand.randrange(10 if depth < 4 else 3)
+        sub = lambda: self.expr(depth + 1)
+        if kind == 0:
+            return str(self.rand.randrange(100))
+        if kind == 1:
+            return self.rand.choice("abcxyz")
+        if kind == 2:
+            return "{}[{}]".format(self.rand.choice("abc"), sub())
+        if kind == 3:
+            return "{} {} {}".format(sub(), self.rand.choice(BINARY_OPS), sub())
+        if kind == 4:
+            return self.rand.choice("-~!") + sub()
+        if kind == 5:
+            return "({})".format(sub())
+        if kind == 6:
+            return "({} = {})".format(self.rand.choice(["a", "b[1]", "(c)", "f(x)[2]"]), sub())
+        if kind == 7:
+            return "{} ? {} : {}".format(sub(), sub(), sub())
+        if kind == 8:
+            return "f({})".format(", ".join(sub() for _ in range(self.rand.randrange(3))))
+        return "{} {} {} {} {}".format(sub(), self.rand.choice(BINARY_OPS), sub(), self.rand.choice(BINARY_OPS), sub())
+
+    def stmt(self, depth: int = 0) -> str:
+        kind = self.rand.randrange(11 if depth < 3 else 4)
+        sub = lambda: self.stmt(depth + 1)
+        if kind == 0:
+            return self.expr() + ";"
+        if kind == 1:
+            return ";"
+        if kind == 2:
+            return "return {};".format(self.expr())
+        if kind == 3:
+            return self.rand.choice(
+                ["break;", "continue;", "int q;", "int q = {};".format(self.expr()), "int r[3][4];", "int s[2] = {1, 2};"]
+            )
+        if kind == 4:
+            return "if ({}) {}".format(self.expr(), sub())
+        if kind == 5:
+            return "if ({}) {} else {}".format(self.expr(), sub(), sub())
+        if kind == 6:
+            return "while ({}) {}".format(self.expr(), sub())
+        if kind == 7:
+            init = self.rand.choice(["", "int i = 0", self.expr()])
+            return "for ({}; {}; {}) {}".format(init, self.rand.choice(["", self.expr()]), self.rand.choice(["", self.expr()]), sub())
+        if kind == 8:
+            return "{{ {} }}".format(" ".join(sub() for _ in range(self.rand.randrange(4))))
+        if kind == 9:
+            return "if (a) {} else if (b) {} else if (c) {}{}".format(sub(), sub(), sub(), self.rand.choice(["", " else " + sub()]))
+        # dangling else
+        return "if (a) if (b) {} else {}".format(sub(), sub())
+
+    def program(self) -> str:
+        parts = []
+        for _ in range(self.rand.randrange(1, 5)):
+            if self.rand.randrange(3) == 0:
+                parts.append(self.rand.choice(["int g;", "int g = 3;", "int h[4];", "int h[2][2] = {1, 2, 3};", "int g = a + 1;"]))
+            else:
+                params = self.rand.choice(["", "int a", "int a, int b[]", "int a[][3], int b", "int a[2]"])
+                body = "\n".join(self.stmt() for _ in range(self.rand.randrange(6)))
+                parts.append("int f{}({}) {{\n{}\n}}".format(self.rand.randrange(9), params, body))
+        return "\n".join(parts)
+
+    # delete, insert or replace a character or two
+    def mutate(self, code: str) -> str:
+        chars = list(code)
+        for _ in range(self.rand.randrange(1, 3)):
+            i = self.rand.randrange(len(chars) + 1)
+            edit = self.rand.randrange(3)
+            if edit == 0 and chars:
+                del chars[min(i, len(chars) - 1)]
+            elif edit == 1:
+                chars.insert(i, self.rand.choice(list(";(){}[]=+,?:") + [" int ", " if ", " else ", " 3 ", " x "]))
+            elif chars:
+                chars[min(i, len(chars) - 1)] = self.rand.choice(list(";(){}=,"))
+        return "".join(chars)
+
+
+def parse(parser, code: str) -> tuple[str, list[str]]:
+    del parser.error_stack[:]
+    #! 两者都使用 table_lexer: ply_lexer 在 input 时不会重置行号, 而错误信息中包含行号
+    program = parser.parse(code, lexer=table_lexer)
+    errors = [str(error) for error in parser.error_stack]
+    return (str(program) if not errors else None), errors
+
+
+def check(code: str) -> None:
+    plyProgram, plyErrors = parse(ply_parser, code)
+    rdProgram, rdErrors = parse(rd_parser, code)
+    assert rdErrors[:1] == plyErrors[:1]
+    assert rdProgram == plyProgram
+
+
+def readCode(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("path", programs(), ids=os.path.basename)
+def test_programs(path: str):
+    check(readCode(path))
+
+
+@pytest.mark.parametrize("seed", range(NUM_GENERATED))
+def test_generated(seed: int):
+    check(Generator(seed).program())
+
+
+@pytest.mark.parametrize("seed", range(NUM_GENERATED))
+def test_mutated(seed: int):
+    generator = Generator(seed)
+    check(generator.mutate(generator.program()))
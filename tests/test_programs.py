@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from utils.riscv import Riscv
+
+from .rvsim import runAsm, runObj
+from .util import compileProgram, expectedExitCode, programs
+
+"""
+test_programs: compile each regression program in tests/programs and check its exit code in the simulator,
+both as assembly code (--riscv) and as an ELF relocatable object (--obj)
+"""
+
+
+@pytest.mark.parametrize("path", programs(), ids=os.path.basename)
+def test_riscv(path: str):
+    exitCode, _ = runAsm(compileProgram(path, "--riscv"))
+    assert exitCode == expectedExitCode(path)
+
+
+@pytest.mark.parametrize("path", programs(), ids=os.path.basename)
+def test_obj(path: str):
+    exitCode, _ = runObj(compileProgram(path, "--obj", binary=True))
+    assert exitCode == expectedExitCode(path)
+
+
+# large offsets are materialized in the scratch register (see RiscvSubroutineEmitter.addImm),
+# which must never hold a temp
+def test_scratch_is_not_allocatable():
+    assert Riscv.SCRATCH not in Riscv.AllocatableRegs
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from .rvsim import runAsm
+from .util import compileProgram, compileWith, expectedExitCode, programs
+
+"""
+test_tacbin: round trip each regression program through the binary TAC format (--emit-tac-bin / --from-tac-bin),
+the TAC read back must print the same, re-emit the same bytes, and still run to the expected exit code
+"""
+
+
+@pytest.mark.parametrize("path", programs(), ids=os.path.basename)
+def test_round_trip(path: str, tmp_path):
+    tacBin = str(tmp_path / "prog.tacbin")
+    again = str(tmp_path / "again.tacbin")
+    compileProgram(path, "--emit-tac-bin", "-o", tacBin)
+
+    assert compileWith("--from-tac-bin", tacBin, "--tac") == compileProgram(path, "--tac")
+
+    compileWith("--from-tac-bin", tacBin, "--emit-tac-bin", "-o", again)
+    with open(tacBin, "rb") as f, open(again, "rb") as g:
+        assert f.read() == g.read()
+
+    exitCode, _ = runAsm(compileWith("--from-tac-bin", tacBin, "--riscv"))
+    assert exitCode == expectedExitCode(path)
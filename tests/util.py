@@ -0,0 +1,49 @@
+import glob
+import os
+import re
+import subprocess
+import sys
+from typing import Union
+
+"""
+util: helpers to compile the programs in the tests by running main.py, as the compiler is used
+
+the regression programs are in tests/programs, each of which starts with a comment giving its exit code:
+    // exit code: 42
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROGRAMS_DIR = os.path.join(ROOT, "tests", "programs")
+
+
+def programs() -> list[str]:
+    return sorted(glob.glob(os.path.join(PROGRAMS_DIR, "*.c")))
+
+
+def expectedExitCode(path: str) -> int:
+    with open(path) as f:
+        match = re.match(r"// exit code: (\d+)", f.readline())
+    if match is None:
+        raise ValueError("{} doesn't start with its exit code".format(path))
+    return int(match.group(1))
+
+
+# run main.py with the given options, in a process of its own (so with the default recursion limit),
+# the output is bytes if `binary` (e.g. with --obj), otherwise a str
+def runCompiler(*options: str, binary: bool = False) -> subprocess.CompletedProcess:
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "main.py"), *options], cwd=ROOT, capture_output=True, text=not binary
+    )
+    return result
+
+
+# run main.py with the given options, which must succeed, and return its output
+def compileWith(*options: str, binary: bool = False) -> Union[str, bytes]:
+    result = runCompiler(*options, binary=binary)
+    stderr = result.stderr.decode() if binary else result.stderr
+    assert result.returncode == 0, "main.py {} failed:\n{}".format(" ".join(options), stderr[-2000:])
+    return result.stdout
+
+
+def compileProgram(path: str, *options: str, binary: bool = False) -> Union[str, bytes]:
+    return compileWith("--input", path, *options, binary=binary)
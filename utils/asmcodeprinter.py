@@ -1,3 +1,5 @@
+from typing import Optional, TextIO
+
 from utils.label.label import Label
 from utils.tac.nativeinstr import NativeInstr
 from utils.tac.tacinstr import TACInstr
@@ -7,38 +9,62 @@ class AsmCodePrinter:
     INDENTS = "    "
     COMMENT_PROMPT = "#"
 
-    def __init__(self) -> None:
-        self.buffer = ""
+    def __init__(self, output: Optional[TextIO] = None) -> None:
+        # pieces of asm code which have not been written out yet
+        self.chunks: list[str] = []
+        # if given, pending chunks are written to it every time `flush` is called,
+        # so that only the code of a single function is kept in memory
+        self.output = output
 
     def printf(self, fmt: str, **args):
-        self.buffer += self.INDENTS + fmt.format(**args)
+        self.chunks.append(self.INDENTS + fmt.format(**args))
 
     def println(self, fmt: str, **args):
-        self.buffer += self.INDENTS + fmt.format(**args) + "\n"
+        self.chunks.append(self.INDENTS + fmt.format(**args) + "\n")
+
+    def printSection(self, section: str):
+        self.println(section)
+
+    def printGlobal(self, symbol: str):
+        self.println(".global " + symbol)
 
     def printLabel(self, label: Label):
-        self.buffer += str(label.name) + ":\n"
+        self.chunks.append(str(label.name) + ":\n")
 
     def printGlobalVar(self, symbol: str, value: int):
-        self.buffer += ".globl " + symbol + "\n" + symbol + ":\n" + self.INDENTS + ".word " + str(value) + "\n"
+        self.chunks.append(".globl " + symbol + "\n" + symbol + ":\n" + self.INDENTS + ".word " + str(value) + "\n")
 
     def printGlobalArray(self, symbol: str, value: int):
-        self.buffer += ".globl " + symbol + "\n" + symbol + ":\n" + self.INDENTS + ".space " + str(value) + "\n"
+        self.chunks.append(".globl " + symbol + "\n" + symbol + ":\n" + self.INDENTS + ".space " + str(value) + "\n")
 
     def printGlobalInitArray(self, symbol: str, vals: list[int]):
-        self.buffer += ".globl " + symbol + "\n" + symbol + ":\n"
+        self.chunks.append(".globl " + symbol + "\n" + symbol + ":\n")
         for val in vals:
-            self.buffer += self.INDENTS + ".word " + str(val) + "\n"
+            self.chunks.append(self.INDENTS + ".word " + str(val) + "\n")
 
     def printInstr(self, instr: NativeInstr):
         if instr.isLabel():
-            self.buffer += str(instr.label) + ":"
+            self.chunks.append(str(instr.label) + ":\n")
         else:
-            self.buffer += self.INDENTS + str(instr)
-        self.buffer += "\n"
+            self.chunks.append(self.INDENTS + str(instr) + "\n")
+
+    # append asm code which has been generated elsewhere (e.g. by a backend worker process)
+    def printCode(self, code: str):
+        self.chunks.append(code)
 
     def printComment(self, comment: str):
-        self.buffer += self.INDENTS + self.COMMENT_PROMPT + " " + comment + "\n"
+        self.chunks.append(self.INDENTS + self.COMMENT_PROMPT + " " + comment + "\n")
+
+    # write pending chunks to the output (if any)
+    def flush(self) -> None:
+        if self.output is not None:
+            self.output.write("".join(self.chunks))
+            self.chunks.clear()
 
+    # return all the asm code, or an empty string if it has been written to the output
     def close(self) -> str:
-        return self.buffer
+        if self.output is not None:
+            self.flush()
+            self.output.flush()
+            return ""
+        return "".join(self.chunks)
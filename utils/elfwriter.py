@@ -0,0 +1,160 @@
+import struct
+from enum import IntEnum, unique
+from typing import BinaryIO, Optional
+
+"""
+ElfWriter: build an ELF32 relocatable object file (for RV32)
+
+sections: .text, .data, .bss, and the .symtab/.strtab/.rela.text/.shstrtab describing them
+ symbols: every label in .text and every global variable in .data/.bss,
+          symbols which are referred to but never defined are left undefined (global)
+ relocs : the places in .text which refer to a symbol, to be fixed up by the linker
+"""
+
+
+@unique
+class Section(IntEnum):
+    # the index of a section in the section header table
+    UNDEF = 0
+    TEXT = 1
+    DATA = 2
+    BSS = 3
+
+
+@unique
+class RelocType(IntEnum):
+    R_RISCV_CALL_PLT = 19
+    R_RISCV_HI20 = 26
+    R_RISCV_LO12_I = 27
+
+
+class ElfSymbol:
+    __slots__ = ("name", "section", "value", "size", "type", "isGlobal")
+
+    # st_type
+    NOTYPE = 0
+    OBJECT = 1
+    FUNC = 2
+
+    def __init__(self, name: str, section: Section, value: int, size: int, type: int) -> None:
+        self.name = name
+        self.section = section
+        self.value = value
+        self.size = size
+        self.type = type
+        self.isGlobal = False
+
+
+class ElfWriter:
+    EM_RISCV = 243
+    ET_REL = 1
+
+    SHT_PROGBITS = 1
+    SHT_SYMTAB = 2
+    SHT_STRTAB = 3
+    SHT_RELA = 4
+    SHT_NOBITS = 8
+
+    SHF_WRITE = 0x1
+    SHF_ALLOC = 0x2
+    SHF_EXECINSTR = 0x4
+    SHF_INFO_LINK = 0x40
+
+    def __init__(self) -> None:
+        self.text = bytearray()
+        self.data = bytearray()
+        self.bssSize = 0
+        self.symbols: dict[str, ElfSymbol] = {}
+        # (offset in .text, symbol name, type, addend)
+        self.relocs: list[tuple[int, str, RelocType, int]] = []
+
+    def addSymbol(self, name: str, section: Section, value: int, size: int = 0, type: int = ElfSymbol.NOTYPE) -> None:
+        symbol = self.symbols.get(name)
+        if symbol is not None and symbol.section is not Section.UNDEF:
+            raise ValueError("symbol '{}' is defined twice".format(name))
+        isGlobal = symbol is not None and symbol.isGlobal
+        self.symbols[name] = ElfSymbol(name, section, value, size, type)
+        self.symbols[name].isGlobal = isGlobal
+
+    def markGlobal(self, name: str) -> None:
+        if name not in self.symbols:
+            self.symbols[name] = ElfSymbol(name, Section.UNDEF, 0, 0, ElfSymbol.NOTYPE)
+        self.symbols[name].isGlobal = True
+
+    def addReloc(self, offset: int, name: str, type: RelocType, addend: int = 0) -> None:
+        if name not in self.symbols:
+            self.markGlobal(name)
+        self.relocs.append((offset, name, type, addend))
+
+    # append a variable to .data (`values` are 32-bit words) or .bss (`values` is None)
+    def addData(self, name: str, values: Optional[list[int]], size: int) -> None:
+        if values is None:
+            self.addSymbol(name, Section.BSS, self.bssSize, size, ElfSymbol.OBJECT)
+            self.bssSize += size
+        else:
+            self.addSymbol(name, Section.DATA, len(self.data), size, ElfSymbol.OBJECT)
+            for value in values:
+                self.data += struct.pack("<I", value & 0xFFFFFFFF)
+
+    def write(self, output: BinaryIO) -> None:
+        # local symbols must precede the global ones
+        symbols = [s for s in self.symbols.values() if not s.isGlobal and s.section is not Section.UNDEF]
+        firstGlobal = len(symbols) + 1
+        symbols += [s for s in self.symbols.values() if s.isGlobal or s.section is Section.UNDEF]
+
+        strtab = bytearray(b"\0")
+        symtab = bytearray(struct.pack("<IIIBBH", 0, 0, 0, 0, 0, 0))
+        indexes: dict[str, int] = {}
+        for index, symbol in enumerate(symbols, 1):
+            indexes[symbol.name] = index
+            nameOffset = len(strtab)
+            strtab += symbol.name.encode() + b"\0"
+            bind = 1 if symbol.isGlobal or symbol.section is Section.UNDEF else 0
+            symtab += struct.pack(
+                "<IIIBBH", nameOffset, symbol.value, symbol.size, (bind << 4) | symbol.type, 0, symbol.section
+            )
+
+        rela = bytearray()
+        for offset, name, type, addend in self.relocs:
+            rela += struct.pack("<IIi", offset, (indexes[name] << 8) | type, addend)
+
+        shstrtab = bytearray(b"\0")
+
+        def sectionName(name: str) -> int:
+            offset = len(shstrtab)
+            shstrtab.extend(name.encode() + b"\0")
+            return offset
+
+        # (name, type, flags, content, size, link, info, align, entsize)
+        sections = [
+            (sectionName(".text"), self.SHT_PROGBITS, self.SHF_ALLOC | self.SHF_EXECINSTR, self.text, len(self.text), 0, 0, 4, 0),
+            (sectionName(".data"), self.SHT_PROGBITS, self.SHF_ALLOC | self.SHF_WRITE, self.data, len(self.data), 0, 0, 4, 0),
+            (sectionName(".bss"), self.SHT_NOBITS, self.SHF_ALLOC | self.SHF_WRITE, b"", self.bssSize, 0, 0, 4, 0),
+            (sectionName(".symtab"), self.SHT_SYMTAB, 0, symtab, len(symtab), 5, firstGlobal, 4, 16),
+            (sectionName(".strtab"), self.SHT_STRTAB, 0, strtab, len(strtab), 0, 0, 1, 0),
+            (sectionName(".rela.text"), self.SHT_RELA, self.SHF_INFO_LINK, rela, len(rela), 4, Section.TEXT, 4, 12),
+        ]
+        sections.append((sectionName(".shstrtab"), self.SHT_STRTAB, 0, shstrtab, len(shstrtab), 0, 0, 1, 0))
+
+        headerSize = 52
+        body = bytearray()
+        headers = bytearray(b"\0" * 40)
+        for name, type, flags, content, size, link, info, align, entsize in sections:
+            offset = headerSize + len(body)
+            if offset % align:
+                body += b"\0" * (align - offset % align)
+                offset = headerSize + len(body)
+            body += content
+            headers += struct.pack("<IIIIIIIIII", name, type, flags, 0, offset, size, link, info, align, entsize)
+        if len(body) % 4:
+            body += b"\0" * (4 - len(body) % 4)
+
+        ident = b"\x7fELF" + bytes([1, 1, 1, 0]) + b"\0" * 8
+        header = ident + struct.pack(
+            "<HHIIIIIHHHHHH",
+            self.ET_REL, self.EM_RISCV, 1, 0, 0, headerSize + len(body), 0,
+            headerSize, 0, 0, 40, len(sections) + 1, len(sections),
+        )
+        output.write(header)
+        output.write(body)
+        output.write(headers)
@@ -0,0 +1,114 @@
+import functools
+import hashlib
+import os
+from typing import Iterator, Optional
+
+from frontend.ast.node import Node
+from frontend.ast.tree import Function, Identifier
+from frontend.symbol.funcsymbol import FuncSymbol
+from frontend.symbol.varsymbol import VarSymbol
+
+"""
+FuncCache: an on-disk cache of the asm code of functions
+
+The code of a function is stored under a key which is a hash of
+    1. the AST of the function,
+    2. the signatures of the global symbols (global vars and functions) it refers to,
+    3. the compiler itself (its source code) and the flags,
+so that a function is regenerated only if something it depends on has changed.
+"""
+
+
+class FuncCache:
+    def __init__(self, directory: str, flags: str = "") -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.version = hashlib.sha256((compilerVersion() + "\0" + flags).encode()).hexdigest()
+        self.hits = 0
+        self.misses = 0
+
+    def keyOf(self, func: Function) -> str:
+        h = hashlib.sha256(self.version.encode())
+        for item in serialize(func):
+            h.update(item.encode() + b"\0")
+        for signature in sorted(referencedGlobals(func)):
+            h.update(b"\0" + signature.encode())
+        return h.hexdigest()
+
+    # return the cached code of the key, or None if absent
+    def load(self, key: str) -> Optional[str]:
+        try:
+            with open(self.pathOf(key), "r") as f:
+                code = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return code
+
+    def store(self, key: str, code: str) -> None:
+        # write to a temporary file first, so that a concurrent reader never sees a partial file
+        path = self.pathOf(key)
+        tmpPath = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmpPath, "w") as f:
+            f.write(code)
+        os.replace(tmpPath, path)
+
+    def pathOf(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".s")
+
+
+# the AST of a function as a sequence of strings, in preorder: the name, the operator (if any) and the number of
+# children of each node, and the text of each leaf (identifiers, literals and types);
+# walked with an explicit stack, as the recursive `Node.__str__` fails on deeply nested code
+def serialize(func: Function) -> Iterator[str]:
+    stack: list = [func]
+    while stack:
+        element = stack.pop()
+        if isinstance(element, list):
+            yield "list {}".format(len(element))
+            stack.extend(reversed(element))
+        elif element.is_leaf():
+            yield str(element)
+        else:
+            op = getattr(element, "op", None)
+            yield "{} {} {}".format(element.name, "" if op is None else op.value, len(element))
+            stack.extend(reversed(list(element)))
+
+
+# the signatures of all global symbols referred to in a function (resolved by the namer)
+def referencedGlobals(func: Function) -> set[str]:
+    signatures = set()
+    stack: list[Node] = [func]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Identifier):
+            symbol = node.getattr("symbol")
+            if isinstance(symbol, FuncSymbol):
+                signatures.add("{} ({})".format(symbol, ", ".join(map(str, symbol.para_type))))
+            elif isinstance(symbol, VarSymbol) and symbol.isGlobal:
+                signatures.add(str(symbol))
+        for child in node:
+            if isinstance(child, Node):
+                stack.append(child)
+            elif isinstance(child, list):
+                stack.extend(item for item in child if isinstance(item, Node))
+    return signatures
+
+
+# a hash of the source code of the compiler, computed once
+@functools.cache
+def compilerVersion() -> str:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    h = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        if dirpath == root:
+            dirnames[:] = [d for d in ("backend", "frontend", "utils") if d in dirnames]
+        dirnames.sort()
+        for filename in sorted(filenames):
+            # parsetab.py is generated by ply.yacc
+            if filename.endswith(".py") and filename != "parsetab.py":
+                path = os.path.join(dirpath, filename)
+                with open(path, "rb") as f:
+                    h.update(os.path.relpath(path, root).encode() + b"\0" + f.read())
+    return h.hexdigest()
@@ -0,0 +1,278 @@
+from typing import BinaryIO, Union
+
+from utils.elfwriter import ElfSymbol, ElfWriter, RelocType, Section
+from utils.label.funclabel import FuncLabel
+from utils.label.label import Label
+from utils.riscv import Riscv, isImm12, splitImm
+from utils.tac.nativeinstr import NativeInstr
+from utils.tac.reg import Reg
+from utils.tac.tacinstr import TACInstr
+
+"""
+ObjCodePrinter: a printer with the same interface as AsmCodePrinter,
+which encodes the instructions into RV32IM machine code and writes an ELF relocatable object on `close`
+
+Every label becomes a symbol of .text, like an assembler would do.
+Jumps and branches are resolved here (all their targets are in the same function),
+a branch whose target is out of the +-4KiB range is turned into an inverted branch over a `jal`.
+`call` and `la` are left to the linker by relocations.
+"""
+
+
+# encoders of the RV32IM instruction formats
+def encodeR(opcode: int, funct3: int, funct7: int, rd: int, rs1: int, rs2: int) -> int:
+    return (funct7 << 25) | (rs2 << 20) | (rs1 << 15) | (funct3 << 12) | (rd << 7) | opcode
+
+
+def encodeI(opcode: int, funct3: int, rd: int, rs1: int, imm: int) -> int:
+    assert isImm12(imm)
+    return ((imm & 0xFFF) << 20) | (rs1 << 15) | (funct3 << 12) | (rd << 7) | opcode
+
+
+def encodeS(opcode: int, funct3: int, rs1: int, rs2: int, imm: int) -> int:
+    assert isImm12(imm)
+    imm &= 0xFFF
+    return ((imm >> 5) << 25) | (rs2 << 20) | (rs1 << 15) | (funct3 << 12) | ((imm & 0x1F) << 7) | opcode
+
+
+def encodeB(funct3: int, rs1: int, rs2: int, offset: int) -> int:
+    assert -4096 <= offset < 4096 and offset % 2 == 0
+    imm = offset & 0x1FFF
+    return (
+        ((imm >> 12) << 31) | (((imm >> 5) & 0x3F) << 25) | (rs2 << 20) | (rs1 << 15)
+        | (funct3 << 12) | (((imm >> 1) & 0xF) << 8) | (((imm >> 11) & 1) << 7) | 0x63
+    )
+
+
+def encodeU(opcode: int, rd: int, imm: int) -> int:
+    return ((imm & 0xFFFFF) << 12) | (rd << 7) | opcode
+
+
+def encodeJ(rd: int, offset: int) -> int:
+    if not (-(1 << 20) <= offset < (1 << 20)):
+        raise ValueError("jump offset {} out of range".format(offset))
+    imm = offset & 0x1FFFFF
+    return (
+        ((imm >> 20) << 31) | (((imm >> 1) & 0x3FF) << 21) | (((imm >> 11) & 1) << 20)
+        | (((imm >> 12) & 0xFF) << 12) | (rd << 7) | 0x6F
+    )
+
+
+OP = 0x33
+OP_IMM = 0x13
+LOAD = 0x03
+STORE = 0x23
+LUI = 0x37
+AUIPC = 0x17
+JALR = 0x67
+
+# funct3, funct7 of the R-type instructions
+R_TYPES = {
+    "add": (0, 0x00), "sub": (0, 0x20), "slt": (2, 0x00), "sltu": (3, 0x00), "xor": (4, 0x00),
+    "or": (6, 0x00), "and": (7, 0x00),
+    "mul": (0, 0x01), "div": (4, 0x01), "rem": (6, 0x01),
+}
+
+BRANCH_FUNCT3 = {"beq": 0, "bne": 1}
+
+ZERO = Riscv.ZERO.id
+RA = Riscv.RA.id
+
+
+class ObjCodePrinter:
+    # an item of a function: an encoded instruction, a label or an instruction to be resolved in layout:
+    #   ("b", funct3, rs1, rs2, target)   a branch
+    #   ("j", rd, target)                 a jump
+    #   ("call", symbol) / ("la", rd, symbol), which take 8 bytes and get relocations
+    Item = Union[int, Label, tuple]
+
+    def __init__(self, output: BinaryIO) -> None:
+        self.output = output
+        self.writer = ElfWriter()
+        # labels in .text, from name to offset
+        self.labels: dict[str, int] = {}
+        # the items of the current function, encoded when the function is flushed
+        self.items: list[ObjCodePrinter.Item] = []
+
+    # directives and comments only matter in assembly
+    def printf(self, fmt: str, **args):
+        pass
+
+    def println(self, fmt: str, **args):
+        pass
+
+    def printComment(self, comment: str):
+        pass
+
+    def printSection(self, section: str):
+        pass
+
+    def printGlobal(self, symbol: str):
+        self.writer.markGlobal(symbol)
+
+    def printLabel(self, label: Label):
+        self.items.append(label)
+
+    def printGlobalVar(self, symbol: str, value: int):
+        self.writer.addData(symbol, [value], 4)
+        self.writer.markGlobal(symbol)
+
+    def printGlobalArray(self, symbol: str, value: int):
+        self.writer.addData(symbol, None, value)
+        self.writer.markGlobal(symbol)
+
+    def printGlobalInitArray(self, symbol: str, vals: list[int]):
+        self.writer.addData(symbol, vals, 4 * len(vals))
+        self.writer.markGlobal(symbol)
+
+    def printInstr(self, instr: Union[NativeInstr, TACInstr]):
+        if instr.isLabel():
+            self.items.append(instr.label)
+        else:
+            self.encode(instr)
+
+    def printCode(self, code: str):
+        raise ValueError("assembly code can not be put into an object file")
+
+    # lay out the pending function and append it to .text
+    def flush(self) -> None:
+        if not self.items:
+            return
+        text = self.writer.text
+        base = len(text)
+        longBranches: set[int] = set()
+        # a branch is made long when its target is out of range, which may push other targets away,
+        # so repeat until nothing changes (branches only ever grow, so this terminates)
+        while True:
+            offset = base
+            positions = []
+            for index, item in enumerate(self.items):
+                positions.append(offset)
+                if isinstance(item, Label):
+                    self.labels[item.name] = offset
+                elif isinstance(item, int):
+                    offset += 4
+                elif item[0] == "b":
+                    offset += 8 if index in longBranches else 4
+                elif item[0] == "j":
+                    offset += 4
+                else:
+                    offset += 8
+            changed = False
+            for index, item in enumerate(self.items):
+                if isinstance(item, tuple) and item[0] == "b" and index not in longBranches:
+                    distance = self.labels[item[4]] - positions[index]
+                    if not (-4096 <= distance < 4096):
+                        longBranches.add(index)
+                        changed = True
+            if not changed:
+                break
+
+        words = []
+        for index, item in enumerate(self.items):
+            position = positions[index]
+            if isinstance(item, Label):
+                type = ElfSymbol.FUNC if isinstance(item, FuncLabel) else ElfSymbol.NOTYPE
+                self.writer.addSymbol(item.name, Section.TEXT, position, type=type)
+            elif isinstance(item, int):
+                words.append(item)
+            elif item[0] == "b":
+                _, funct3, rs1, rs2, target = item
+                if index in longBranches:
+                    words.append(encodeB(funct3 ^ 1, rs1, rs2, 8))
+                    words.append(encodeJ(ZERO, self.labels[target] - position - 4))
+                else:
+                    words.append(encodeB(funct3, rs1, rs2, self.labels[target] - position))
+            elif item[0] == "j":
+                words.append(encodeJ(item[1], self.labels[item[2]] - position))
+            elif item[0] == "call":
+                self.writer.addReloc(position, item[1], RelocType.R_RISCV_CALL_PLT)
+                words.append(encodeU(AUIPC, RA, 0))
+                words.append(encodeI(JALR, 0, RA, RA, 0))
+            else:
+                _, rd, symbol = item
+                self.writer.addReloc(position, symbol, RelocType.R_RISCV_HI20)
+                self.writer.addReloc(position + 4, symbol, RelocType.R_RISCV_LO12_I)
+                words.append(encodeU(LUI, rd, 0))
+                words.append(encodeI(OP_IMM, 0, rd, rd, 0))
+        for word in words:
+            text += word.to_bytes(4, "little")
+        self.items.clear()
+
+    # write the object file
+    def close(self) -> str:
+        self.flush()
+        self.writer.write(self.output)
+        self.output.flush()
+        return ""
+
+    def encode(self, instr: Union[NativeInstr, TACInstr]) -> None:
+        # a NativeInstr selected from an instr of `Riscv` refers to it as its opcode
+        op = instr.op if isinstance(instr, NativeInstr) and instr.op is not None else instr
+        if isinstance(instr, NativeInstr) and instr.op is None and type(instr) is NativeInstr:
+            # a comment
+            return
+        dsts = [reg.id for reg in instr.dsts]
+        srcs = [reg.id for reg in instr.srcs]
+        items = self.items
+
+        if isinstance(op, Riscv.Move):
+            items.append(encodeI(OP_IMM, 0, dsts[0], srcs[0], 0))
+        elif isinstance(op, Riscv.LoadImm):
+            self.encodeLoadImm(dsts[0], op.value)
+        elif isinstance(op, Riscv.ImmAdd):
+            items.append(encodeI(OP_IMM, 0, dsts[0], srcs[0], op.value))
+        elif isinstance(op, (Riscv.SPAdd, Riscv.FPAdd)):
+            items.append(encodeI(OP_IMM, 0, dsts[0], srcs[0], op.offset))
+        elif isinstance(op, Riscv.Unary):
+            self.encodeUnary(op.op, dsts[0], srcs[0])
+        elif isinstance(op, Riscv.Binary):
+            if op.op == "sgt":
+                items.append(encodeR(OP, *R_TYPES["slt"], dsts[0], srcs[1], srcs[0]))
+            else:
+                items.append(encodeR(OP, *R_TYPES[op.op], dsts[0], srcs[0], srcs[1]))
+        elif isinstance(op, (Riscv.LoadIntLiteral, Riscv.NativeLoadWord)):
+            items.append(encodeI(LOAD, 2, dsts[0], srcs[0], op.offset))
+        elif isinstance(op, (Riscv.StoreIntLiteral, Riscv.NativeStoreWord)):
+            items.append(encodeS(STORE, 2, srcs[1], srcs[0], op.offset))
+        elif isinstance(op, Riscv.LoadUpperImm):
+            items.append(encodeU(LUI, dsts[0], op.value))
+        elif isinstance(op, Riscv.LoadAddress):
+            items.append(("la", dsts[0], op.symbol))
+        elif isinstance(op, Riscv.Branch):
+            items.append(("b", BRANCH_FUNCT3[op.op], ZERO, srcs[0], op.target.name))
+        elif isinstance(op, (Riscv.Jump, Riscv.JumpToEpilogue)):
+            items.append(("j", ZERO, op.label.name))
+        elif isinstance(op, Riscv.Call):
+            items.append(("call", op.target.name))
+        elif isinstance(op, Riscv.NativeReturn):
+            items.append(encodeI(JALR, 0, ZERO, RA, 0))
+        else:
+            raise NotImplementedError("can not encode {}".format(type(op).__name__))
+
+    # li: addi if the value fits in 12 bits, otherwise lui (+ addi)
+    def encodeLoadImm(self, rd: int, value: int) -> None:
+        value = ((value & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000
+        if isImm12(value):
+            self.items.append(encodeI(OP_IMM, 0, rd, ZERO, value))
+            return
+        hi, lo = splitImm(value)
+        self.items.append(encodeU(LUI, rd, hi))
+        if lo != 0:
+            self.items.append(encodeI(OP_IMM, 0, rd, rd, lo))
+
+    def encodeUnary(self, op: str, rd: int, rs: int) -> None:
+        if op == "neg":
+            self.items.append(encodeR(OP, *R_TYPES["sub"], rd, ZERO, rs))
+        elif op == "not":
+            self.items.append(encodeI(OP_IMM, 4, rd, rs, -1))
+        elif op == "seqz":
+            self.items.append(encodeI(OP_IMM, 3, rd, rs, 1))
+        elif op == "snez":
+            self.items.append(encodeR(OP, *R_TYPES["sltu"], rd, ZERO, rs))
+        elif op == "sltz":
+            self.items.append(encodeR(OP, *R_TYPES["slt"], rd, rs, ZERO))
+        elif op == "sgtz":
+            self.items.append(encodeR(OP, *R_TYPES["slt"], rd, ZERO, rs))
+        else:
+            raise NotImplementedError("can not encode {}".format(op))
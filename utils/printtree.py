@@ -1,5 +1,11 @@
 from frontend.ast.node import Node
 
+# the end of the children of a node or a list, printed as `line` (if any)
+class _Close:
+    def __init__(self, line) -> None:
+        self.line = line
+
+
 #! 打印 AST 结构
 class TreePrinter:
     l = "["
@@ -10,38 +16,43 @@ class TreePrinter:
         self.indentLen = indentLen
         self.indentNum = 0
 
+    #! 以显式栈代替递归, 栈中的 `_Close` 表示其之前压入的元素都已打印完毕
     def work(self, element) -> None:
-        if element is None:
-            self.printLine("<None: here is a bug>")
+        stack = [element]
+        while stack:
+            element = stack.pop()
+            if isinstance(element, _Close):
+                self.decIndent()
+                if element.line is not None:
+                    self.printLine(element.line)
 
-        elif isinstance(element, Node):
-            if element.is_leaf():
-                self.printLine(str(element))
-                return
-
-            if len(element) == 0:
-                self.printLine(f"{element.name} {self.lr}")
-                return
-
-            self.printLine(f"{element.name} {self.l}")
-            self.incIndent()
-            for it in element:
-                self.work(it)
-            self.decIndent()
-            self.printLine(self.r)
-
-        elif isinstance(element, list):
-            self.printLine("List")
-            self.incIndent()
-            if len(element) == 0:
-                self.printLine("<empty>")
-            else:
-                for it in element:
-                    self.work(it)
-            self.decIndent()
+            elif element is None:
+                self.printLine("<None: here is a bug>")
+
+            elif isinstance(element, Node):
+                if element.is_leaf():
+                    self.printLine(str(element))
+                    continue
 
-        else:
-            self.printLine(str(element))
+                if len(element) == 0:
+                    self.printLine(f"{element.name} {self.lr}")
+                    continue
+
+                self.printLine(f"{element.name} {self.l}")
+                self.incIndent()
+                stack.append(_Close(self.r))
+                stack.extend(reversed(list(element)))
+
+            elif isinstance(element, list):
+                self.printLine("List")
+                self.incIndent()
+                if len(element) == 0:
+                    self.printLine("<empty>")
+                stack.append(_Close(None))
+                stack.extend(reversed(element))
+
+            else:
+                self.printLine(str(element))
 
     def outputIndent(self) -> None:
         if self.indentNum > 0:
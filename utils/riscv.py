@@ -1,11 +1,11 @@
-from typing import Final, Optional
+from typing import Final, Optional, Sequence
 
 from utils.label.funclabel import FuncLabel
 from utils.label.label import Label, LabelKind
 from utils.tac.nativeinstr import NativeInstr
 from utils.tac.reg import Reg
 from utils.tac.tacinstr import TACInstr
-from utils.tac.tacop import InstrKind
+from utils.tac.tacop import CondBranchOp, InstrKind
 from utils.tac.temp import Temp
 
 from enum import Enum, auto, unique
@@ -14,6 +14,18 @@ WORD_SIZE: Final[int] = 4  # in bytes
 MAX_INT: Final[int] = 0x7FFF_FFFF
 
 
+# whether a value fits in the 12-bit signed immediate of addi/lw/sw
+def isImm12(value: int) -> bool:
+    return -2048 <= value <= 2047
+
+
+# split a 32-bit value into (hi, lo) so that (hi << 12) + lo == value, where lo fits in 12 bits
+def splitImm(value: int) -> tuple[int, int]:
+    lo = ((value & 0xFFF) ^ 0x800) - 0x800
+    hi = ((value - lo) >> 12) & 0xFFFFF
+    return (hi, lo)
+
+
 @unique
 class RvUnaryOp(Enum):
     NEG = auto()
@@ -70,11 +82,16 @@ class Riscv:
     T5 = Reg(30, "t5")
     T6 = Reg(31, "t6")
 
+    NUM_REGS = 32
+
     CallerSaved = [T0, T1, T2, T3, T4, T5, T6, A0, A1, A2, A3, A4, A5, A6, A7]
 
     CalleeSaved = [S1, S2, S3, S4, S5, S6, S7, S8, S9, S10, S11]
 
-    AllocatableRegs = CallerSaved + CalleeSaved
+    # reserved (never allocated) for materializing immediates and offsets beyond 12 bits
+    SCRATCH = T0
+
+    AllocatableRegs = CallerSaved[1:] + CalleeSaved
 
     ArgRegs = [A0, A1, A2, A3, A4, A5, A6, A7]
 
@@ -87,102 +104,130 @@ class Riscv:
     # Todo FMT4
 
     class JumpToEpilogue(TACInstr):
+        __slots__ = ()
+
         def __init__(self, label: Label) -> None:
             super().__init__(
                 InstrKind.RET,
-                [],
-                [],
+                (),
+                (),
                 Label(LabelKind.TEMP, label.name + Riscv.EPILOGUE_SUFFIX),
             )
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             return "j " + str(self.label)
 
     class RiscvLabel(TACInstr):
+        __slots__ = ()
+
         def __init__(self, label: Label) -> None:
-            super().__init__(InstrKind.LABEL, [], [], label)
+            super().__init__(InstrKind.LABEL, (), (), label)
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             return str(self.label) + ":"
 
         def isLabel(self) -> bool:
             return True
 
     class LoadImm(TACInstr):
+        __slots__ = ("value",)
+
         def __init__(self, dst: Temp, value: int) -> None:
-            super().__init__(InstrKind.SEQ, [dst], [], None)
+            super().__init__(InstrKind.SEQ, (dst,), (), None)
             self.value = value
 
-        def __str__(self) -> str:
-            return "li " + Riscv.FMT2.format(str(self.dsts[0]), self.value)
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
+            return "li " + Riscv.FMT2.format(str(dsts[0]), self.value)
 
     class Move(TACInstr):
+        __slots__ = ()
+
         def __init__(self, dst: Temp, src: Temp) -> None:
-            super().__init__(InstrKind.SEQ, [dst], [src], None)
+            super().__init__(InstrKind.SEQ, (dst,), (src,), None)
 
-        def __str__(self) -> str:
-            return "mv " + Riscv.FMT2.format(str(self.dsts[0]), str(self.srcs[0]))
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
+            return "mv " + Riscv.FMT2.format(str(dsts[0]), str(srcs[0]))
 
     class Unary(TACInstr):
+        __slots__ = ("op",)
+
         def __init__(self, op: RvUnaryOp, dst: Temp, src: Temp) -> None:
-            super().__init__(InstrKind.SEQ, [dst], [src], None)
+            super().__init__(InstrKind.SEQ, (dst,), (src,), None)
             self.op = op.__str__()[10:].lower()
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             return "{} ".format(self.op) + Riscv.FMT2.format(
-                str(self.dsts[0]), str(self.srcs[0])
+                str(dsts[0]), str(srcs[0])
             )
 
     class Binary(TACInstr):
+        __slots__ = ("op",)
+
         def __init__(self, op: RvBinaryOp, dst: Temp, src0: Temp, src1: Temp) -> None:
-            super().__init__(InstrKind.SEQ, [dst], [src0, src1], None)
+            super().__init__(InstrKind.SEQ, (dst,), (src0, src1), None)
             self.op = op.__str__()[11:].lower()
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             return "{} ".format(self.op) + Riscv.FMT3.format(
-                str(self.dsts[0]), str(self.srcs[0]), str(self.srcs[1])
+                str(dsts[0]), str(srcs[0]), str(srcs[1])
             )
 
     class Call(TACInstr):
+        __slots__ = ()
+
+        target = property(lambda self: self.label)
+
         def __init__(self, target: Label) -> None:
-            super().__init__(InstrKind.CALL, [], [], target)
-            self.target = target
+            super().__init__(InstrKind.CALL, (), (), target)
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             return "call " + super(FuncLabel, self.target).__str__()
 
     class Param(TACInstr):
+        __slots__ = ()
+
         def __init__(self, src: Temp) -> None:
-            super().__init__(InstrKind.PARAM, [], [src], None)
+            super().__init__(InstrKind.PARAM, (), (src,), None)
 
     class Branch(TACInstr):
-        def __init__(self, cond: Temp, target: Label) -> None:
-            super().__init__(InstrKind.COND_JMP, [], [cond], target)
-            self.target = target
+        __slots__ = ("op",)
+
+        target = property(lambda self: self.label)
+
+        def __init__(self, op: CondBranchOp, cond: Temp, target: Label) -> None:
+            super().__init__(InstrKind.COND_JMP, (), (cond,), target)
+            self.op = op.name.lower()
         
-        def __str__(self) -> str:
-            return "beq " + Riscv.FMT3.format(str(Riscv.ZERO), str(self.srcs[0]), str(self.target))
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
+            return "{} ".format(self.op) + Riscv.FMT3.format(str(Riscv.ZERO), str(srcs[0]), str(self.target))
 
     class Jump(TACInstr):
+        __slots__ = ()
+
+        target = property(lambda self: self.label)
+
         def __init__(self, target: Label) -> None:
-            super().__init__(InstrKind.JMP, [], [], target)
-            self.target = target
+            super().__init__(InstrKind.JMP, (), (), target)
         
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             return "j " + str(self.target)
 
     class ImmAdd(TACInstr):
+        __slots__ = ("value",)
+
         def __init__(self, dst: Temp, src: Temp, value: int):
-            super().__init__(InstrKind.SEQ, [dst], [src], None)
+            super().__init__(InstrKind.SEQ, (dst,), (src,), None)
             self.value = value
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             assert -2048 <= self.value <= 2047  # Riscv imm [11:0]
             return "addi " + Riscv.FMT3.format(
-                str(self.dsts[0]), str(self.srcs[0]), str(self.value)
+                str(dsts[0]), str(srcs[0]), str(self.value)
             )
 
     class SPAdd(NativeInstr):
+        __slots__ = ("offset",)
+
         def __init__(self, offset: int) -> None:
             super().__init__(InstrKind.SEQ, [Riscv.SP], [Riscv.SP], None)
             self.offset = offset
@@ -194,6 +239,8 @@ class Riscv:
             )
 
     class FPAdd(NativeInstr):
+        __slots__ = ("offset",)
+
         def __init__(self, offset: int) -> None:
             super().__init__(InstrKind.SEQ, [Riscv.FP], [Riscv.SP], None)
             self.offset = offset
@@ -204,7 +251,20 @@ class Riscv:
                 str(Riscv.FP), str(Riscv.SP), str(self.offset)
             )
 
+    class LoadUpperImm(NativeInstr):
+        __slots__ = ("value",)
+
+        def __init__(self, dst: Reg, value: int) -> None:
+            super().__init__(InstrKind.SEQ, [dst], [], None)
+            self.value = value
+
+        def __str__(self) -> str:
+            assert 0 <= self.value <= 0xFFFFF  # Riscv imm [31:12]
+            return "lui " + Riscv.FMT2.format(str(self.dsts[0]), str(self.value))
+
     class NativeStoreWord(NativeInstr):
+        __slots__ = ("offset",)
+
         def __init__(self, src: Reg, base: Reg, offset: int) -> None:
             super().__init__(InstrKind.SEQ, [], [src, base], None)
             self.offset = offset
@@ -216,6 +276,8 @@ class Riscv:
             )
 
     class NativeLoadWord(NativeInstr):
+        __slots__ = ("offset",)
+
         def __init__(self, dst: Reg, base: Reg, offset: int) -> None:
             super().__init__(InstrKind.SEQ, [dst], [base], None)
             self.offset = offset
@@ -227,6 +289,8 @@ class Riscv:
             )
 
     class NativeReturn(NativeInstr):
+        __slots__ = ()
+
         def __init__(self) -> None:
             super().__init__(InstrKind.RET, [Riscv.RA], [], None)
 
@@ -234,33 +298,39 @@ class Riscv:
             return "ret"
 
     class LoadAddress(TACInstr):
+        __slots__ = ("symbol",)
+
         def __init__(self, symbol: str, dst: Temp) -> None:
-            super().__init__(InstrKind.SEQ, [dst], [], None)
+            super().__init__(InstrKind.SEQ, (dst,), (), None)
             self.symbol = symbol
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             return "la " + Riscv.FMT2.format(
-                str(self.dsts[0]), self.symbol
+                str(dsts[0]), self.symbol
             )
 
     class LoadIntLiteral(TACInstr):
+        __slots__ = ("offset",)
+
         def __init__(self, dst: Temp, base: Temp, offset: int) -> None:
-            super().__init__(InstrKind.SEQ, [dst], [base], None)
+            super().__init__(InstrKind.SEQ, (dst,), (base,), None)
             self.offset = offset
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             assert -2048 <= self.offset <= 2047  # Riscv imm [11:0]
             return "lw " + Riscv.FMT_OFFSET.format(
-                str(self.dsts[0]), str(self.offset), str(self.srcs[0])
+                str(dsts[0]), str(self.offset), str(srcs[0])
             )
 
     class StoreIntLiteral(TACInstr):
+        __slots__ = ("offset",)
+
         def __init__(self, src: Temp, base: Temp, offset: int) -> None:
-            super().__init__(InstrKind.SEQ, [], [src, base], None)
+            super().__init__(InstrKind.SEQ, (), (src, base), None)
             self.offset = offset
 
-        def __str__(self) -> str:
+        def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
             assert -2048 <= self.offset <= 2047  # Riscv imm [11:0]
             return "sw " + Riscv.FMT_OFFSET.format(
-                str(self.srcs[0]), str(self.offset), str(self.srcs[1])
+                str(srcs[0]), str(self.offset), str(srcs[1])
             )
@@ -1,37 +1,49 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from utils.label.label import Label
 from utils.tac.reg import Reg
 
 from .tacop import InstrKind
 
+if TYPE_CHECKING:
+    from .tacinstr import TACInstr
 
+
+#! 汇编指令只记录操作码 (op) 与寄存器操作数, 直到输出时才格式化为字符串
 class NativeInstr:
+    __slots__ = ("kind", "dsts", "srcs", "label", "op", "text")
+
     def __init__(
         self,
         kind: InstrKind,
-        dsts: list[Reg],
-        srcs: list[Reg],
+        dsts: Sequence[Reg],
+        srcs: Sequence[Reg],
         label: Optional[Label],
-        instrString: Optional[str] = None,
+        op: Optional["TACInstr"] = None,
+        text: Optional[str] = None,
     ) -> None:
         self.kind = kind
         self.dsts = dsts
         self.srcs = srcs
         self.label = label
-        self.instrString = instrString
+        # the instruction this one is selected from, which knows how to format itself with registers
+        self.op = op
+        # fixed text (e.g. a comment)
+        self.text = text
 
     def __str__(self) -> str:
-        assert self.instrString is not None
-        return self.instrString
+        if self.op is not None:
+            return self.op.format(self.dsts, self.srcs)
+        assert self.text is not None
+        return self.text
 
     def nativeComment(comment: str):
-        return NativeInstr(InstrKind.SEQ, [], [], None, comment)
+        return NativeInstr(InstrKind.SEQ, [], [], None, text=comment)
 
-    def getRead(self) -> list[Reg]:
+    def getRead(self) -> Sequence[Reg]:
         return self.srcs
 
-    def getWritten(self) -> list[Reg]:
+    def getWritten(self) -> Sequence[Reg]:
         return self.dsts
 
     def isLabel(self) -> bool:
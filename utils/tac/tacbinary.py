@@ -0,0 +1,407 @@
+import mmap
+import struct
+from typing import BinaryIO, Iterator
+
+from frontend.ast.tree import Declaration, Identifier, InitList, IntLiteral, TInt
+from frontend.symbol.varsymbol import VarSymbol
+from frontend.type import INT, ArrayType, DecafType
+from utils.label.funclabel import FuncLabel
+from utils.label.label import Label, LabelKind
+
+from .tacfunc import TACFunc
+from .tacinstr import *
+from .tacprog import TACProg
+from .tacvisitor import TACVisitor
+from .temp import Temp
+
+"""
+TACBinWriter / TACBinReader: a compact binary format of TACProg
+
+    file    := MAGIC globals func* index
+    globals := n:varint (name:str dims init)*n                      the global vars (TACProg.vars)
+    dims    := n:varint dim:varint*n                                 empty for an int, otherwise the array dims
+    init    := 0 | 1 value:svarint | 2 n:varint value:svarint*n      none / an int / an init list
+    func    := entry:varint numArgs:varint numTemps:varint
+               n:varint (kind:byte name:str)*n                       the label table, labels are referred to by index
+               n:varint (name:str isGlobal:byte [dims])*n            the symbols of arrays, dims only for local ones
+               n:varint instr*n                                      an opcode byte followed by its operands
+    index   := (offset:u32 size:u32)*n n:u32 indexOffset:u32         at the end, so that functions can be written one by one
+
+Temps are varints of their indexes, signed values are zigzag varints.
+The reader maps the file into memory and decodes a function only when it is asked for,
+`p_arrays` of a function is only used by TACGen and is not kept.
+"""
+
+MAGIC = b"MDTAC\x01"
+
+# opcodes
+ASSIGN = 0
+LOAD_IMM4 = 1
+UNARY = 2
+BINARY = 3
+BRANCH = 4
+COND_BRANCH = 5
+PARAM = 6
+CALL = 7
+RETURN = 8
+RETURN_VOID = 9
+LOAD_ADDRESS = 10
+LOAD_INT_LITERAL = 11
+STORE_INT_LITERAL = 12
+MEMO = 13
+MARK = 14
+
+
+def writeVarint(buf: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+# zigzag encoding, so that small negative values are short as well
+def writeSVarint(buf: bytearray, value: int) -> None:
+    writeVarint(buf, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+
+def writeStr(buf: bytearray, s: str) -> None:
+    data = s.encode()
+    writeVarint(buf, len(data))
+    buf += data
+
+
+def dimsOf(type: DecafType) -> list[int]:
+    dims = []
+    while isinstance(type, ArrayType):
+        dims.append(type.length)
+        type = type.base
+    return dims
+
+
+def writeDims(buf: bytearray, type: DecafType) -> None:
+    dims = dimsOf(type)
+    writeVarint(buf, len(dims))
+    for dim in dims:
+        writeVarint(buf, dim)
+
+
+class TACBinWriter:
+    def __init__(self, output: BinaryIO, vars: dict[str, Declaration]) -> None:
+        self.output = output
+        self.offset = 0
+        # (offset, size) of the functions written
+        self.index: list[tuple[int, int]] = []
+
+        buf = bytearray(MAGIC)
+        writeVarint(buf, len(vars))
+        for name, decl in vars.items():
+            symbol: VarSymbol = decl.getattr("symbol")
+            writeStr(buf, name)
+            writeDims(buf, symbol.type)
+            if isinstance(symbol.initValue, list):
+                buf.append(2)
+                writeVarint(buf, len(symbol.initValue))
+                for value in symbol.initValue:
+                    writeSVarint(buf, value)
+            elif isinstance(symbol.type, ArrayType):
+                buf.append(0)
+            else:
+                buf.append(1)
+                writeSVarint(buf, symbol.initValue)
+        self.write(buf)
+
+    def writeFunc(self, func: TACFunc) -> None:
+        encoder = _FuncEncoder(func)
+        for instr in func.getInstrSeq():
+            instr.accept(encoder)
+
+        buf = bytearray()
+        writeVarint(buf, encoder.labelIndex(func.entry))
+        writeVarint(buf, func.numArgs)
+        writeVarint(buf, len(func.temps))
+        writeVarint(buf, len(encoder.labels))
+        for label in encoder.labels:
+            buf.append(label.kind.value)
+            writeStr(buf, label.name)
+        writeVarint(buf, len(encoder.symbols))
+        for symbol in encoder.symbols:
+            writeStr(buf, symbol.name)
+            buf.append(symbol.isGlobal)
+            if not symbol.isGlobal:
+                writeDims(buf, symbol.type)
+        writeVarint(buf, len(func.getInstrSeq()))
+        buf += encoder.code
+
+        self.index.append((self.offset, len(buf)))
+        self.write(buf)
+
+    def close(self) -> None:
+        buf = bytearray()
+        for offset, size in self.index:
+            buf += struct.pack("<II", offset, size)
+        buf += struct.pack("<II", len(self.index), self.offset)
+        self.write(buf)
+        self.output.flush()
+
+    def write(self, buf: bytearray) -> None:
+        self.output.write(buf)
+        self.offset += len(buf)
+
+
+#! 将一个函数的指令编码为字节, 同时收集其用到的标签与数组符号
+class _FuncEncoder(TACVisitor):
+    def __init__(self, func: TACFunc) -> None:
+        self.code = bytearray()
+        self.labels: list[Label] = []
+        # labels of the same name are the same label (e.g. a FuncLabel is created at every call)
+        self.labelIndexes: dict[tuple[LabelKind, str], int] = {}
+        # local arrays come first, since all of them take space in the frame even if never referred to
+        self.symbols: list[VarSymbol] = list(func.arrays.values())
+        self.symbolIndexes: dict[tuple[str, bool], int] = {
+            (symbol.name, False): index for index, symbol in enumerate(self.symbols)
+        }
+
+    def labelIndex(self, label: Label) -> int:
+        key = (label.kind, label.name)
+        index = self.labelIndexes.get(key)
+        if index is None:
+            index = self.labelIndexes[key] = len(self.labels)
+            self.labels.append(label)
+        return index
+
+    def symbolIndex(self, symbol: VarSymbol) -> int:
+        key = (symbol.name, symbol.isGlobal)
+        index = self.symbolIndexes.get(key)
+        if index is None:
+            index = self.symbolIndexes[key] = len(self.symbols)
+            self.symbols.append(symbol)
+        return index
+
+    def emit(self, opcode: int, *operands: int) -> None:
+        self.code.append(opcode)
+        for operand in operands:
+            writeVarint(self.code, operand)
+
+    def visitOther(self, instr: TACInstr) -> None:
+        raise NotImplementedError("can not serialize {}".format(type(instr).__name__))
+
+    def visitAssign(self, instr: Assign) -> None:
+        self.emit(ASSIGN, instr.dst.index, instr.src.index)
+
+    def visitLoadImm4(self, instr: LoadImm4) -> None:
+        self.emit(LOAD_IMM4, instr.dst.index)
+        writeSVarint(self.code, instr.value)
+
+    def visitUnary(self, instr: Unary) -> None:
+        self.emit(UNARY, instr.op.value, instr.dst.index, instr.operand.index)
+
+    def visitBinary(self, instr: Binary) -> None:
+        self.emit(BINARY, instr.op.value, instr.dst.index, instr.lhs.index, instr.rhs.index)
+
+    def visitBranch(self, instr: Branch) -> None:
+        self.emit(BRANCH, self.labelIndex(instr.target))
+
+    def visitCondBranch(self, instr: CondBranch) -> None:
+        self.emit(COND_BRANCH, instr.op.value, instr.cond.index, self.labelIndex(instr.target))
+
+    def visitParam(self, instr: Param) -> None:
+        self.emit(PARAM, instr.param.index)
+
+    def visitCall(self, instr: Call) -> None:
+        self.emit(CALL, instr.param.index, self.labelIndex(instr.label))
+
+    def visitReturn(self, instr: Return) -> None:
+        if instr.value is None:
+            self.emit(RETURN_VOID)
+        else:
+            self.emit(RETURN, instr.value.index)
+
+    def visitLoadAddress(self, instr: LoadAddress) -> None:
+        self.emit(LOAD_ADDRESS, self.symbolIndex(instr.symbol), instr.dsts[0].index)
+
+    def visitLoadIntLiteral(self, instr: LoadIntLiteral) -> None:
+        self.emit(LOAD_INT_LITERAL, instr.dsts[0].index, instr.srcs[0].index)
+        writeSVarint(self.code, instr.offset)
+
+    def visitStoreIntLiteral(self, instr: StoreIntLiteral) -> None:
+        self.emit(STORE_INT_LITERAL, instr.srcs[0].index, instr.srcs[1].index)
+        writeSVarint(self.code, instr.offset)
+
+    def visitMemo(self, instr: Memo) -> None:
+        self.emit(MEMO)
+        writeStr(self.code, instr.msg)
+
+    def visitMark(self, instr: Mark) -> None:
+        self.emit(MARK, self.labelIndex(instr.label))
+
+
+# a cursor over the bytes of a function (or of the globals)
+class _Decoder:
+    def __init__(self, data: bytes, pos: int = 0) -> None:
+        self.data = data
+        self.pos = pos
+
+    def byte(self) -> int:
+        self.pos += 1
+        return self.data[self.pos - 1]
+
+    def varint(self) -> int:
+        data = self.data
+        pos = self.pos
+        value = data[pos]
+        pos += 1
+        if value >= 0x80:
+            value &= 0x7F
+            shift = 7
+            while True:
+                b = data[pos]
+                pos += 1
+                value |= (b & 0x7F) << shift
+                if b < 0x80:
+                    break
+                shift += 7
+        self.pos = pos
+        return value
+
+    def svarint(self) -> int:
+        value = self.varint()
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+    def string(self) -> str:
+        size = self.varint()
+        self.pos += size
+        return bytes(self.data[self.pos - size : self.pos]).decode()
+
+    def dims(self) -> list[int]:
+        return [self.varint() for _ in range(self.varint())]
+
+
+class TACBinReader:
+    """
+    Read a file written by TACBinWriter.
+    The file is mapped into memory, only the global vars are decoded upfront,
+    and a function is decoded every time it is asked for (by index or by iterating).
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[: len(MAGIC)] != MAGIC:
+            raise ValueError("{} is not a binary TAC file".format(path))
+
+        count, indexOffset = struct.unpack_from("<II", self.data, len(self.data) - 8)
+        self.index = [struct.unpack_from("<II", self.data, indexOffset + 8 * i) for i in range(count)]
+
+        self.vars: dict[str, Declaration] = {}
+        # the symbols of the global vars, shared by all the functions
+        self.globalSymbols: dict[str, VarSymbol] = {}
+        decoder = _Decoder(self.data, len(MAGIC))
+        for _ in range(decoder.varint()):
+            name = decoder.string()
+            dims = decoder.dims()
+            init = decoder.byte()
+            if init == 2:
+                value = [decoder.svarint() for _ in range(decoder.varint())]
+            elif init == 1:
+                value = decoder.svarint()
+            else:
+                value = 0
+            self.vars[name] = self.declare(name, dims, init, value)
+
+    # rebuild the declaration of a global var as the frontend would leave it
+    def declare(self, name: str, dims: list[int], init: int, value) -> Declaration:
+        symbol = VarSymbol(name, ArrayType.multidim(INT, *dims), True)
+        symbol.initValue = value
+        if not dims:
+            decl = Declaration(TInt(), Identifier(name), IntLiteral(value))
+        else:
+            initList = InitList([IntLiteral(v) for v in value]) if init == 2 else None
+            decl = Declaration(TInt(), Identifier(name), initList, [IntLiteral(dim) for dim in dims])
+        decl.setattr("symbol", symbol)
+        decl.setattr("type", symbol.type)
+        self.globalSymbols[name] = symbol
+        return decl
+
+    # a program whose functions are decoded lazily
+    def prog(self) -> TACProg:
+        return TACProg(self, self.vars)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self) -> Iterator[TACFunc]:
+        for i in range(len(self.index)):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> TACFunc:
+        offset, size = self.index[i]
+        d = _Decoder(self.data[offset : offset + size])
+        varint = d.varint
+
+        entryIndex = varint()
+        numArgs = varint()
+        temps = [Temp(index) for index in range(varint())]
+        labels: list[Label] = []
+        for _ in range(varint()):
+            kind = LabelKind(d.byte())
+            name = d.string()
+            labels.append(FuncLabel(name) if kind is LabelKind.FUNC else Label(kind, name))
+        symbols: list[VarSymbol] = []
+        arrays: dict[str, VarSymbol] = {}
+        for _ in range(varint()):
+            name = d.string()
+            if d.byte():
+                symbols.append(self.globalSymbols[name])
+            else:
+                symbol = VarSymbol(name, ArrayType.multidim(INT, *d.dims()))
+                arrays[name] = symbol
+                symbols.append(symbol)
+
+        func = TACFunc(labels[entryIndex], numArgs, arrays, [])
+        func.temps = temps
+        func.tempUsed = len(temps)
+        instrs = func.instrSeq
+        unaryOps = list(TacUnaryOp)
+        binaryOps = list(TacBinaryOp)
+        condOps = list(CondBranchOp)
+        for _ in range(varint()):
+            opcode = d.byte()
+            if opcode == BINARY:
+                op = binaryOps[varint() - 1]
+                instrs.append(Binary(op, temps[varint()], temps[varint()], temps[varint()]))
+            elif opcode == ASSIGN:
+                instrs.append(Assign(temps[varint()], temps[varint()]))
+            elif opcode == LOAD_IMM4:
+                instrs.append(LoadImm4(temps[varint()], d.svarint()))
+            elif opcode == UNARY:
+                op = unaryOps[varint() - 1]
+                instrs.append(Unary(op, temps[varint()], temps[varint()]))
+            elif opcode == BRANCH:
+                instrs.append(Branch(labels[varint()]))
+            elif opcode == COND_BRANCH:
+                op = condOps[varint() - 1]
+                instrs.append(CondBranch(op, temps[varint()], labels[varint()]))
+            elif opcode == PARAM:
+                instrs.append(Param(temps[varint()]))
+            elif opcode == CALL:
+                instrs.append(Call(temps[varint()], labels[varint()]))
+            elif opcode == RETURN:
+                instrs.append(Return(temps[varint()]))
+            elif opcode == RETURN_VOID:
+                instrs.append(Return(None))
+            elif opcode == LOAD_ADDRESS:
+                instrs.append(LoadAddress(symbols[varint()], temps[varint()]))
+            elif opcode == LOAD_INT_LITERAL:
+                instrs.append(LoadIntLiteral(temps[varint()], temps[varint()], d.svarint()))
+            elif opcode == STORE_INT_LITERAL:
+                instrs.append(StoreIntLiteral(temps[varint()], temps[varint()], d.svarint()))
+            elif opcode == MEMO:
+                instrs.append(Memo(d.string()))
+            elif opcode == MARK:
+                instrs.append(Mark(labels[varint()]))
+            else:
+                raise ValueError("bad opcode {} in function {}".format(opcode, func.entry.name))
+        return func
+
+    def close(self) -> None:
+        self.data.close()
@@ -4,6 +4,7 @@ from frontend.symbol.varsymbol import VarSymbol
 from utils.label.funclabel import FuncLabel
 
 from .tacinstr import TACInstr
+from .temp import Temp
 
 
 class TACFunc:
@@ -17,6 +18,8 @@ class TACFunc:
         self.entry = entry
         self.numArgs = numArgs
         self.instrSeq = []
+        # all the temps of this function, temps[i].index == i
+        self.temps: list[Temp] = []
         self.tempUsed = 0
         self.arrays = arrays
         self.p_arrays = p_arrays
@@ -27,6 +30,14 @@ class TACFunc:
     def getUsedTempCount(self) -> int:
         return self.tempUsed
 
+    def freshTemp(self) -> Temp:
+        temp = Temp(len(self.temps))
+        self.temps.append(temp)
+        return temp
+
+    def getTemp(self, index: int) -> Temp:
+        return self.temps[index]
+
     def add(self, instr: TACInstr) -> None:
         self.instrSeq.append(instr)
 
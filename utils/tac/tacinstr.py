@@ -1,5 +1,5 @@
 from enum import Enum, auto, unique
-from typing import Any, Optional, Union
+from typing import Any, Optional, Sequence, Union
 
 from utils.label.label import Label
 from utils.tac.nativeinstr import NativeInstr
@@ -10,24 +10,46 @@ from .tacvisitor import TACVisitor
 from .temp import Temp
 
 
+#! 指令的操作数统一存放在 dsts / srcs 两个元组中, 子类通过以下属性按名字访问, 不再重复保存
+def _dst(i: int) -> property:
+    return property(lambda self: self.dsts[i])
+
+
+def _src(i: int) -> property:
+    return property(lambda self: self.srcs[i])
+
+
 class TACInstr:
+    __slots__ = ("kind", "dsts", "srcs", "label", "read", "written")
+
     def __init__(
         self,
         kind: InstrKind,
-        dsts: list[Temp],
-        srcs: list[Temp],
+        dsts: tuple[Temp, ...],
+        srcs: tuple[Temp, ...],
         label: Optional[Label],
     ) -> None:
         self.kind = kind
-        self.dsts = dsts.copy()
-        self.srcs = srcs.copy()
+        self.dsts = dsts
+        self.srcs = srcs
         self.label = label
+        # indexes of the temps read / written, computed on first use and cached
+        # since liveness analysis asks for them again and again
+        self.read: Optional[tuple[int, ...]] = None
+        self.written: Optional[tuple[int, ...]] = None
 
-    def getRead(self) -> list[int]:
-        return [src.index for src in self.srcs]
+    def getRead(self) -> tuple[int, ...]:
+        if self.read is None:
+            self.read = tuple([src.index for src in self.srcs])
+        return self.read
 
-    def getWritten(self) -> list[int]:
-        return [dst.index for dst in self.dsts]
+    def getWritten(self) -> tuple[int, ...]:
+        if self.written is None:
+            self.written = tuple([dst.index for dst in self.dsts])
+        return self.written
+
+    def __str__(self) -> str:
+        return self.format(self.dsts, self.srcs)
 
     def isLabel(self) -> bool:
         return self.kind is InstrKind.LABEL
@@ -39,16 +61,14 @@ class TACInstr:
         return self.kind == InstrKind.RET
 
     #! 将 TACInstr 转换为 NativeInstr, 用于输出汇编指令
+    # the NativeInstr refers to this instr as its opcode, it is formatted only when printed
     def toNative(self, dstRegs: list[Reg], srcRegs: list[Reg]) -> NativeInstr:
-        oldDsts = dstRegs
-        oldSrcs = srcRegs
-        self.dsts = dstRegs
-        self.srcs = srcRegs
-        instrString = self.__str__()
-        newInstr = NativeInstr(self.kind, dstRegs, srcRegs, self.label, instrString)
-        self.dsts = oldDsts
-        self.srcs = oldSrcs
-        return newInstr
+        return NativeInstr(self.kind, dstRegs, srcRegs, self.label, self)
+
+    # format this instr with the given operands in place of its own ones
+    # (instrs which may be turned into NativeInstrs, i.e. those in `utils.riscv`, override it)
+    def format(self, dsts: Sequence[Temp], srcs: Sequence[Temp]) -> str:
+        raise NotImplementedError
 
     def accept(self, v: TACVisitor) -> None:
         pass
@@ -56,10 +76,13 @@ class TACInstr:
 
 # Assignment instruction.
 class Assign(TACInstr):
+    __slots__ = ()
+
+    dst = _dst(0)
+    src = _src(0)
+
     def __init__(self, dst: Temp, src: Temp) -> None:
-        super().__init__(InstrKind.SEQ, [dst], [src], None)
-        self.dst = dst
-        self.src = src
+        super().__init__(InstrKind.SEQ, (dst,), (src,), None)
 
     def __str__(self) -> str:
         return "%s = %s" % (self.dst, self.src)
@@ -70,9 +93,12 @@ class Assign(TACInstr):
 
 # Loading an immediate 32-bit constant.
 class LoadImm4(TACInstr):
+    __slots__ = ("value",)
+
+    dst = _dst(0)
+
     def __init__(self, dst: Temp, value: int) -> None:
-        super().__init__(InstrKind.SEQ, [dst], [], None)
-        self.dst = dst
+        super().__init__(InstrKind.SEQ, (dst,), (), None)
         self.value = value
 
     def __str__(self) -> str:
@@ -84,11 +110,14 @@ class LoadImm4(TACInstr):
 
 # Unary operations.
 class Unary(TACInstr):
+    __slots__ = ("op",)
+
+    dst = _dst(0)
+    operand = _src(0)
+
     def __init__(self, op: TacUnaryOp, dst: Temp, operand: Temp) -> None:
-        super().__init__(InstrKind.SEQ, [dst], [operand], None)
+        super().__init__(InstrKind.SEQ, (dst,), (operand,), None)
         self.op = op
-        self.dst = dst
-        self.operand = operand
 
     def __str__(self) -> str:
         opStr = {
@@ -104,12 +133,15 @@ class Unary(TACInstr):
 
 # Binary Operations.
 class Binary(TACInstr):
+    __slots__ = ("op",)
+
+    dst = _dst(0)
+    lhs = _src(0)
+    rhs = _src(1)
+
     def __init__(self, op: TacBinaryOp, dst: Temp, lhs: Temp, rhs: Temp) -> None:
-        super().__init__(InstrKind.SEQ, [dst], [lhs, rhs], None)
+        super().__init__(InstrKind.SEQ, (dst,), (lhs, rhs), None)
         self.op = op
-        self.dst = dst
-        self.lhs = lhs
-        self.rhs = rhs
 
     def __str__(self) -> str:
         opStr = {
@@ -135,9 +167,12 @@ class Binary(TACInstr):
 
 # Branching instruction.
 class Branch(TACInstr):
+    __slots__ = ()
+
+    target = property(lambda self: self.label)
+
     def __init__(self, target: Label) -> None:
-        super().__init__(InstrKind.JMP, [], [], target)
-        self.target = target
+        super().__init__(InstrKind.JMP, (), (), target)
 
     def __str__(self) -> str:
         return "branch %s" % str(self.target)
@@ -148,11 +183,14 @@ class Branch(TACInstr):
 
 # Branching with conditions.
 class CondBranch(TACInstr):
+    __slots__ = ("op",)
+
+    cond = _src(0)
+    target = property(lambda self: self.label)
+
     def __init__(self, op: CondBranchOp, cond: Temp, target: Label) -> None:
-        super().__init__(InstrKind.COND_JMP, [], [cond], target)
+        super().__init__(InstrKind.COND_JMP, (), (cond,), target)
         self.op = op
-        self.cond = cond
-        self.target = target
 
     def __str__(self) -> str:
         return "if (%s %s) branch %s" % (
@@ -167,9 +205,12 @@ class CondBranch(TACInstr):
 
 # Function parameter.
 class Param(TACInstr):
+    __slots__ = ()
+
+    param = _src(0)
+
     def __init__(self, param: Temp) -> None:
-        super().__init__(InstrKind.PARAM, [], [param], None)
-        self.param = param
+        super().__init__(InstrKind.PARAM, (), (param,), None)
 
     def __str__(self) -> str:
         return "PARAM " + str(self.param)
@@ -180,10 +221,12 @@ class Param(TACInstr):
 
 # Call instruction.
 class Call(TACInstr):
+    __slots__ = ()
+
+    param = _dst(0)
+
     def __init__(self, param: Temp, label: Label) -> None:
-        super().__init__(InstrKind.CALL, [param], [], label)
-        self.param = param
-        self.label = label
+        super().__init__(InstrKind.CALL, (param,), (), label)
 
     def __str__(self) -> str:
         return str(self.param) + " = CALL %s" % str(self.label)
@@ -194,12 +237,15 @@ class Call(TACInstr):
 
 # Return instruction.
 class Return(TACInstr):
+    __slots__ = ()
+
+    value = property(lambda self: self.srcs[0] if self.srcs else None)
+
     def __init__(self, value: Optional[Temp]) -> None:
         if value is None:
-            super().__init__(InstrKind.RET, [], [], None)
+            super().__init__(InstrKind.RET, (), (), None)
         else:
-            super().__init__(InstrKind.RET, [], [value], None)
-        self.value = value
+            super().__init__(InstrKind.RET, (), (value,), None)
 
     def __str__(self) -> str:
         return "return" if (self.value is None) else ("return " + str(self.value))
@@ -210,8 +256,10 @@ class Return(TACInstr):
 
 # Load Address instruction.
 class LoadAddress(TACInstr):
+    __slots__ = ("symbol",)
+
     def __init__(self, symbol, dst: Temp):
-        super().__init__(InstrKind.SEQ, [dst], [], None)
+        super().__init__(InstrKind.SEQ, (dst,), (), None)
         self.symbol = symbol
 
     def __str__(self) -> str:
@@ -223,8 +271,10 @@ class LoadAddress(TACInstr):
 
 # Load Word instruction.
 class LoadIntLiteral(TACInstr):
+    __slots__ = ("offset",)
+
     def __init__(self, dst: Temp, base: Temp, offset: int):
-        super().__init__(InstrKind.SEQ, [dst], [base], None)
+        super().__init__(InstrKind.SEQ, (dst,), (base,), None)
         self.offset = offset
 
     def __str__(self) -> str:
@@ -236,8 +286,10 @@ class LoadIntLiteral(TACInstr):
 
 # Store Word instruction.
 class StoreIntLiteral(TACInstr):
+    __slots__ = ("offset",)
+
     def __init__(self, src: Temp, base: Temp, offset: int):
-        super().__init__(InstrKind.SEQ, [], [src, base], None)
+        super().__init__(InstrKind.SEQ, (), (src, base), None)
         self.offset = offset
 
     def __str__(self) -> str:
@@ -249,8 +301,10 @@ class StoreIntLiteral(TACInstr):
 
 # Annotation (used for debugging).
 class Memo(TACInstr):
+    __slots__ = ("msg",)
+
     def __init__(self, msg: str) -> None:
-        super().__init__(InstrKind.SEQ, [], [], None)
+        super().__init__(InstrKind.SEQ, (), (), None)
         self.msg = msg
 
     def __str__(self) -> str:
@@ -262,8 +316,10 @@ class Memo(TACInstr):
 
 # Label (function entry or branching target).
 class Mark(TACInstr):
+    __slots__ = ()
+
     def __init__(self, label: Label) -> None:
-        super().__init__(InstrKind.LABEL, [], [], label)
+        super().__init__(InstrKind.LABEL, (), (), label)
 
     def __str__(self) -> str:
         return "%s:" % str(self.label)
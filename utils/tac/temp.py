@@ -1,5 +1,8 @@
 # Temporary variables.
+# Temps are interned per function (see `TACFunc.temps`), so a temp is created only once.
 class Temp:
+    __slots__ = ("index",)
+
     def __init__(self, index: int) -> None:
         self.index = index
 